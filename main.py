@@ -2,11 +2,17 @@
 """Main entry point for the Korean Law Search application."""
 import sys
 from src.infrastructure.container import Container
+from src.data.cache.migration import migrate_cache
 
 
 def main():
     """Main application entry point."""
-    container = Container()
+    with Container() as container:
+        run(container)
+
+
+def run(container: Container):
+    """Dispatch command line arguments to the CLI controller."""
     controller = container.cli_controller
     
     # Parse command line arguments
@@ -17,6 +23,38 @@ def main():
             # Get full text mode
             mst = sys.argv[2]
             controller.get_full_text(mst)
+        elif command == 'prefetch' and len(sys.argv) > 2:
+            # Bulk cache warm-up mode
+            options = parse_options(sys.argv[3:])
+            workers = positive_int_option(options, 'workers', 4, "python main.py prefetch <목록 파일> --workers N")
+            controller.run_prefetch(
+                sys.argv[2],
+                abbreviations_file=options.get('abbreviations'),
+                workers=workers,
+                include_delegated='no-delegated' not in options,
+                restart='restart' in options
+            )
+            print_load_stats(container)
+        elif command == 'grep' and len(sys.argv) > 2:
+            # Keyword search across every cached law
+            args = sys.argv[2:]
+            split = next((i for i, arg in enumerate(args) if arg.startswith('--')), len(args))
+            options = parse_options(args[split:])
+            limit = positive_int_option(options, 'limit', 5, "python main.py grep <검색어> --limit N")
+            controller.run_corpus_search(
+                ' '.join(args[:split]),
+                max_hits_per_law=limit
+            )
+        elif command == 'delegation-tree' and len(sys.argv) > 2:
+            # Export resolved delegations of every article as JSONL
+            options = parse_options(sys.argv[3:])
+            controller.run_delegation_tree_export(sys.argv[2], output_path=options.get('output'))
+        elif command == 'migrate-cache':
+            # Import file-per-key caches into the SQLite cache
+            run_migrate_cache(container)
+        elif command == 'dedupe-cache':
+            # Merge duplicate full-text/article-list cache entries
+            run_dedupe_cache(container)
         elif command == 'articles' and len(sys.argv) > 2:
             # View articles mode
             mst = sys.argv[2]
@@ -31,5 +69,67 @@ def main():
         controller.run_interactive_search()
 
 
+
+def run_migrate_cache(container: Container):
+    """Import existing cache files into the SQLite cache database."""
+    target = container.sqlite_cache_backend
+    total = 0
+    for source in container.file_cache_backends():
+        migrated = migrate_cache(source, target)
+        print(f"{source.cache_dir}: {migrated}개 캐시 항목을 가져왔습니다.")
+        total += migrated
+    print(f"\n총 {total}개 항목 → {container.settings.cache_db_path}")
+    if container.settings.cache_backend != 'sqlite':
+        print("SQLite 캐시를 사용하려면 LAW_CACHE_BACKEND=sqlite 로 설정하세요.")
+
+
+def run_dedupe_cache(container: Container):
+    """Merge duplicate raw law responses into one cache entry per MST."""
+    result = container.repository.merge_duplicate_law_caches()
+    reclaimed_mb = result['bytes_reclaimed'] / (1024 * 1024)
+    print(f"{result['laws']}개 법령 캐시 병합, {result['entries_removed']}개 중복 항목 삭제")
+    print(f"확보한 용량: {reclaimed_mb:.2f} MB ({result['bytes_reclaimed']} bytes)")
+
+
+def print_load_stats(container: Container):
+    """Show how many law loads were served from memory or shared between workers."""
+    stats = container.load_stats()
+    if 'memory_cache' in stats:
+        memory = stats['memory_cache']
+        print(f"\n메모리 캐시: {memory['hits']}회 적중, {memory['misses']}회 실패 ({memory['hit_rate']:.0%})")
+    for key, label in (('law_content', '법령 본문'), ('delegated_laws', '위임법령')):
+        if key in stats:
+            flight = stats[key]
+            print(f"{label} 로드: {flight['executed']}회 실행, {flight['coalesced']}회 병합")
+
+
+def parse_options(args: list) -> dict:
+    """Parse '--name value' and '--flag' style options."""
+    options = {}
+    i = 0
+    while i < len(args):
+        name = args[i].lstrip('-')
+        if i + 1 < len(args) and not args[i + 1].startswith('--'):
+            options[name] = args[i + 1]
+            i += 2
+        else:
+            options[name] = True
+            i += 1
+    return options
+
+
+def positive_int_option(options: dict, name: str, default: int, usage: str) -> int:
+    """Read a positive integer option, exiting with a usage error if it is not one."""
+    value = options.get(name, default)
+    if isinstance(value, str) and value.isdigit() and int(value) > 0:
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    shown = '값 없음' if value is True else repr(value)
+    print(f"오류: --{name} 옵션에는 1 이상의 정수가 필요합니다 ({shown})", file=sys.stderr)
+    print(f"사용법: {usage}", file=sys.stderr)
+    sys.exit(2)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""Asyncio API client for Korean Law Search API."""
+import asyncio
+import json
+from typing import Dict, Any, Optional
+
+import aiohttp
+
+from .law_api_client import LawAPIClient
+
+
+class AsyncLawAPIClient:
+    """Asyncio client for Korean Law Search API.
+    
+    Mirrors ``LawAPIClient`` (same operations, same response dicts) so the
+    results can be fed to ``LawContent.from_api_response`` and
+    ``DelegatedLawResponse.from_api_response`` unchanged. Concurrency is
+    bounded globally by a semaphore and per host by the connector.
+    """
+    
+    BASE_SEARCH_URL = LawAPIClient.BASE_SEARCH_URL
+    BASE_SERVICE_URL = LawAPIClient.BASE_SERVICE_URL
+    
+    def __init__(self, email_id: str, max_concurrency: int = 20, per_host_limit: int = 8,
+                 connect_timeout: float = 5.0, read_timeout: float = 30.0):
+        """Initialize the client.
+        
+        Args:
+            email_id: API user ID (OC parameter)
+            max_concurrency: Maximum number of requests in flight overall
+            per_host_limit: Maximum number of connections per host
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for the response body
+        """
+        self.email_id = email_id
+        self.max_retries = 3
+        self.retry_delay = 1.0  # seconds
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it inside the running loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.per_host_limit
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self._session
+    
+    async def _get_json(self, url: str, params: Dict[str, str], format_type: str) -> Dict[str, Any]:
+        """Send a GET request and decode the JSON body.
+        
+        Raises:
+            aiohttp.ClientError: On connection failures
+            asyncio.TimeoutError: When the request times out
+        """
+        session = self._get_session()
+        async with self._semaphore:
+            async with session.get(url, params=params) as response:
+                if response.status == 200 and format_type == 'JSON':
+                    # law.go.kr does not always send a JSON content type
+                    return json.loads(await response.text(encoding='utf-8'))
+                
+                return {'error': f'HTTP {response.status}'}
+    
+    async def search(self, query: str, display: int = 20, format_type: str = 'JSON') -> Dict[str, Any]:
+        """Search for laws using the API."""
+        params = {
+            'OC': self.email_id,
+            'target': 'law',
+            'type': format_type,
+            'query': query,
+            'display': str(display),
+            'sort': 'lawNm'
+        }
+        
+        try:
+            return await self._get_json(self.BASE_SEARCH_URL, params, format_type)
+        except Exception as e:
+            return {'error': str(e) or type(e).__name__}
+    
+    async def get_full_text(self, mst: str, jo: Optional[str] = None, format_type: str = 'JSON') -> Dict[str, Any]:
+        """Get full text of a law using MST.
+        
+        Args:
+            mst: Law master number (법령 마스터 번호)
+            jo: Article number (조번호) - Optional, 6-digit format
+            format_type: Output format (JSON/XML/HTML)
+        """
+        params = {
+            'OC': self.email_id,
+            'target': 'law',
+            'type': format_type,
+            'MST': mst
+        }
+        
+        if jo:  # Add article number if specified
+            params['JO'] = jo
+        
+        try:
+            return await self._get_json(self.BASE_SERVICE_URL, params, format_type)
+        except Exception as e:
+            return {'error': str(e) or type(e).__name__}
+    
+    async def get_delegated_laws(self, mst: str, format_type: str = 'JSON') -> Dict[str, Any]:
+        """Get delegated laws for a given law using MST.
+        
+        Args:
+            mst: Law master number (법령 마스터 번호)
+            format_type: Output format (JSON/XML)
+        
+        Returns:
+            Dictionary containing delegated law information
+        """
+        params = {
+            'OC': self.email_id,
+            'target': 'lsDelegated',
+            'type': format_type,
+            'MST': mst
+        }
+        
+        last_error = None
+        for attempt in range(self.max_retries):
+            try:
+                result = await self._get_json(self.BASE_SERVICE_URL, params, format_type)
+                if 'error' not in result:
+                    return result
+                last_error = result['error']
+            except Exception as e:
+                last_error = str(e) or type(e).__name__
+            
+            if attempt < self.max_retries - 1:
+                await asyncio.sleep(self.retry_delay)
+                print(f"Retry {attempt + 1}/{self.max_retries} for delegated laws API...")
+        
+        return {'error': last_error}
+    
+    async def close(self) -> None:
+        """Close the session and all pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self) -> 'AsyncLawAPIClient':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
\ No newline at end of file
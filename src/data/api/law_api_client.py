@@ -1,19 +1,61 @@
 """API client for Korean Law Search API."""
+import threading
 import requests
-from typing import Dict, Any, Optional, List
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Iterator, Optional
 import time
 
 
 class LawAPIClient:
-    """Client for Korean Law Search API."""
+    """Client for Korean Law Search API.
+    
+    All requests go through a single ``requests.Session`` so TCP connections
+    to law.go.kr are pooled and kept alive between calls. Call ``close()``
+    (or use the client as a context manager) to release the pool.
+    """
     
     BASE_SEARCH_URL = "http://www.law.go.kr/DRF/lawSearch.do"
     BASE_SERVICE_URL = "http://www.law.go.kr/DRF/lawService.do"
     
-    def __init__(self, email_id: str):
+    def __init__(self, email_id: str, pool_connections: int = 4, pool_maxsize: int = 10,
+                 keep_alive: bool = True, connect_timeout: float = 5.0, read_timeout: float = 30.0):
+        """Initialize the client.
+        
+        Args:
+            email_id: API user ID (OC parameter)
+            pool_connections: Number of per-host pools to keep
+            pool_maxsize: Maximum connections kept alive per host
+            keep_alive: Reuse connections between requests
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for the response body
+        """
         self.email_id = email_id
         self.max_retries = 3
         self.retry_delay = 1.0  # seconds
+        self.timeout = (connect_timeout, read_timeout)
+        self.keep_alive = keep_alive
+        self.session = self._create_session(pool_connections, pool_maxsize, keep_alive)
+        self._request_count = 0
+        self._stats_lock = threading.Lock()
+    
+    @staticmethod
+    def _create_session(pool_connections: int, pool_maxsize: int, keep_alive: bool) -> requests.Session:
+        """Create a session with a sized connection pool."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+    
+    def _get(self, url: str, params: Dict[str, str], stream: bool = False) -> requests.Response:
+        """Send a GET request through the pooled session."""
+        with self._stats_lock:
+            self._request_count += 1
+        response = self.session.get(url, params=params, timeout=self.timeout, stream=stream)
+        response.encoding = 'utf-8'
+        return response
     
     def search(self, query: str, display: int = 20, format_type: str = 'JSON') -> Dict[str, Any]:
         """Search for laws using the API."""
@@ -27,8 +69,7 @@ class LawAPIClient:
         }
         
         try:
-            response = requests.get(self.BASE_SEARCH_URL, params=params)
-            response.encoding = 'utf-8'
+            response = self._get(self.BASE_SEARCH_URL, params)
             
             if response.status_code == 200 and format_type == 'JSON':
                 return response.json()
@@ -37,43 +78,6 @@ class LawAPIClient:
         except Exception as e:
             return {'error': str(e)}
     
-    def get_delegated_laws(self, mst: str, format_type: str = 'JSON') -> Dict[str, Any]:
-        """Get delegated laws for a given law using MST.
-        
-        Args:
-            mst: Law master number (법령 마스터 번호)
-            format_type: Output format (JSON/XML)
-            
-        Returns:
-            Dictionary containing delegated law information
-        """
-        params = {
-            'OC': self.email_id,
-            'target': 'lsDelegated',
-            'type': format_type,
-            'MST': mst
-        }
-        
-        last_error = None
-        for attempt in range(self.max_retries):
-            try:
-                response = requests.get(self.BASE_SERVICE_URL, params=params)
-                response.encoding = 'utf-8'
-                
-                if response.status_code == 200 and format_type == 'JSON':
-                    return response.json()
-                
-                last_error = f'HTTP {response.status_code}'
-                
-            except Exception as e:
-                last_error = str(e)
-                
-            if attempt < self.max_retries - 1:
-                time.sleep(self.retry_delay)
-                print(f"Retry {attempt + 1}/{self.max_retries} for delegated laws API...")
-        
-        return {'error': last_error}
-    
     def get_full_text(self, mst: str, jo: Optional[str] = None, format_type: str = 'JSON') -> Dict[str, Any]:
         """Get full text of a law using MST.
         
@@ -93,8 +97,7 @@ class LawAPIClient:
             params['JO'] = jo
         
         try:
-            response = requests.get(self.BASE_SERVICE_URL, params=params)
-            response.encoding = 'utf-8'
+            response = self._get(self.BASE_SERVICE_URL, params)
             
             if response.status_code == 200 and format_type == 'JSON':
                 return response.json()
@@ -103,13 +106,53 @@ class LawAPIClient:
         except Exception as e:
             return {'error': str(e)}
     
+    def stream_full_text(self, mst: str, chunk_size: int = 64 * 1024) -> Optional[Iterator[bytes]]:
+        """Get the JSON full text of a law as raw body chunks.
+        
+        Unlike get_full_text the body is never decoded as a whole, so large
+        laws can be parsed incrementally (see StreamingJSONParser).
+        
+        Args:
+            mst: Law master number (법령 마스터 번호)
+            chunk_size: Bytes per chunk
+        
+        Returns:
+            Iterator over the body chunks, or None if the request failed
+        """
+        params = {
+            'OC': self.email_id,
+            'target': 'law',
+            'type': 'JSON',
+            'MST': mst
+        }
+        
+        try:
+            response = self._get(self.BASE_SERVICE_URL, params, stream=True)
+        except Exception:
+            return None
+        
+        if response.status_code != 200:
+            response.close()
+            return None
+        return self._iter_body(response, chunk_size)
+    
+    @staticmethod
+    def _iter_body(response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+        """Yield the body chunks and release the connection afterwards."""
+        try:
+            for chunk in response.iter_content(chunk_size):
+                if chunk:
+                    yield chunk
+        finally:
+            response.close()
+    
     def get_delegated_laws(self, mst: str, format_type: str = 'JSON') -> Dict[str, Any]:
         """Get delegated laws for a given law using MST.
         
         Args:
             mst: Law master number (법령 마스터 번호)
             format_type: Output format (JSON/XML)
-            
+        
         Returns:
             Dictionary containing delegated law information
         """
@@ -123,19 +166,65 @@ class LawAPIClient:
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(self.BASE_SERVICE_URL, params=params)
-                response.encoding = 'utf-8'
+                response = self._get(self.BASE_SERVICE_URL, params)
                 
                 if response.status_code == 200 and format_type == 'JSON':
                     return response.json()
                 
                 last_error = f'HTTP {response.status_code}'
-                
+            
             except Exception as e:
                 last_error = str(e)
-                
+            
             if attempt < self.max_retries - 1:
                 time.sleep(self.retry_delay)
                 print(f"Retry {attempt + 1}/{self.max_retries} for delegated laws API...")
         
-        return {'error': last_error}
\ No newline at end of file
+        return {'error': last_error}
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics.
+        
+        Returns:
+            Dictionary with the total number of requests sent, connections
+            opened and reused, and a per-host breakdown. ``connections_reused``
+            close to ``requests`` means keep-alive is working.
+        """
+        hosts = {}
+        connections_opened = 0
+        
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                host = f"{pool.host}:{pool.port}"
+                # The pool queue is pre-filled with None placeholders
+                idle = sum(1 for conn in list(pool.pool.queue) if conn) if pool.pool is not None else 0
+                hosts[host] = {
+                    'requests': pool.num_requests,
+                    'connections_opened': pool.num_connections,
+                    'idle_connections': idle
+                }
+                connections_opened += pool.num_connections
+        
+        with self._stats_lock:
+            request_count = self._request_count
+        
+        return {
+            'requests': request_count,
+            'connections_opened': connections_opened,
+            'connections_reused': max(0, request_count - connections_opened),
+            'hosts': hosts
+        }
+    
+    def close(self) -> None:
+        """Close the session and all pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> 'LawAPIClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
\ No newline at end of file
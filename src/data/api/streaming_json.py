@@ -0,0 +1,199 @@
+"""Incremental JSON parser for large API response bodies."""
+import codecs
+import json
+from json.decoder import scanstring
+from typing import List, Optional, Tuple
+
+
+class StreamingJSONParser:
+    """Push parser that streams the elements of one array inside a JSON object.
+    
+    Only the objects along ``target_path`` are parsed incrementally; every
+    element of the array at the end of the path is decoded on its own and
+    emitted as soon as it is complete. Any other value met on the way
+    (e.g. 법령.기본정보 next to 법령.조문) is decoded whole and emitted too,
+    so the caller decides what to keep. The full document is never held
+    as one string or one dict tree.
+    
+    Events are ``(kind, path, value)`` tuples: ``('item', target_path,
+    element)`` for each array element (or for the value itself when the
+    target is not an array) and ``('value', path, value)`` for the rest.
+    
+    Example:
+        parser = StreamingJSONParser(('법령', '조문', '조문단위'))
+        for chunk in chunks:
+            for kind, path, value in parser.feed(chunk):
+                ...
+        events = parser.close()
+    """
+    
+    _WHITESPACE = ' \t\r\n'
+    
+    def __init__(self, target_path: Tuple[str, ...]):
+        self.target_path = tuple(target_path)
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._json = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        # Open containers: [kind ('object'/'array'), path, expecting ('first'/'member'/'next')]
+        self._stack: List[list] = []
+        self._done = False
+        # Unconsumed length at the last incomplete value; retry once it has doubled
+        self._retry_at = 0
+    
+    def feed(self, chunk: bytes) -> List[Tuple]:
+        """Parse the next chunk of the body.
+        
+        Returns:
+            Events completed by this chunk
+        
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        self._buf += self._decoder.decode(chunk)
+        if len(self._buf) - self._pos < self._retry_at:
+            return []
+        return self._parse(final=False)
+    
+    def close(self) -> List[Tuple]:
+        """Finish parsing after the last chunk.
+        
+        Raises:
+            ValueError: If the body is truncated or not valid JSON
+        """
+        self._buf += self._decoder.decode(b'', final=True)
+        events = self._parse(final=True)
+        if not self._done or self._buf[self._pos:].strip(self._WHITESPACE):
+            raise ValueError("Truncated or malformed JSON response")
+        return events
+    
+    def _parse(self, final: bool) -> List[Tuple]:
+        events = []
+        try:
+            while self._step(events, final):
+                pass
+        finally:
+            # Drop what has been consumed
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        return events
+    
+    def _skip_whitespace(self) -> Optional[str]:
+        """Advance past whitespace and return the next character (None at the end)."""
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and buf[pos] in self._WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buf[pos] if pos < len(buf) else None
+    
+    def _step(self, events: List[Tuple], final: bool) -> bool:
+        """Consume one token or value. Returns False when more input is needed."""
+        ch = self._skip_whitespace()
+        if ch is None:
+            return False
+        
+        if not self._stack:
+            if self._done:
+                raise ValueError(f"Unexpected data after JSON document at {self._pos}")
+            if ch != '{':
+                raise ValueError("Expected a JSON object")
+            self._stack.append(['object', (), 'first'])
+            self._pos += 1
+            return True
+        
+        frame = self._stack[-1]
+        kind, path, expecting = frame
+        closer = '}' if kind == 'object' else ']'
+        
+        if ch == closer:
+            self._stack.pop()
+            self._pos += 1
+            if self._stack:
+                self._stack[-1][2] = 'next'
+            else:
+                self._done = True
+            return True
+        
+        if expecting == 'next':
+            if ch != ',':
+                raise ValueError(f"Expected ',' or '{closer}' at {self._pos}")
+            self._pos += 1
+            frame[2] = 'member'
+            return True
+        
+        if kind == 'array':
+            value, end = self._decode_value(self._pos, final)
+            if end is None:
+                return False
+            events.append(('item', path, value))
+            self._pos = end
+            frame[2] = 'next'
+            return True
+        
+        # Object member: "key": value
+        if ch != '"':
+            raise ValueError(f"Expected an object key at {self._pos}")
+        key, value_start = self._read_key(final)
+        if key is None:
+            return False
+        child_path = path + (key,)
+        opener = self._buf[value_start]
+        
+        if child_path == self.target_path[:len(child_path)]:
+            if len(child_path) < len(self.target_path) and opener == '{':
+                frame[2] = 'next'
+                self._stack.append(['object', child_path, 'first'])
+                self._pos = value_start + 1
+                return True
+            if child_path == self.target_path and opener == '[':
+                frame[2] = 'next'
+                self._stack.append(['array', child_path, 'first'])
+                self._pos = value_start + 1
+                return True
+        
+        value, end = self._decode_value(value_start, final)
+        if end is None:
+            return False
+        events.append(('item' if child_path == self.target_path else 'value', child_path, value))
+        self._pos = end
+        frame[2] = 'next'
+        return True
+    
+    def _read_key(self, final: bool) -> Tuple[Optional[str], int]:
+        """Read '"key" :' and return (key, start of the value), or (None, 0) if incomplete."""
+        buf = self._buf
+        try:
+            key, pos = scanstring(buf, self._pos + 1)
+        except ValueError:
+            if final:
+                raise
+            return None, 0
+        while pos < len(buf) and buf[pos] in self._WHITESPACE:
+            pos += 1
+        if pos >= len(buf):
+            return None, 0
+        if buf[pos] != ':':
+            raise ValueError(f"Expected ':' at {pos}")
+        pos += 1
+        while pos < len(buf) and buf[pos] in self._WHITESPACE:
+            pos += 1
+        if pos >= len(buf):
+            return None, 0
+        return key, pos
+    
+    def _decode_value(self, start: int, final: bool) -> Tuple[object, Optional[int]]:
+        """Decode one complete value, or return (None, None) until it has arrived."""
+        try:
+            value, end = self._json.raw_decode(self._buf, start)
+        except ValueError:
+            if final:
+                raise
+            self._retry_at = 2 * (len(self._buf) - self._pos)
+            return None, None
+        
+        # A number at the very end may still be missing digits
+        if not final and end == len(self._buf) and isinstance(value, (int, float)):
+            self._retry_at = 0
+            return None, None
+        self._retry_at = 0
+        return value, end
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""Cache backend interface shared by the repositories."""
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+
+
+@dataclass
+class CacheEntry:
+    """Metadata of a single cache entry."""
+    
+    key: str
+    cache_type: str
+    created_at: float  # Unix timestamp
+    size: int  # Stored size in bytes
+
+
+class JSONCacheWriter:
+    """Writes one already-encoded JSON entry chunk by chunk.
+    
+    Chunks go through the serializer's json_bytes_writer into ``file`` as
+    they are written, so the payload is never held in memory as a whole.
+    ``commit`` hands the finished file to the backend and ``discard`` drops
+    it; the file is closed either way.
+    """
+    
+    def __init__(self, file: BinaryIO, serializer, on_commit: Callable[[BinaryIO], None],
+                 on_discard: Optional[Callable[[], None]] = None):
+        self._file = file
+        self._stream = serializer.json_bytes_writer(file)
+        self._on_commit = on_commit
+        self._on_discard = on_discard
+    
+    def write(self, chunk: bytes) -> None:
+        self._stream.write(chunk)
+    
+    def commit(self) -> None:
+        """Finish the entry and store it."""
+        try:
+            if self._stream is not self._file:
+                self._stream.close()  # Flush the compressor, leaving the file open
+            self._file.flush()
+            self._on_commit(self._file)
+        finally:
+            self._file.close()
+    
+    def discard(self) -> None:
+        """Drop the partial entry."""
+        try:
+            if self._stream is not self._file:
+                self._stream.close()
+        finally:
+            self._file.close()
+        if self._on_discard is not None:
+            self._on_discard()
+
+
+class CacheBackend(ABC):
+    """Interface for key/value cache storage.
+    
+    Entries are addressed by ``(cache_type, key)`` and hold JSON-compatible
+    data encoded by the backend's ``CacheSerializer``. Freshness is checked
+    by the caller through ``max_age_seconds``.
+    """
+    
+    @abstractmethod
+    def get(self, key: str, cache_type: str, max_age_seconds: Optional[float] = None) -> Optional[Any]:
+        """Load an entry, or None if missing, unreadable or older than max_age_seconds."""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def set(self, key: str, cache_type: str, data: Any, created_at: Optional[float] = None) -> None:
+        """Store an entry, replacing any existing one.
+        
+        Args:
+            key: Cache key
+            cache_type: Kind of data (search, law_content, ...)
+            data: JSON-compatible data
+            created_at: Timestamp to record (defaults to now)
+        """
+        raise NotImplementedError
+    
+    @abstractmethod
+    def set_bytes(self, key: str, cache_type: str, payload: bytes, created_at: Optional[float] = None) -> None:
+        """Store an entry that is already encoded (e.g. a raw API response body)."""
+        raise NotImplementedError
+    
+    def set_json_bytes(self, key: str, cache_type: str, payload: bytes, created_at: Optional[float] = None) -> None:
+        """Store a JSON document that is already encoded, in the backend's cache format.
+        
+        Backends keep their ``CacheSerializer`` in ``self.serializer``.
+        """
+        self.set_bytes(key, cache_type, self.serializer.wrap_json_bytes(payload), created_at)
+    
+    def open_json_writer(self, key: str, cache_type: str, created_at: Optional[float] = None) -> JSONCacheWriter:
+        """Start storing a JSON document that arrives already encoded, in chunks.
+        
+        The streaming form of set_json_bytes. By default the chunks are
+        spooled to a temporary file and stored through set_file on commit.
+        """
+        return JSONCacheWriter(tempfile.TemporaryFile(), self.serializer,
+                               lambda file: self.set_file(key, cache_type, file, created_at))
+    
+    def set_file(self, key: str, cache_type: str, file: BinaryIO, created_at: Optional[float] = None) -> None:
+        """Store an already-encoded entry read from a file.
+        
+        Backends that can copy the file in pieces override this; the
+        default reads it whole and calls set_bytes.
+        """
+        file.seek(0)
+        self.set_bytes(key, cache_type, file.read(), created_at)
+    
+    @abstractmethod
+    def delete(self, key: str, cache_type: str) -> bool:
+        """Delete an entry. Returns True if it existed."""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def get_entry(self, key: str, cache_type: str) -> Optional[CacheEntry]:
+        """Get entry metadata without loading the data."""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def entries(self, cache_type: Optional[str] = None) -> List[CacheEntry]:
+        """List entry metadata, optionally limited to one cache type."""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def clear_older_than(self, max_age_seconds: float, cache_type: Optional[str] = None) -> int:
+        """Delete entries older than max_age_seconds. Returns the number deleted."""
+        raise NotImplementedError
+    
+    def stats(self) -> Dict[str, Any]:
+        """Summarize the cache: entry count, total size, oldest and newest timestamps."""
+        entries = self.entries()
+        return {
+            'entries': len(entries),
+            'size': sum(entry.size for entry in entries),
+            'oldest': min((entry.created_at for entry in entries), default=None),
+            'newest': max((entry.created_at for entry in entries), default=None)
+        }
+    
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+        pass
\ No newline at end of file
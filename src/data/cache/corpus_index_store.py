@@ -0,0 +1,161 @@
+"""Memory-mapped n-gram index spanning every cached law."""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ...domain.search.ngram_index import NgramIndex
+
+
+class CorpusIndexFile:
+    """Read-only view of a corpus index file.
+    
+    Layout: header (magic, n, gram count, metadata length), JSON metadata
+    listing the indexed laws, a table of n-grams sorted by code point
+    (each with the offset and length of its posting list), then the posting
+    lists as little-endian uint32 document ids. Documents are numbered law
+    by law in metadata order, so a document id maps back to (MST, article
+    position) with a bisect over the laws' first ids.
+    
+    Lookups binary search the mapped n-gram table and only read the posting
+    lists of the query's n-grams, so opening and querying the index costs
+    the same regardless of the corpus size.
+    """
+    
+    MAGIC = b'LAWCIX01'
+    HEADER = struct.Struct('<8sIII')
+    
+    def __init__(self, path: str):
+        """Map an index file.
+        
+        Raises:
+            OSError: If the file cannot be opened or mapped
+            ValueError: If the file is not a corpus index
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            magic, self.n, self.gram_count, meta_length = self.HEADER.unpack_from(self._mmap, 0)
+            meta_start = self.HEADER.size
+            meta = json.loads(self._mmap[meta_start:meta_start + meta_length].decode('utf-8'))
+        except (struct.error, ValueError):
+            magic = None
+        if magic != self.MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a corpus index: {path}")
+        
+        # [mst, law_name, created_at, article_count] per law
+        self.laws: List[list] = meta['laws']
+        self._doc_offsets = []
+        total = 0
+        for law in self.laws:
+            self._doc_offsets.append(total)
+            total += law[3]
+        
+        self._entry = self._entry_struct(self.n)
+        self._table_offset = self.HEADER.size + meta_length
+        self._postings_offset = self._table_offset + self.gram_count * self._entry.size
+    
+    @staticmethod
+    def _entry_struct(n: int) -> struct.Struct:
+        # n code points, posting offset (in ids), posting length
+        return struct.Struct(f'<{n}IQI')
+    
+    def law_versions(self) -> Dict[str, float]:
+        """Snapshot timestamp of every indexed law by MST."""
+        return {law[0]: law[2] for law in self.laws}
+    
+    def _posting(self, gram: str) -> Optional[array]:
+        """Binary search the n-gram table and read the gram's posting list."""
+        if len(gram) != self.n:
+            return None
+        key = tuple(ord(c) for c in gram)
+        n = self.n
+        lo, hi = 0, self.gram_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = self._entry.unpack_from(self._mmap, self._table_offset + mid * self._entry.size)
+            probe = entry[:n]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                start = self._postings_offset + entry[n] * 4
+                posting = array('I', self._mmap[start:start + entry[n + 1] * 4])
+                if sys.byteorder != 'little':
+                    posting.byteswap()
+                return posting
+        return None
+    
+    def candidates(self, grams: Set[str]) -> Dict[str, List[int]]:
+        """Article positions by MST whose documents contain every n-gram."""
+        postings = []
+        for gram in grams:
+            posting = self._posting(gram)
+            if not posting:
+                return {}
+            postings.append(posting)
+        if not postings:
+            return {}
+        
+        postings.sort(key=len)
+        doc_ids = set(postings[0])
+        for posting in postings[1:]:
+            doc_ids.intersection_update(posting)
+            if not doc_ids:
+                return {}
+        
+        result = {}
+        for doc_id in sorted(doc_ids):
+            law_index = bisect_right(self._doc_offsets, doc_id) - 1
+            result.setdefault(self.laws[law_index][0], []).append(doc_id - self._doc_offsets[law_index])
+        return result
+    
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mmap.close()
+    
+    @classmethod
+    def write(cls, path: str, laws: Iterable[Tuple[str, str, float, NgramIndex]], n: int = 2) -> None:
+        """Merge per-law indexes into a corpus index file, atomically.
+        
+        Args:
+            path: Destination file
+            laws: (MST, law name, snapshot timestamp, NgramIndex) per law
+            n: N-gram length; indexes built with another length are skipped
+        """
+        meta_laws = []
+        merged: Dict[str, array] = {}
+        doc_offset = 0
+        for mst, law_name, created_at, index in laws:
+            if index.n != n:
+                continue
+            for gram, posting in index.postings.items():
+                merged.setdefault(gram, array('I')).extend(doc_id + doc_offset for doc_id in posting)
+            meta_laws.append([mst, law_name, created_at, index.size])
+            doc_offset += index.size
+        
+        meta = json.dumps({'laws': meta_laws}, ensure_ascii=False).encode('utf-8')
+        grams = sorted(gram for gram in merged if len(gram) == n)
+        entry = cls._entry_struct(n)
+        
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, n, len(grams), len(meta)))
+            f.write(meta)
+            offset = 0
+            for gram in grams:
+                f.write(entry.pack(*(ord(c) for c in gram), offset, len(merged[gram])))
+                offset += len(merged[gram])
+            for gram in grams:
+                posting = merged[gram]
+                if sys.byteorder != 'little':
+                    posting.byteswap()
+                f.write(posting.tobytes())
+        os.replace(tmp_path, path)
\ No newline at end of file
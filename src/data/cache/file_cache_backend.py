@@ -0,0 +1,153 @@
+"""Cache backend storing one file per key."""
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache_backend import CacheBackend, CacheEntry, JSONCacheWriter
+from .serializers import CacheSerializer
+
+
+class FileCacheBackend(CacheBackend):
+    """Cache backend storing one file per entry.
+    
+    File names come from ``filename_patterns`` (cache type -> pattern with a
+    ``{key}`` placeholder); unknown types use ``{cache_type}_{key}.json``.
+    The file modification time is the entry's creation time. The file body
+    is written by ``serializer`` (pretty-printed JSON unless configured
+    otherwise) and any supported format is read back.
+    """
+    
+    def __init__(self, cache_dir: str, filename_patterns: Optional[Dict[str, str]] = None,
+                 serializer: Optional[CacheSerializer] = None):
+        self.cache_dir = cache_dir
+        self.filename_patterns = dict(filename_patterns or {})
+        self.serializer = serializer or CacheSerializer('json-pretty')
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _get_path(self, key: str, cache_type: str) -> str:
+        """Get the file path of an entry."""
+        pattern = self.filename_patterns.get(cache_type, f"{cache_type}_{{key}}.json")
+        return os.path.join(self.cache_dir, pattern.format(key=key))
+    
+    def _parse_filename(self, filename: str) -> Optional[Tuple[str, str]]:
+        """Map a file name back to (cache_type, key)."""
+        # Longest prefix first so 'full-text_' wins over shorter overlapping prefixes
+        patterns = sorted(self.filename_patterns.items(), key=lambda item: -len(item[1]))
+        for cache_type, pattern in patterns:
+            prefix, _, suffix = pattern.partition('{key}')
+            if filename.startswith(prefix) and filename.endswith(suffix) \
+                    and len(filename) > len(prefix) + len(suffix):
+                return cache_type, filename[len(prefix):len(filename) - len(suffix)]
+        
+        if filename.endswith('.json') and '_' in filename:
+            cache_type, _, key = filename[:-len('.json')].partition('_')
+            return cache_type, key
+        return None
+    
+    def get(self, key: str, cache_type: str, max_age_seconds: Optional[float] = None) -> Optional[Any]:
+        """Load an entry if it exists and is fresh enough."""
+        path = self._get_path(key, cache_type)
+        try:
+            if max_age_seconds is not None and time.time() - os.path.getmtime(path) >= max_age_seconds:
+                return None
+            with open(path, 'rb') as f:
+                return self.serializer.loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def set(self, key: str, cache_type: str, data: Any, created_at: Optional[float] = None) -> None:
+        """Write an entry to its file."""
+        try:
+            self.set_bytes(key, cache_type, self.serializer.dumps(data), created_at)
+        except (TypeError, ValueError):
+            pass
+    
+    def set_bytes(self, key: str, cache_type: str, payload: bytes, created_at: Optional[float] = None) -> None:
+        """Write an already-encoded entry.
+        
+        The file is written under a temporary name and renamed into place
+        so concurrent readers never see a partial entry.
+        """
+        path = self._get_path(key, cache_type)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            if created_at is not None:
+                os.utime(tmp_path, (created_at, created_at))
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def open_json_writer(self, key: str, cache_type: str, created_at: Optional[float] = None) -> JSONCacheWriter:
+        """Write a chunked JSON entry straight to a temporary file renamed into place on commit."""
+        path = self._get_path(key, cache_type)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        
+        def discard() -> None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        
+        def commit(file) -> None:
+            file.close()
+            try:
+                if created_at is not None:
+                    os.utime(tmp_path, (created_at, created_at))
+                os.replace(tmp_path, path)
+            except OSError:
+                discard()
+        
+        return JSONCacheWriter(open(tmp_path, 'wb'), self.serializer, commit, discard)
+    
+    def delete(self, key: str, cache_type: str) -> bool:
+        """Delete an entry file."""
+        try:
+            os.remove(self._get_path(key, cache_type))
+            return True
+        except OSError:
+            return False
+    
+    def get_entry(self, key: str, cache_type: str) -> Optional[CacheEntry]:
+        """Get entry metadata from the file's stat."""
+        try:
+            stat = os.stat(self._get_path(key, cache_type))
+        except OSError:
+            return None
+        return CacheEntry(key=key, cache_type=cache_type, created_at=stat.st_mtime, size=stat.st_size)
+    
+    def entries(self, cache_type: Optional[str] = None) -> List[CacheEntry]:
+        """List entries by scanning the cache directory."""
+        result = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for dir_entry in it:
+                    if not dir_entry.is_file():
+                        continue
+                    parsed = self._parse_filename(dir_entry.name)
+                    if parsed is None or (cache_type is not None and parsed[0] != cache_type):
+                        continue
+                    stat = dir_entry.stat()
+                    result.append(CacheEntry(
+                        key=parsed[1],
+                        cache_type=parsed[0],
+                        created_at=stat.st_mtime,
+                        size=stat.st_size
+                    ))
+        except OSError:
+            pass
+        return result
+    
+    def clear_older_than(self, max_age_seconds: float, cache_type: Optional[str] = None) -> int:
+        """Delete entry files older than max_age_seconds."""
+        cleared_count = 0
+        now = time.time()
+        for entry in self.entries(cache_type):
+            if now - entry.created_at > max_age_seconds and self.delete(entry.key, entry.cache_type):
+                cleared_count += 1
+        return cleared_count
\ No newline at end of file
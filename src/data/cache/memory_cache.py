@@ -0,0 +1,110 @@
+"""Process-local LRU cache."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with entry/size bounds and TTL.
+    
+    Entries are evicted least-recently-used first whenever the number of
+    entries exceeds ``max_entries`` or the approximate size reported by
+    ``sizeof`` exceeds ``max_bytes``. Expired entries count as misses.
+    """
+    
+    def __init__(self, max_entries: int = 32, max_bytes: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None, sizeof: Optional[Callable[[Any], int]] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sizeof = sizeof or (lambda value: 0)
+        self._entries = OrderedDict()  # key -> (value, size, expires_at)
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            value, _, expires_at = entry
+            if expires_at is not None and time.time() >= expires_at:
+                self._remove(key)
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a fresh entry exists, without counting a lookup or touching its recency."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (entry[2] is None or time.time() < entry[2])
+    
+    def put(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting old entries to stay within bounds.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Override the default TTL for this entry
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.time() + ttl if ttl is not None else None
+        size = self.sizeof(value)
+        
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return  # Would evict everything and still not fit
+            
+            self._entries[key] = (value, size, expires_at)
+            self._total_bytes += size
+            
+            while len(self._entries) > self.max_entries or \
+                    (self.max_bytes is not None and self._total_bytes > self.max_bytes):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+    
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop an entry. Returns True if it was cached."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                return True
+            return False
+    
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current usage."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+    
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry (caller holds the lock)."""
+        _, size, _ = self._entries.pop(key)
+        self._total_bytes -= size
\ No newline at end of file
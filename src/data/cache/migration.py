@@ -0,0 +1,28 @@
+"""Migration of cache entries between backends."""
+from typing import Optional
+
+from .cache_backend import CacheBackend
+
+
+def migrate_cache(source: CacheBackend, target: CacheBackend, cache_type: Optional[str] = None) -> int:
+    """Copy every entry from one backend to another.
+    
+    Creation times are preserved so the entries expire on the same
+    schedule as before. Unreadable entries are skipped.
+    
+    Args:
+        source: Backend to read from (e.g. the file-per-key cache)
+        target: Backend to write to (e.g. the SQLite cache)
+        cache_type: Only migrate this type if given
+    
+    Returns:
+        Number of entries migrated
+    """
+    migrated = 0
+    for entry in source.entries(cache_type):
+        data = source.get(entry.key, entry.cache_type)
+        if data is None:
+            continue
+        target.set(entry.key, entry.cache_type, data, created_at=entry.created_at)
+        migrated += 1
+    return migrated
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""Memory-mapped storage for article text."""
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ...domain.entities.article import Article
+
+
+class MappedArticleFile:
+    """Read-only view of one law's article store file.
+    
+    Layout: header (magic, source timestamp, article count), an offset
+    table of ``count + 1`` little-endian uint64 values, then the UTF-8
+    encoded article contents back to back.
+    """
+    
+    MAGIC = b'LAWART01'
+    HEADER = struct.Struct('<8sdI')
+    OFFSET = struct.Struct('<Q')
+    SPAN = struct.Struct('<QQ')
+    
+    def __init__(self, path: str):
+        """Map a store file.
+        
+        Raises:
+            OSError: If the file cannot be opened or mapped
+            ValueError: If the file is not an article store
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            magic, self.created_at, self.count = self.HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            magic = None
+        if magic != self.MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not an article store: {path}")
+        
+        self._table_offset = self.HEADER.size
+        self._data_offset = self.HEADER.size + (self.count + 1) * self.OFFSET.size
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __getitem__(self, index: int) -> str:
+        """Decode the content of the article at ``index``."""
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        start, end = self.SPAN.unpack_from(self._mmap, self._table_offset + index * self.OFFSET.size)
+        return self._mmap[self._data_offset + start:self._data_offset + end].decode('utf-8')
+    
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mmap.close()
+    
+    @classmethod
+    def write(cls, path: str, contents: Iterable[str], created_at: float) -> None:
+        """Write a store file atomically."""
+        blobs = [(content or '').encode('utf-8') for content in contents]
+        offsets = [0]
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+        
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, created_at, len(blobs)))
+            f.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp_path, path)
+
+
+class MappedArticle(Article):
+    """Article whose content is decoded from a mapped store on each access.
+    
+    Built from a snapshot row, whose derived fields (numbers, delegation
+    flags) are copied up front, so creating it never parses or scans the
+    text and only reading ``article_content`` touches the mapped pages.
+    """
+    
+    __slots__ = ('_contents', '_index', '_content')
+    
+    def __init__(self, row: tuple, contents: MappedArticleFile, index: int):
+        """Initialize the article.
+        
+        Args:
+            row: Article row in LawContent.SNAPSHOT_COLUMNS order
+            contents: Mapped store holding the article's content
+            index: Position of the article in the store
+        """
+        number, title, _, enforcement_date, formatted, normalized, has_delegation, types = row
+        self._contents = contents
+        self._index = index
+        self._content = None
+        super().__init__(
+            article_number=number,
+            article_title=title,
+            article_content=None,
+            enforcement_date=enforcement_date
+        )
+        self._formatted_number = formatted
+        self._normalized_number = normalized
+        self._has_delegation = has_delegation
+        self._delegation_types = types
+    
+    @property
+    def article_content(self) -> str:
+        if self._content is not None:
+            return self._content
+        return self._contents[self._index]
+    
+    @article_content.setter
+    def article_content(self, value: Optional[str]) -> None:
+        self._content = value
+
+
+class MmapArticleStore:
+    """Directory of per-law memory-mapped article stores.
+    
+    Every process that maps the same law shares its pages through the OS
+    page cache instead of holding its own copy of the text. A store file
+    is mapped once per version and stays mapped until close(), since the
+    MappedArticles of a law read from it for as long as they live.
+    """
+    
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        os.makedirs(store_dir, exist_ok=True)
+        self._files: Dict[Tuple[str, float], MappedArticleFile] = {}  # Mapped stores by (MST, timestamp)
+        self._replaced: List[MappedArticleFile] = []  # Rewritten stores still read by older articles
+        self._lock = threading.Lock()
+    
+    def _path(self, mst: str) -> str:
+        return os.path.join(self.store_dir, f"{mst}.articles")
+    
+    def open(self, mst: str, created_at: float) -> Optional[MappedArticleFile]:
+        """Map the store for a law, reusing the mapping opened for the same version.
+        
+        Args:
+            mst: Law master number
+            created_at: Timestamp of the cache entry the store must match
+        
+        Returns:
+            MappedArticleFile, or None if missing, unreadable or stale
+        """
+        with self._lock:
+            contents = self._files.get((mst, created_at))
+            if contents is not None:
+                return contents
+            
+            try:
+                contents = MappedArticleFile(self._path(mst))
+            except (OSError, ValueError):
+                return None
+            if contents.created_at != created_at:
+                contents.close()
+                return None
+            self._files[(mst, created_at)] = contents
+            return contents
+    
+    def map_articles(self, mst: str, rows: List[tuple], created_at: float) -> Optional[List[Article]]:
+        """Create mapped articles for a law's snapshot rows.
+        
+        The store file is (re)written from the rows' contents when missing
+        or built from a different cache entry.
+        
+        Args:
+            mst: Law master number
+            rows: Article rows in LawContent.SNAPSHOT_COLUMNS order
+            created_at: Timestamp of the snapshot the rows belong to
+        
+        Returns:
+            One MappedArticle per row, or None if the store could not be written
+        """
+        contents = self.open(mst, created_at)
+        if contents is None or len(contents) != len(rows):
+            try:
+                MappedArticleFile.write(self._path(mst), (row[2] for row in rows), created_at)
+            except OSError:
+                return None
+            with self._lock:
+                replaced = self._files.pop((mst, created_at), None)
+                if replaced is not None:
+                    self._replaced.append(replaced)
+            contents = self.open(mst, created_at)
+            if contents is None or len(contents) != len(rows):
+                return None
+        
+        return [MappedArticle(row, contents, index) for index, row in enumerate(rows)]
+    
+    def close(self) -> None:
+        """Unmap every store opened so far; their MappedArticles stop working."""
+        with self._lock:
+            for contents in list(self._files.values()) + self._replaced:
+                contents.close()
+            self._files = {}
+            self._replaced = []
+    
+    def delete(self, mst: str) -> bool:
+        """Remove the store file for a law."""
+        try:
+            os.remove(self._path(mst))
+            return True
+        except OSError:
+            return False
\ No newline at end of file
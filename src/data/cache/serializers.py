@@ -0,0 +1,108 @@
+"""Serialization of cache entries."""
+import gzip
+import json
+from typing import Any, BinaryIO
+
+
+class CacheSerializer:
+    """Encode cache entries in a configurable format and decode any of them.
+    
+    Formats:
+        json: Compact UTF-8 JSON
+        json-pretty: Indented JSON (the original cache layout)
+        gzip: Compact JSON compressed with gzip
+        zstd: Compact JSON compressed with zstandard (requires ``zstandard``)
+        msgpack: MessagePack binary (requires ``msgpack``)
+    
+    ``loads`` detects the format from the payload itself, so a cache that
+    mixes entries written with different settings keeps working.
+    """
+    
+    FORMATS = ('json', 'json-pretty', 'gzip', 'zstd', 'msgpack')
+    
+    GZIP_MAGIC = b'\x1f\x8b'
+    ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+    JSON_START_BYTES = b'{["-0123456789tfn \t\r\n'
+    
+    def __init__(self, format: str = 'json', compression_level: int = 3):
+        """Initialize the serializer.
+        
+        Raises:
+            ValueError: If the format is unknown or its library is not installed
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown cache format: {format} (expected one of {', '.join(self.FORMATS)})")
+        if format == 'zstd':
+            self._require('zstandard')
+        elif format == 'msgpack':
+            self._require('msgpack')
+        self.format = format
+        self.compression_level = compression_level
+    
+    @staticmethod
+    def _require(module_name: str):
+        """Import an optional dependency or fail with a clear message."""
+        try:
+            return __import__(module_name)
+        except ImportError:
+            raise ValueError(f"Cache format requires the '{module_name}' package")
+    
+    def dumps(self, data: Any) -> bytes:
+        """Encode data in the configured format."""
+        if self.format == 'json-pretty':
+            return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        if self.format == 'msgpack':
+            return self._require('msgpack').packb(data, use_bin_type=True)
+        
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if self.format == 'gzip':
+            return gzip.compress(payload, compresslevel=self.compression_level)
+        if self.format == 'zstd':
+            return self._require('zstandard').ZstdCompressor(level=self.compression_level).compress(payload)
+        return payload
+    
+    def wrap_json_bytes(self, payload: bytes) -> bytes:
+        """Store already-encoded JSON bytes, compressing them if configured.
+        
+        Used when the raw API body is written as-is; msgpack falls back to
+        plain JSON since re-encoding would require parsing the payload.
+        """
+        if self.format == 'gzip':
+            return gzip.compress(payload, compresslevel=self.compression_level)
+        if self.format == 'zstd':
+            return self._require('zstandard').ZstdCompressor(level=self.compression_level).compress(payload)
+        return payload
+    
+    def json_bytes_writer(self, file: BinaryIO) -> BinaryIO:
+        """Writable stream over ``file`` for already-encoded JSON, the streaming wrap_json_bytes.
+        
+        Compressing formats return a compressor to close once the payload
+        is complete (``file`` itself stays open); the others return ``file``.
+        """
+        if self.format == 'gzip':
+            return gzip.GzipFile(fileobj=file, mode='wb', compresslevel=self.compression_level)
+        if self.format == 'zstd':
+            compressor = self._require('zstandard').ZstdCompressor(level=self.compression_level)
+            return compressor.stream_writer(file, closefd=False)
+        return file
+    
+    @classmethod
+    def loads(cls, payload: bytes) -> Any:
+        """Decode a payload written in any supported format.
+        
+        Raises:
+            ValueError: If the payload cannot be decoded
+        """
+        if payload.startswith(cls.GZIP_MAGIC):
+            return cls.loads(gzip.decompress(payload))
+        if payload.startswith(cls.ZSTD_MAGIC):
+            zstandard = cls._require('zstandard')
+            return cls.loads(zstandard.ZstdDecompressor().decompressobj().decompress(payload))
+        if payload[:1] and payload[:1] in cls.JSON_START_BYTES or payload.startswith(b'\xef\xbb\xbf'):
+            return json.loads(payload.decode('utf-8-sig'))
+        
+        msgpack = cls._require('msgpack')
+        try:
+            return msgpack.unpackb(payload, raw=False)
+        except Exception as e:
+            raise ValueError(f"Unreadable cache payload: {e}")
\ No newline at end of file
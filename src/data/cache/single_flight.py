@@ -0,0 +1,104 @@
+"""Request coalescing (single-flight) for cache-miss fetches."""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """A fetch in progress and the callers waiting for it."""
+    
+    __slots__ = ('done', 'result', 'error')
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread-safe per-key deduplication of concurrent calls.
+    
+    The first caller for a key runs the function; callers arriving while
+    it runs wait for it and get the same result (or exception) instead of
+    running it again. Once the call finishes the key is free, so a later
+    caller runs the function again (and normally hits the cache it filled).
+    
+    The function must not call ``do`` for the same key, or it waits on itself.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+    
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Run func once for all concurrent callers of the same key."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+    
+    def stats(self) -> Dict[str, int]:
+        """Get executed/coalesced counters and the number of calls in flight."""
+        with self._lock:
+            return {
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls)
+            }
+
+
+class AsyncSingleFlight:
+    """Per-key deduplication of concurrent coroutines on one event loop.
+    
+    The first caller's coroutine runs as a task that every concurrent
+    caller of the same key awaits. Callers await it shielded, so one of
+    them being cancelled does not cancel the fetch for the others.
+    """
+    
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+    
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await func() once for all concurrent callers of the same key."""
+        task = self._tasks.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            self.executed += 1
+            task.add_done_callback(lambda _, key=key: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+    
+    def stats(self) -> Dict[str, int]:
+        """Get executed/coalesced counters and the number of calls in flight."""
+        return {
+            'executed': self.executed,
+            'coalesced': self.coalesced,
+            'in_flight': len(self._tasks)
+        }
\ No newline at end of file
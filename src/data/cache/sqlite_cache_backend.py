@@ -0,0 +1,203 @@
+"""Cache backend storing all entries in a single SQLite file."""
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from .cache_backend import CacheBackend, CacheEntry
+from .serializers import CacheSerializer
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache backend backed by one SQLite database.
+    
+    Entries live in a single table indexed by type, key, created_at and
+    size, so listing and expiring the cache never touches the data blobs.
+    The database runs in WAL mode so readers in other threads or processes
+    are not blocked by a writer, and every write is its own transaction.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            cache_type TEXT NOT NULL,
+            cache_key TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (cache_type, cache_key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_cache_entries_created_at
+            ON cache_entries (created_at);
+        CREATE INDEX IF NOT EXISTS idx_cache_entries_type_created_size
+            ON cache_entries (cache_type, created_at, size);
+    """
+    
+    # Bytes copied per write when an entry is stored from a file
+    BLOB_COPY_SIZE = 64 * 1024
+    
+    def __init__(self, db_path: str, serializer: Optional[CacheSerializer] = None):
+        self.db_path = db_path
+        self.serializer = serializer or CacheSerializer('json')
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.executescript(self.SCHEMA)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def get(self, key: str, cache_type: str, max_age_seconds: Optional[float] = None) -> Optional[Any]:
+        """Load an entry if it exists and is fresh enough."""
+        query = "SELECT data FROM cache_entries WHERE cache_type = ? AND cache_key = ?"
+        params = [cache_type, key]
+        if max_age_seconds is not None:
+            query += " AND created_at > ?"
+            params.append(time.time() - max_age_seconds)
+        
+        try:
+            row = self._connect().execute(query, params).fetchone()
+            if row is None:
+                return None
+            return self.serializer.loads(bytes(row[0]))
+        except (sqlite3.Error, ValueError):
+            return None
+    
+    def set(self, key: str, cache_type: str, data: Any, created_at: Optional[float] = None) -> None:
+        """Insert or replace an entry in a single transaction."""
+        try:
+            self.set_bytes(key, cache_type, self.serializer.dumps(data), created_at)
+        except (TypeError, ValueError):
+            pass
+    
+    def set_bytes(self, key: str, cache_type: str, payload: bytes, created_at: Optional[float] = None) -> None:
+        """Insert or replace an already-encoded entry."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (cache_type, cache_key, created_at, size, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (cache_type, key, created_at if created_at is not None else time.time(),
+                     len(payload), sqlite3.Binary(payload))
+                )
+        except sqlite3.Error:
+            pass
+    
+    def set_file(self, key: str, cache_type: str, file: BinaryIO, created_at: Optional[float] = None) -> None:
+        """Insert or replace an already-encoded entry, copying the file into the blob in pieces.
+        
+        Needs Connection.blobopen (Python 3.11+); older versions read the
+        file whole.
+        """
+        size = os.fstat(file.fileno()).st_size
+        file.seek(0)
+        conn = self._connect()
+        if not hasattr(conn, 'blobopen'):
+            super().set_file(key, cache_type, file, created_at)
+            return
+        
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (cache_type, cache_key, created_at, size, data) "
+                    "VALUES (?, ?, ?, ?, zeroblob(?))",
+                    (cache_type, key, created_at if created_at is not None else time.time(), size, size)
+                )
+                with conn.blobopen('cache_entries', 'data', cursor.lastrowid) as blob:
+                    for piece in iter(lambda: file.read(self.BLOB_COPY_SIZE), b''):
+                        blob.write(piece)
+        except sqlite3.Error:
+            pass
+    
+    def delete(self, key: str, cache_type: str) -> bool:
+        """Delete an entry."""
+        try:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM cache_entries WHERE cache_type = ? AND cache_key = ?",
+                    (cache_type, key)
+                )
+            return cursor.rowcount > 0
+        except sqlite3.Error:
+            return False
+    
+    def get_entry(self, key: str, cache_type: str) -> Optional[CacheEntry]:
+        """Get entry metadata without reading the data blob."""
+        try:
+            row = self._connect().execute(
+                "SELECT created_at, size FROM cache_entries WHERE cache_type = ? AND cache_key = ?",
+                (cache_type, key)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return CacheEntry(key=key, cache_type=cache_type, created_at=row[0], size=row[1])
+    
+    def entries(self, cache_type: Optional[str] = None) -> List[CacheEntry]:
+        """List entry metadata from the index."""
+        query = "SELECT cache_key, cache_type, created_at, size FROM cache_entries"
+        params = []
+        if cache_type is not None:
+            query += " WHERE cache_type = ?"
+            params.append(cache_type)
+        
+        try:
+            rows = self._connect().execute(query, params).fetchall()
+        except sqlite3.Error:
+            return []
+        return [CacheEntry(key=row[0], cache_type=row[1], created_at=row[2], size=row[3]) for row in rows]
+    
+    def clear_older_than(self, max_age_seconds: float, cache_type: Optional[str] = None) -> int:
+        """Delete expired entries with a single indexed DELETE."""
+        query = "DELETE FROM cache_entries WHERE created_at < ?"
+        params = [time.time() - max_age_seconds]
+        if cache_type is not None:
+            query += " AND cache_type = ?"
+            params.append(cache_type)
+        
+        try:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute(query, params)
+            return cursor.rowcount
+        except sqlite3.Error:
+            return 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Summarize the cache with one aggregate query."""
+        try:
+            row = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(created_at), MAX(created_at) FROM cache_entries"
+            ).fetchone()
+        except sqlite3.Error:
+            row = (0, 0, None, None)
+        return {'entries': row[0], 'size': row[1], 'oldest': row[2], 'newest': row[3]}
+    
+    def close(self) -> None:
+        """Close every connection opened by this backend."""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections = []
+        self._local = threading.local()
\ No newline at end of file
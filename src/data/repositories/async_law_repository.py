@@ -0,0 +1,158 @@
+"""Asyncio facades over the law repositories."""
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ...domain.entities.law import Law
+from ...domain.entities.article import LawContent
+from ...domain.entities.delegated_law import DelegatedLawResponse
+from ..api.async_law_api_client import AsyncLawAPIClient
+from ..cache.cache_backend import CacheEntry
+from ..cache.single_flight import AsyncSingleFlight
+from .law_repository import LawRepository
+from .delegated_law_repository import DelegatedLawRepositoryImpl
+
+
+class AsyncLawRepository:
+    """Async facade over ``LawRepository``.
+    
+    Shares the synchronous repository's cache, so laws fetched here are
+    visible to the CLI and vice versa. Cache reads and parsing run in a
+    worker thread to keep the event loop free while the network requests
+    go through the async client.
+    """
+    
+    def __init__(self, repository: LawRepository, api_client: AsyncLawAPIClient):
+        self.repository = repository
+        self.api_client = api_client
+        # Deduplicates concurrent get_law_content loads of the same MST
+        self.law_content_flight = AsyncSingleFlight()
+    
+    async def search_laws(self, query: str, display: int = 20) -> List[Law]:
+        """Search for laws by query."""
+        cache_key = f"{query}_{display}"
+        cached_data = await asyncio.to_thread(self.repository.load_from_cache, cache_key, "search")
+        
+        if cached_data:
+            return self.repository.parse_search_response(cached_data)
+        
+        response = await self.api_client.search(query, display)
+        
+        if 'error' in response:
+            return []
+        
+        await asyncio.to_thread(self.repository.save_to_cache, response, cache_key, "search")
+        
+        return self.repository.parse_search_response(response)
+    
+    async def get_law_full_text(self, mst: str) -> Optional[dict]:
+        """Get full text of a law by MST."""
+        response, _ = await self._get_law_response(mst)
+        return response
+    
+    async def _get_law_response(self, mst: str) -> Tuple[Optional[dict], Optional[CacheEntry]]:
+        """Get the raw lawService.do response, from the shared cache or the API."""
+        cached_data, entry = await asyncio.to_thread(self.repository.load_law_response, mst)
+        if cached_data:
+            return cached_data, entry
+        
+        response = await self.api_client.get_full_text(mst)
+        
+        if 'error' in response:
+            return None, None
+        
+        await asyncio.to_thread(
+            self.repository.save_to_cache, response, mst, self.repository.LAW_TEXT_CACHE_TYPE
+        )
+        
+        return response, None
+    
+    async def get_law_content(self, mst: str) -> Optional[LawContent]:
+        """Get law content with articles.
+        
+        Concurrent tasks asking for the same MST share one load.
+        """
+        law_content = self.repository.memory_cache.get(mst)
+        if law_content is not None:
+            law_content.from_cache = True
+            return law_content
+        return await self.law_content_flight.do(mst, lambda: self._load_law_content(mst))
+    
+    async def _load_law_content(self, mst: str) -> Optional[LawContent]:
+        """Load law content from the snapshot, the raw response or the API."""
+        # A flight for this MST may have finished since the caller checked
+        law_content = self.repository.memory_cache.get(mst)
+        if law_content is not None:
+            law_content.from_cache = True
+            return law_content
+        
+        law_content, entry = await asyncio.to_thread(self.repository.load_law_content_snapshot, mst)
+        if law_content is not None:
+            await asyncio.to_thread(self.repository.prepare_law_content, mst, law_content, entry.created_at)
+            self.repository.remember_law_content(mst, law_content, entry)
+            return law_content
+        
+        response, entry = await self._get_law_response(mst)
+        if not response:
+            return None
+        
+        # Parsing large laws is CPU bound, keep it off the event loop
+        law_content = await asyncio.to_thread(self.repository.build_law_content, response, entry is not None)
+        if law_content:
+            created_at = await asyncio.to_thread(
+                self.repository.save_law_content_snapshot, mst, law_content, entry
+            )
+            await asyncio.to_thread(self.repository.prepare_law_content, mst, law_content, created_at)
+            self.repository.remember_law_content(mst, law_content, entry)
+        return law_content
+    
+    async def get_law_contents(self, msts: Iterable[str]) -> Dict[str, Optional[LawContent]]:
+        """Get law content for many MSTs concurrently.
+        
+        Args:
+            msts: Law master numbers
+        
+        Returns:
+            Mapping of MST to LawContent (None for laws that failed)
+        """
+        msts = list(dict.fromkeys(msts))
+        results = await asyncio.gather(*(self.get_law_content(mst) for mst in msts))
+        return dict(zip(msts, results))
+
+
+class AsyncDelegatedLawRepository:
+    """Async facade over ``DelegatedLawRepositoryImpl`` sharing its cache."""
+    
+    def __init__(self, repository: DelegatedLawRepositoryImpl, api_client: AsyncLawAPIClient):
+        self.repository = repository
+        self.api_client = api_client
+        # Deduplicates concurrent get_delegated_laws calls for the same MST
+        self.delegated_flight = AsyncSingleFlight()
+    
+    async def get_delegated_laws(self, mst: str) -> Optional[DelegatedLawResponse]:
+        """Get delegated laws for a given law MST.
+        
+        Concurrent tasks asking for the same MST share one lookup.
+        """
+        return await self.delegated_flight.do(mst, lambda: self._load_delegated_laws(mst))
+    
+    async def _load_delegated_laws(self, mst: str) -> Optional[DelegatedLawResponse]:
+        """Load delegated laws from the shared cache, or fetch and cache them."""
+        cached_response = await asyncio.to_thread(self.repository.get_delegated_laws_from_cache, mst)
+        if cached_response is not None:
+            return cached_response
+        
+        result = await self.api_client.get_delegated_laws(mst)
+        
+        if 'error' not in result:
+            response = DelegatedLawResponse.from_api_response(result)
+            await asyncio.to_thread(self.repository.save_delegated_laws_to_cache, mst, response)
+            return response
+        
+        print(f"Error fetching delegated laws: {result.get('error')}")
+        return None
+    
+    async def get_many_delegated_laws(self, msts: Iterable[str]) -> Dict[str, Optional[DelegatedLawResponse]]:
+        """Get delegated laws for many MSTs concurrently."""
+        msts = list(dict.fromkeys(msts))
+        results = await asyncio.gather(*(self.get_delegated_laws(mst) for mst in msts))
+        return dict(zip(msts, results))
\ No newline at end of file
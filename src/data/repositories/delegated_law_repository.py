@@ -1,26 +1,52 @@
 """Implementation of delegated law repository."""
-import json
-import os
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
 from pathlib import Path
 
 from ...domain.interfaces.delegated_law_repository import DelegatedLawRepository
 from ...domain.entities.delegated_law import DelegatedLawResponse
+from ...domain.entities.delegation_graph import DelegationGraph
 from ..api.law_api_client import LawAPIClient
+from ..cache.cache_backend import CacheBackend
+from ..cache.file_cache_backend import FileCacheBackend
+from ..cache.single_flight import SingleFlight
 
 
 class DelegatedLawRepositoryImpl(DelegatedLawRepository):
     """Implementation of delegated law repository with API and caching."""
     
-    def __init__(self, api_client: LawAPIClient, cache_dir: str = '.cache/delegated_laws', cache_ttl_days: int = 7):
+    CACHE_TYPE = 'delegated'
+    GRAPH_CACHE_TYPE = 'delegation_graph'
+    GRAPH_CACHE_KEY = 'corpus'
+    CACHE_FILENAMES = {
+        CACHE_TYPE: '{key}_delegated.json',
+        GRAPH_CACHE_TYPE: 'delegation-graph_{key}.json',
+    }
+    
+    def __init__(self, api_client: LawAPIClient, cache_dir: str = '.cache/delegated_laws', cache_ttl_days: int = 7,
+                 cache_backend: Optional[CacheBackend] = None):
         self.api_client = api_client
         self.cache_dir = Path(cache_dir)
         self.cache_ttl = timedelta(days=cache_ttl_days)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_backend = cache_backend or FileCacheBackend(str(self.cache_dir), self.CACHE_FILENAMES)
+        self._graph = None
+        self._graph_lock = threading.Lock()
+        # Deduplicates concurrent get_delegated_laws calls for the same MST
+        self.delegated_flight = SingleFlight()
     
     def get_delegated_laws(self, mst: str) -> Optional[DelegatedLawResponse]:
-        """Get delegated laws for a given law MST."""
+        """Get delegated laws for a given law MST.
+        
+        Concurrent calls for the same MST share one cache lookup and at
+        most one API request.
+        """
+        return self.delegated_flight.do(mst, lambda: self._load_delegated_laws(mst))
+    
+    def _load_delegated_laws(self, mst: str) -> Optional[DelegatedLawResponse]:
+        """Load delegated laws from the cache, or fetch and cache them."""
         # Check cache first
         cached_response = self.get_delegated_laws_from_cache(mst)
         if cached_response is not None:
@@ -38,42 +64,62 @@ class DelegatedLawRepositoryImpl(DelegatedLawRepository):
         print(f"Error fetching delegated laws: {result.get('error')}")
         return None
     
-    def get_delegated_laws_from_cache(self, mst: str) -> Optional[DelegatedLawResponse]:
-        """Get delegated laws from cache if available."""
-        cache_file = self._get_cache_file_path(mst)
-        
-        if not cache_file.exists():
+    def _load_cache_data(self, mst: str) -> Optional[dict]:
+        """Load the raw cache entry if it has not expired."""
+        data = self.cache_backend.get(mst, self.CACHE_TYPE, max_age_seconds=self.cache_ttl.total_seconds())
+        if not isinstance(data, dict):
             return None
         
-        # Check if cache is still valid
-        if not self.is_cache_valid(mst):
+        # Also check the cached_at field if available
+        if 'cached_at' in data:
+            try:
+                cached_at = datetime.fromisoformat(data['cached_at'])
+            except (TypeError, ValueError):
+                return None
+            if datetime.now() - cached_at > self.cache_ttl:
+                return None
+        
+        return data
+    
+    def get_delegated_laws_from_cache(self, mst: str) -> Optional[DelegatedLawResponse]:
+        """Get delegated laws from cache if available."""
+        data = self._load_cache_data(mst)
+        if data is None:
             return None
         
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Create response object from cached data
-                return DelegatedLawResponse(
-                    law_mst=data['law_mst'],
-                    law_name=data['law_name'],
-                    law_id=data['law_id'],
-                    promulgation_date=data['promulgation_date'],
-                    promulgation_number=data['promulgation_number'],
-                    department_code=data['department_code'],
-                    phone_number=data['phone_number'],
-                    enforcement_date=data['enforcement_date'],
-                    delegated_laws=self._deserialize_delegated_items(data['delegated_laws']),
-                    administrative_rules=self._deserialize_delegated_items(data['administrative_rules']),
-                    local_regulations=self._deserialize_delegated_items(data['local_regulations'])
-                )
+            # Create response object from cached data
+            delegated_laws = self._deserialize_delegated_items(data['delegated_laws'])
+            administrative_rules = self._deserialize_delegated_items(data['administrative_rules'])
+            local_regulations = self._deserialize_delegated_items(data['local_regulations'])
+            
+            # Reuse the stored article index unless it does not fit the items
+            article_index = data.get('article_index')
+            total = len(delegated_laws) + len(administrative_rules) + len(local_regulations)
+            if article_index is not None and not all(
+                    0 <= position < total for positions in article_index.values() for position in positions):
+                article_index = None
+            
+            return DelegatedLawResponse(
+                law_mst=data['law_mst'],
+                law_name=data['law_name'],
+                law_id=data['law_id'],
+                promulgation_date=data['promulgation_date'],
+                promulgation_number=data['promulgation_number'],
+                department_code=data['department_code'],
+                phone_number=data['phone_number'],
+                enforcement_date=data['enforcement_date'],
+                delegated_laws=delegated_laws,
+                administrative_rules=administrative_rules,
+                local_regulations=local_regulations,
+                article_index=article_index
+            )
         except Exception as e:
             print(f"Error reading cache: {e}")
             return None
     
     def save_delegated_laws_to_cache(self, mst: str, response: DelegatedLawResponse) -> None:
         """Save delegated laws to cache."""
-        cache_file = self._get_cache_file_path(mst)
-        
         try:
             # Serialize the response
             cache_data = {
@@ -88,42 +134,57 @@ class DelegatedLawRepositoryImpl(DelegatedLawRepository):
                 'delegated_laws': self._serialize_delegated_items(response.delegated_laws),
                 'administrative_rules': self._serialize_delegated_items(response.administrative_rules),
                 'local_regulations': self._serialize_delegated_items(response.local_regulations),
+                'article_index': response.article_index,
                 'cached_at': datetime.now().isoformat()
             }
             
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            self.cache_backend.set(mst, self.CACHE_TYPE, cache_data)
         except Exception as e:
             print(f"Error saving to cache: {e}")
     
-    def is_cache_valid(self, mst: str) -> bool:
-        """Check if cached data is still valid."""
-        cache_file = self._get_cache_file_path(mst)
+    def get_delegation_graph(self) -> DelegationGraph:
+        """Get the delegation graph of every cached law, updating it if the cache changed.
         
-        if not cache_file.exists():
-            return False
-        
-        try:
-            # Check file modification time
-            file_mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if datetime.now() - file_mtime > self.cache_ttl:
-                return False
+        Only laws whose delegated entry was added, refreshed or expired
+        since the stored graph was built are re-read; the result is saved
+        back to the cache.
+        """
+        with self._graph_lock:
+            if self._graph is None:
+                stored = self.cache_backend.get(self.GRAPH_CACHE_KEY, self.GRAPH_CACHE_TYPE)
+                self._graph = (DelegationGraph.from_dict(stored) if stored else None) or DelegationGraph()
             
-            # Also check the cached_at field if available
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if 'cached_at' in data:
-                    cached_at = datetime.fromisoformat(data['cached_at'])
-                    if datetime.now() - cached_at > self.cache_ttl:
-                        return False
+            graph = self._graph
+            versions = self._cached_delegated_versions()
+            changed = False
+            for mst in [mst for mst in graph.versions if mst not in versions]:
+                graph.remove_source(mst)
+                changed = True
+            for mst, version in versions.items():
+                if graph.versions.get(mst) == version:
+                    continue
+                response = self.get_delegated_laws_from_cache(mst)
+                if response is None:
+                    continue
+                graph.add_response(response, version, mst=mst)
+                changed = True
             
-            return True
-        except Exception:
-            return False
+            if changed:
+                self.cache_backend.set(self.GRAPH_CACHE_KEY, self.GRAPH_CACHE_TYPE, graph.to_dict())
+            return graph
+    
+    def _cached_delegated_versions(self) -> Dict[str, float]:
+        """Cache timestamp of every fresh delegated entry."""
+        oldest = time.time() - self.cache_ttl.total_seconds()
+        return {
+            entry.key: entry.created_at
+            for entry in self.cache_backend.entries(self.CACHE_TYPE)
+            if entry.created_at >= oldest
+        }
     
-    def _get_cache_file_path(self, mst: str) -> Path:
-        """Get cache file path for a specific MST."""
-        return self.cache_dir / f"{mst}_delegated.json"
+    def is_cache_valid(self, mst: str) -> bool:
+        """Check if cached data is still valid."""
+        return self._load_cache_data(mst) is not None
     
     def _serialize_delegated_items(self, items):
         """Serialize delegated items for caching."""
@@ -1,93 +1,135 @@
 """Implementation of the law repository interface."""
 import json
 import os
-from typing import List, Optional
+import sys
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
 from ...domain.interfaces.law_repository import LawRepositoryInterface
 from ...domain.entities.law import Law
 from ...domain.entities.article import LawContent, Article
+from ...domain.entities.lazy_law_content import LazyArticleList, LazyLawContent
+from ...domain.search.ngram_index import NgramIndex
 from ..api.law_api_client import LawAPIClient
+from ..api.streaming_json import StreamingJSONParser
+from ..cache.cache_backend import CacheBackend, CacheEntry
+from ..cache.file_cache_backend import FileCacheBackend
+from ..cache.corpus_index_store import CorpusIndexFile
+from ..cache.memory_cache import LRUCache
+from ..cache.mmap_article_store import MappedArticle, MmapArticleStore
+from ..cache.single_flight import SingleFlight
 from datetime import datetime
 
 
+def estimate_law_content_size(law_content: LawContent) -> int:
+    """Approximate the memory held by a parsed LawContent in bytes."""
+    size = sys.getsizeof(law_content)
+    articles = law_content.articles
+    if isinstance(articles, LazyArticleList):
+        built = (articles.peek(i) for i in range(len(articles)))
+        built = [article for article in built if article is not None]
+        # Sources of unbuilt articles: snapshot rows or raw API records
+        for source in articles.pending_sources():
+            values = source.values() if isinstance(source, dict) else source
+            size += sys.getsizeof(source) + sum(sys.getsizeof(value) for value in values)
+    else:
+        built = articles
+    for article in built:
+        size += sys.getsizeof(article)
+        if not isinstance(article, MappedArticle):  # Mapped content lives in the page cache
+            size += sys.getsizeof(article.article_content)
+        size += sys.getsizeof(article.article_title or '')
+        size += sys.getsizeof(article.article_number) + sys.getsizeof(article.enforcement_date)
+    if law_content.search_index is not None:
+        size += sys.getsizeof(law_content.search_index.postings)
+        for posting in law_content.search_index.postings.values():
+            size += sys.getsizeof(posting) + 8 * len(posting)
+    return size
+
+
 class LawRepository(LawRepositoryInterface):
-    """Repository for law data access using the API."""
+    """Repository for law data access using the API.
+    
+    The cache and parsing steps of a load (load_from_cache, save_to_cache,
+    parse_search_response, load_law_response, build_law_content, the
+    snapshot load/save, prepare_law_content and remember_law_content) are
+    public so AsyncLawRepository can run them around its own requests.
+    """
+    
+    # Descriptive cache file names used by the file-per-key backend
+    CACHE_FILENAMES = {
+        'search': 'law-list_{key}.json',
+        'law_text': 'law-text_{key}.json',
+        'law_content': 'article-list_{key}.json',
+        'full_text': 'full-text_{key}.json',
+        'article_snapshot': 'article-snapshot_{key}.json',
+        'ngram_index': 'ngram-index_{key}.json'
+    }
+    
+    # One raw lawService.do response per MST backs both get_law_full_text
+    # and get_law_content. The other two types are the pre-merge layouts
+    # (full_text keyed by "full_{mst}", law_content keyed by MST).
+    LAW_TEXT_CACHE_TYPE = 'law_text'
+    LEGACY_LAW_TEXT_CACHE_TYPES = (('full_text', 'full_{mst}'), ('law_content', '{mst}'))
+    
+    # Flattened articles with their derived fields (LawContent.to_snapshot),
+    # kept next to the raw response so warm loads skip parsing it
+    ARTICLE_SNAPSHOT_CACHE_TYPE = 'article_snapshot'
+    # Per-law n-gram index over the articles (NgramIndex.to_dict)
+    NGRAM_INDEX_CACHE_TYPE = 'ngram_index'
     
-    def __init__(self, api_client: LawAPIClient, output_dir: str = 'output', cache_hours: int = 168):
+    # Location of the article list inside a lawService.do response
+    ARTICLES_PATH = ('법령', '조문', '조문단위')
+    
+    def __init__(self, api_client: LawAPIClient, output_dir: str = 'output', cache_hours: int = 168,
+                 cache_backend: Optional[CacheBackend] = None, memory_cache: Optional[LRUCache] = None,
+                 article_store: Optional[MmapArticleStore] = None, lazy_articles: bool = False):
         self.api_client = api_client
         self.output_dir = output_dir
         self.cache_dir = os.path.join(output_dir, '.cache')
         self.cache_hours = cache_hours  # Cache validity in hours
         os.makedirs(output_dir, exist_ok=True)
         os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache_backend = cache_backend or FileCacheBackend(self.cache_dir, self.CACHE_FILENAMES)
+        # Parsed LawContent objects by MST, in front of the disk cache
+        self.memory_cache = memory_cache or LRUCache(
+            max_entries=32,
+            ttl_seconds=cache_hours * 3600,
+            sizeof=estimate_law_content_size
+        )
+        # Optional memory-mapped storage for article text (None = plain strings)
+        self.article_store = article_store
+        # Build Article objects on first access (LazyLawContent) instead of up front
+        self.law_content_class = LazyLawContent if lazy_articles else LawContent
+        # N-gram index over every cached law, rebuilt when the cached laws change
+        self.corpus_index_path = os.path.join(self.cache_dir, 'corpus-index.ngram')
+        self._corpus_index: Optional[CorpusIndexFile] = None
+        self._corpus_index_versions: Dict[str, float] = {}  # Cached laws the index was built for
+        self._corpus_index_lock = threading.RLock()
+        # Deduplicates concurrent get_law_content loads of the same MST
+        self.law_content_flight = SingleFlight()
     
-    def _get_cache_filename(self, cache_key: str, cache_type: str) -> str:
-        """Generate cache filename with descriptive names."""
-        # More descriptive cache filenames
-        if cache_type == "search":
-            filename = f"law-list_{cache_key}.json"
-        elif cache_type == "law_content":
-            filename = f"article-list_{cache_key}.json"
-        elif cache_type == "full_text":
-            filename = f"full-text_{cache_key}.json"
-        else:
-            filename = f"{cache_type}_{cache_key}.json"
-        
-        return os.path.join(self.cache_dir, filename)
-    
-    def _load_from_cache(self, cache_key: str, cache_type: str) -> Optional[dict]:
-        """Load data from cache if exists."""
-        cache_file = self._get_cache_filename(cache_key, cache_type)
-        if os.path.exists(cache_file):
-            try:
-                # Check if cache is recent (default: 7 days)
-                mtime = os.path.getmtime(cache_file)
-                cache_age_hours = (datetime.now().timestamp() - mtime) / 3600
-                if cache_age_hours < self.cache_hours:
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        return json.load(f)
-            except Exception:
-                pass
-        return None
-    
-    def _save_to_cache(self, data: dict, cache_key: str, cache_type: str) -> None:
+    def load_from_cache(self, cache_key: str, cache_type: str) -> Optional[dict]:
+        """Load data from cache if exists and is recent (default: 7 days)."""
+        return self.cache_backend.get(cache_key, cache_type, max_age_seconds=self.cache_hours * 3600)
+    
+    def save_to_cache(self, data: dict, cache_key: str, cache_type: str) -> None:
         """Save data to cache."""
-        cache_file = self._get_cache_filename(cache_key, cache_type)
-        try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+        self.cache_backend.set(cache_key, cache_type, data)
     
     def clear_old_cache(self) -> int:
-        """Clear cache files older than cache_hours."""
-        cleared_count = 0
-        try:
-            for filename in os.listdir(self.cache_dir):
-                filepath = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(filepath):
-                    mtime = os.path.getmtime(filepath)
-                    cache_age_hours = (datetime.now().timestamp() - mtime) / 3600
-                    if cache_age_hours > self.cache_hours:
-                        os.remove(filepath)
-                        cleared_count += 1
-        except Exception:
-            pass
-        return cleared_count
+        """Clear cache entries older than cache_hours."""
+        return self.cache_backend.clear_older_than(self.cache_hours * 3600)
     
     def search_laws(self, query: str, display: int = 20) -> List[Law]:
         """Search for laws by query."""
         # Check cache first
         cache_key = f"{query}_{display}"
-        cached_data = self._load_from_cache(cache_key, "search")
+        cached_data = self.load_from_cache(cache_key, "search")
         
         if cached_data:
             # Return cached results
-            if 'LawSearch' in cached_data and 'law' in cached_data['LawSearch']:
-                laws_data = cached_data['LawSearch']['law']
-                if isinstance(laws_data, dict):
-                    laws_data = [laws_data]
-                return [Law.from_api_response(data) for data in laws_data]
-            return []
+            return self.parse_search_response(cached_data)
         
         # Cache miss, fetch from API
         response = self.api_client.search(query, display)
@@ -96,8 +138,12 @@ class LawRepository(LawRepositoryInterface):
             return []
         
         # Save to cache
-        self._save_to_cache(response, cache_key, "search")
+        self.save_to_cache(response, cache_key, "search")
         
+        return self.parse_search_response(response)
+    
+    def parse_search_response(self, response: dict) -> List[Law]:
+        """Convert a lawSearch.do response into Law entities."""
         if 'LawSearch' in response and 'law' in response['LawSearch']:
             laws_data = response['LawSearch']['law']
             
@@ -111,23 +157,83 @@ class LawRepository(LawRepositoryInterface):
     
     def get_law_full_text(self, mst: str) -> Optional[dict]:
         """Get full text of a law by MST."""
-        # Check cache first
-        cache_key = f"full_{mst}"
-        cached_data = self._load_from_cache(cache_key, "full_text")
+        response, _ = self._get_law_response(mst)
+        return response
+    
+    def _get_law_response(self, mst: str) -> Tuple[Optional[dict], Optional[CacheEntry]]:
+        """Get the raw lawService.do response for a law.
         
+        Returns:
+            (response, cache entry) - the entry is None when the response
+            was just fetched from the API
+        """
+        # Check cache first
+        cached_data, entry = self.load_law_response(mst)
         if cached_data:
-            return cached_data
+            return cached_data, entry
         
         # Cache miss, fetch from API
         response = self.api_client.get_full_text(mst)
         
         if 'error' in response:
-            return None
+            return None, None
         
         # Save to cache
-        self._save_to_cache(response, cache_key, "full_text")
+        self.save_to_cache(response, mst, self.LAW_TEXT_CACHE_TYPE)
         
-        return response
+        return response, None
+    
+    def load_law_response(self, mst: str) -> Tuple[Optional[dict], Optional[CacheEntry]]:
+        """Load the cached raw response, falling back to pre-merge entries."""
+        cache_types = [(self.LAW_TEXT_CACHE_TYPE, '{mst}')] + list(self.LEGACY_LAW_TEXT_CACHE_TYPES)
+        for cache_type, key_pattern in cache_types:
+            cache_key = key_pattern.format(mst=mst)
+            cached_data = self.load_from_cache(cache_key, cache_type)
+            if cached_data:
+                return cached_data, self.cache_backend.get_entry(cache_key, cache_type)
+        return None, None
+    
+    def merge_duplicate_law_caches(self) -> Dict[str, int]:
+        """Merge pre-merge full_text/law_content entries into one entry per MST.
+        
+        The newest copy of each law wins and keeps its timestamp; the old
+        entries are deleted.
+        
+        Returns:
+            Dictionary with the number of laws merged, entries removed and
+            bytes reclaimed
+        """
+        legacy = {}  # mst -> list of (cache_type, key, entry)
+        for cache_type, key_pattern in self.LEGACY_LAW_TEXT_CACHE_TYPES:
+            prefix = key_pattern.split('{mst}')[0]
+            for entry in self.cache_backend.entries(cache_type):
+                if not entry.key.startswith(prefix):
+                    continue
+                mst = entry.key[len(prefix):]
+                legacy.setdefault(mst, []).append((cache_type, entry))
+        
+        merged = removed = reclaimed = 0
+        for mst, old_entries in legacy.items():
+            canonical = self.cache_backend.get_entry(mst, self.LAW_TEXT_CACHE_TYPE)
+            if canonical is None:
+                # Keep the newest readable copy
+                for cache_type, entry in sorted(old_entries, key=lambda item: -item[1].created_at):
+                    data = self.cache_backend.get(entry.key, cache_type)
+                    if data:
+                        self.cache_backend.set(mst, self.LAW_TEXT_CACHE_TYPE, data, created_at=entry.created_at)
+                        canonical = self.cache_backend.get_entry(mst, self.LAW_TEXT_CACHE_TYPE)
+                        break
+                if canonical is None:
+                    continue
+                reclaimed -= canonical.size
+            
+            for cache_type, entry in old_entries:
+                if self.cache_backend.delete(entry.key, cache_type):
+                    removed += 1
+                    reclaimed += entry.size
+            merged += 1
+        
+        return {'laws': merged, 'entries_removed': removed, 'bytes_reclaimed': reclaimed}
     
     def save_search_results(self, laws: List[Law], filename: str) -> bool:
         """Save search results to file."""
@@ -155,33 +261,332 @@ class LawRepository(LawRepositoryInterface):
             return False
     
     def get_law_content(self, mst: str) -> Optional[LawContent]:
-        """Get law content with articles."""
-        # Check cache first
-        cache_key = mst
-        cached_data = self._load_from_cache(cache_key, "law_content")
+        """Get law content with articles.
         
-        if cached_data:
-            try:
-                law_content = LawContent.from_api_response(cached_data)
-                if law_content:
-                    law_content.from_cache = True  # Mark as from cache
-                return law_content
-            except Exception:
-                pass
+        Concurrent calls for the same MST that miss the in-memory cache
+        share one load (and at most one API request).
+        """
+        # Check the in-memory cache of parsed content first
+        law_content = self.memory_cache.get(mst)
+        if law_content is not None:
+            law_content.from_cache = True
+            return law_content
+        return self.law_content_flight.do(mst, lambda: self._load_law_content(mst))
+    
+    def _load_law_content(self, mst: str) -> Optional[LawContent]:
+        """Load law content from the snapshot, the raw response or the API."""
+        # A flight for this MST may have finished since the caller checked
+        law_content = self.memory_cache.get(mst)
+        if law_content is not None:
+            law_content.from_cache = True
+            return law_content
         
-        # Cache miss, fetch from API
-        response = self.api_client.get_full_text(mst)
+        # The pre-parsed snapshot first
+        law_content, entry = self.load_law_content_snapshot(mst)
+        if law_content is not None:
+            self.prepare_law_content(mst, law_content, entry.created_at)
+            self.remember_law_content(mst, law_content, entry)
+            return law_content
         
-        if 'error' in response:
+        # Then the raw response from the disk cache, or streamed from the API
+        response, entry = self.load_law_response(mst)
+        if response:
+            law_content = self.build_law_content(response, from_cache=True)
+        else:
+            law_content = self._stream_law_content(mst)
+        if law_content:
+            created_at = self.save_law_content_snapshot(mst, law_content, entry)
+            self.prepare_law_content(mst, law_content, created_at)
+            self.remember_law_content(mst, law_content, entry)
+        return law_content
+    
+    def iter_law_articles(self, mst: str) -> Iterator[Article]:
+        """Yield the articles of a law as they are parsed.
+        
+        Cached laws come from get_law_content. Otherwise the full text is
+        streamed from the API: articles are yielded as they arrive and the
+        raw body is written to the cache chunk by chunk, so neither the body
+        nor the decoded response is ever held whole.
+        """
+        if self.is_law_cached(mst):
+            law_content = self.get_law_content(mst)
+            if law_content:
+                yield from law_content.articles
+            return
+        
+        events = self._open_law_stream(mst)
+        if events is None:
+            return
+        for kind, _, value in events:
+            if kind == 'item' and value:
+                yield Article.from_api_response(value)
+    
+    def is_law_cached(self, mst: str) -> bool:
+        """Whether get_law_content would be served without the API, checked without loading the law."""
+        return mst in self.memory_cache or self._has_cached_law_response(mst)
+    
+    def _has_cached_law_response(self, mst: str) -> bool:
+        """Whether a fresh snapshot or raw response of the law is cached."""
+        return (self._has_fresh_entry(mst, [(self.ARTICLE_SNAPSHOT_CACHE_TYPE, '{mst}')])
+                or self.has_cached_law_text(mst))
+    
+    def has_cached_law_text(self, mst: str) -> bool:
+        """Whether get_law_full_text would be served from the disk cache, checked without reading it."""
+        cache_types = [(self.LAW_TEXT_CACHE_TYPE, '{mst}')] + list(self.LEGACY_LAW_TEXT_CACHE_TYPES)
+        return self._has_fresh_entry(mst, cache_types)
+    
+    def _has_fresh_entry(self, mst: str, cache_types: List[Tuple[str, str]]) -> bool:
+        """Whether any of the (cache type, key pattern) entries of a law is fresh."""
+        oldest = time.time() - self.cache_hours * 3600
+        for cache_type, key_pattern in cache_types:
+            entry = self.cache_backend.get_entry(key_pattern.format(mst=mst), cache_type)
+            if entry is not None and entry.created_at >= oldest:
+                return True
+        return False
+    
+    def _stream_law_content(self, mst: str) -> Optional[LawContent]:
+        """Fetch and parse a law from the API without building the response dict.
+        
+        Article records are handed to ``law_content_class`` as they arrive,
+        so plain content builds each Article and drops its record right away
+        while lazy content keeps the records unbuilt like any other load.
+        Returns None if the body is malformed or the connection fails
+        part-way through it.
+        """
+        events = self._open_law_stream(mst)
+        if events is None:
             return None
         
-        # Save to cache
-        self._save_to_cache(response, cache_key, "law_content")
+        parts = {'law_info': {}, 'law_key': ''}
+        top_level = {}  # Other layouts are parsed by from_api_response
+        
+        def records() -> Iterator[dict]:
+            for kind, path, value in events:
+                if kind == 'item':
+                    if isinstance(value, list):
+                        yield from (a for a in value if a)
+                    elif value:
+                        yield value
+                elif path == ('법령', '기본정보'):
+                    parts['law_info'] = value
+                elif path == ('법령', '법령키'):
+                    parts['law_key'] = value
+                elif len(path) == 1:
+                    top_level[path[0]] = value
+        
+        try:
+            articles = self.law_content_class.articles_from_records(records())
+            if articles or parts['law_info'] or parts['law_key']:
+                return self.law_content_class.from_parts(parts['law_info'], articles, parts['law_key'])
+            return self.law_content_class.from_api_response(top_level)
+        except ValueError as e:
+            print(f"Error parsing law {mst}: {e}")
+            return None
+        except OSError as e:
+            # requests' ChunkedEncodingError, ConnectionError and read
+            # timeouts raised while reading the body are all OSErrors
+            print(f"Error fetching law {mst}: {e}")
+            return None
+        except Exception:
+            return None
+    
+    def _open_law_stream(self, mst: str) -> Optional[Iterator[Tuple]]:
+        """Start streaming a law's full text from the API.
+        
+        Returns:
+            StreamingJSONParser events for ARTICLES_PATH, or None if the
+            request failed. The raw body is written to the law's cache entry
+            as it arrives and replaces it once the last event has been
+            consumed; a body that breaks off is discarded.
+        """
+        chunks = self.api_client.stream_full_text(mst)
+        if chunks is None:
+            return None
+        return self._parse_law_stream(mst, chunks)
+    
+    def _parse_law_stream(self, mst: str, chunks: Iterator[bytes]) -> Iterator[Tuple]:
+        parser = StreamingJSONParser(self.ARTICLES_PATH)
+        # Same entry get_law_full_text reads, written as the body arrives
+        # and without re-encoding; it only replaces the cached one once complete
+        try:
+            writer = self.cache_backend.open_json_writer(mst, self.LAW_TEXT_CACHE_TYPE)
+        except OSError:
+            writer = None
+        try:
+            for chunk in chunks:
+                if writer is not None:
+                    writer.write(chunk)
+                yield from parser.feed(chunk)
+            yield from parser.close()
+        except BaseException:
+            # Malformed body, broken connection or a consumer that stopped early
+            if writer is not None:
+                writer.discard()
+            raise
+        finally:
+            # Release the connection even if the consumer stops early
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+        if writer is not None:
+            writer.commit()
+    
+    def get_law_by_mst(self, mst: str) -> Optional[Law]:
+        """Get a law's basic info by MST without a title search.
+        
+        Served from the same caches as get_law_content (memory, snapshot,
+        raw response), so the API is only called when none of them has the law.
+        """
+        law_content = self.get_law_content(mst)
+        if law_content is None:
+            return None
+        return Law.from_law_content(law_content)
+    
+    def load_law_content_snapshot(self, mst: str) -> Tuple[Optional[LawContent], Optional[CacheEntry]]:
+        """Load parsed content from its snapshot entry, if fresh and current."""
+        snapshot = self.load_from_cache(mst, self.ARTICLE_SNAPSHOT_CACHE_TYPE)
+        if not snapshot:
+            return None, None
+        
+        try:
+            law_content = self.law_content_class.from_snapshot(snapshot)
+        except (KeyError, TypeError, ValueError):
+            law_content = None
+        if law_content is None:
+            # Written by an older version, rebuild it from the raw response
+            return None, None
+        
+        law_content.from_cache = True
+        return law_content, self.cache_backend.get_entry(mst, self.ARTICLE_SNAPSHOT_CACHE_TYPE)
+    
+    def save_law_content_snapshot(self, mst: str, law_content: LawContent,
+                                  entry: Optional[CacheEntry] = None) -> float:
+        """Save the snapshot with the raw entry's timestamp so both expire together.
         
+        Returns:
+            The snapshot's timestamp
+        """
+        created_at = entry.created_at if entry is not None else time.time()
+        snapshot = law_content.to_snapshot()
+        self.cache_backend.set(mst, self.ARTICLE_SNAPSHOT_CACHE_TYPE, snapshot, created_at=created_at)
+        if isinstance(law_content, LazyLawContent):
+            # Unbuilt articles of a cold load hold their raw records until now
+            law_content.adopt_snapshot(snapshot)
+        # The index and mapped text of a replaced snapshot (e.g. an older
+        # layout) carry the same timestamp, so they would still look current
+        self.cache_backend.delete(mst, self.NGRAM_INDEX_CACHE_TYPE)
+        if self.article_store is not None:
+            self.article_store.delete(mst)
+        return created_at
+    
+    def prepare_law_content(self, mst: str, law_content: LawContent, created_at: float) -> None:
+        """Attach the search index and move article text to the mapped store.
+        
+        Args:
+            mst: Law master number
+            law_content: Freshly parsed or restored content
+            created_at: Timestamp of the snapshot the content belongs to
+        """
+        law_content.search_index = self._get_search_index(mst, law_content, created_at)
+        if self.article_store is not None:
+            # From snapshot rows, so unbuilt lazy articles are never built for this
+            articles = self.article_store.map_articles(mst, list(law_content.iter_snapshot_rows()), created_at)
+            if articles is not None:
+                law_content.articles = articles
+    
+    def _get_search_index(self, mst: str, law_content: LawContent, created_at: float) -> NgramIndex:
+        """Load the law's n-gram index, building and saving it when missing or stale."""
+        entry = self.cache_backend.get_entry(mst, self.NGRAM_INDEX_CACHE_TYPE)
+        if entry is not None and entry.created_at == created_at:
+            data = self.cache_backend.get(mst, self.NGRAM_INDEX_CACHE_TYPE)
+            index = NgramIndex.from_dict(data) if data else None
+            if index is not None and index.size == len(law_content.articles):
+                return index
+        
+        index = NgramIndex.build(law_content.scan_articles())
+        self.cache_backend.set(mst, self.NGRAM_INDEX_CACHE_TYPE, index.to_dict(), created_at=created_at)
+        return index
+    
+    def remember_law_content(self, mst: str, law_content: LawContent, entry: Optional[CacheEntry] = None) -> None:
+        """Keep parsed content in memory until its disk cache entry expires."""
+        ttl_seconds = None
+        if entry is not None:
+            ttl_seconds = max(0.0, entry.created_at + self.cache_hours * 3600 - time.time())
+        self.memory_cache.put(mst, law_content, ttl_seconds=ttl_seconds)
+    
+    def get_cached_law_msts(self) -> List[str]:
+        """Get the MSTs of every law with a fresh article snapshot."""
+        return sorted(self._cached_law_versions())
+    
+    def _cached_law_versions(self) -> Dict[str, float]:
+        """Snapshot timestamp of every law with a fresh article snapshot."""
+        oldest = time.time() - self.cache_hours * 3600
+        return {
+            entry.key: entry.created_at
+            for entry in self.cache_backend.entries(self.ARTICLE_SNAPSHOT_CACHE_TYPE)
+            if entry.created_at >= oldest
+        }
+    
+    def find_article_candidates(self, term: str) -> Optional[Dict[str, List[int]]]:
+        """Find cached articles that may contain the term using the corpus index."""
+        # Held through the lookup so a concurrent rebuild cannot unmap the index under it
+        with self._corpus_index_lock:
+            corpus_index = self.get_corpus_index()
+            grams = NgramIndex(corpus_index.n).grams(term)
+            if not grams:
+                return None
+            return corpus_index.candidates(grams)
+    
+    def get_corpus_index(self) -> CorpusIndexFile:
+        """Get the corpus-wide n-gram index, rebuilding it if the cached laws changed.
+        
+        The rebuild merges the per-law indexes, so only laws without an
+        up-to-date index are tokenized again.
+        """
+        with self._corpus_index_lock:
+            versions = self._cached_law_versions()
+            if self._corpus_index is None:
+                try:
+                    self._corpus_index = CorpusIndexFile(self.corpus_index_path)
+                    self._corpus_index_versions = self._corpus_index.law_versions()
+                except (OSError, ValueError):
+                    pass
+            
+            if self._corpus_index is None or self._corpus_index_versions != versions:
+                CorpusIndexFile.write(self.corpus_index_path, self._iter_law_indexes(versions))
+                if self._corpus_index is not None:
+                    self._corpus_index.close()  # Release the replaced file's mapping
+                self._corpus_index = CorpusIndexFile(self.corpus_index_path)
+                # Laws whose snapshot could not be read stay out of the index
+                # without triggering a rebuild on every lookup
+                self._corpus_index_versions = versions
+            return self._corpus_index
+    
+    def _iter_law_indexes(self, versions: Dict[str, float]):
+        """Yield (MST, law name, snapshot timestamp, NgramIndex) for cached laws."""
+        for mst in sorted(versions):
+            law_content, entry = self.load_law_content_snapshot(mst)
+            if law_content is None:
+                continue
+            index = self._get_search_index(mst, law_content, entry.created_at)
+            yield mst, law_content.law_name, entry.created_at, index
+    
+    def invalidate_law_content(self, mst: str, include_disk: bool = False) -> None:
+        """Drop a law's parsed content from memory (and optionally its disk cache)."""
+        self.memory_cache.invalidate(mst)
+        if include_disk:
+            if self.article_store is not None:
+                self.article_store.delete(mst)
+            self.cache_backend.delete(mst, self.NGRAM_INDEX_CACHE_TYPE)
+            self.cache_backend.delete(mst, self.ARTICLE_SNAPSHOT_CACHE_TYPE)
+            self.cache_backend.delete(mst, self.LAW_TEXT_CACHE_TYPE)
+    
+    def build_law_content(self, data: dict, from_cache: bool) -> Optional[LawContent]:
+        """Parse a lawService.do response into LawContent."""
         try:
-            law_content = LawContent.from_api_response(response)
+            law_content = self.law_content_class.from_api_response(data)
             if law_content:
-                law_content.from_cache = False  # Mark as from API
+                law_content.from_cache = from_cache  # Mark where the data came from
             return law_content
         except Exception:
             return None
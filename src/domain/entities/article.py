@@ -1,38 +1,95 @@
 """Law article entity."""
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, Optional, List
 import re
 
+from ..search.ngram_index import NgramIndex
+from .article_clause import ClauseOffsets, flatten_article_record, parse_clause_reference
+from .delegation_scanner import DelegationScanner
 
-@dataclass 
+ARTICLE_NUMBER_PATTERN = re.compile(r'^(제\d+조(?:의\d+)?)')
+FORMATTED_NUMBER_PATTERN = re.compile(r'^제(\d+)조(?:의(\d+))?')
+
+# Shared offsets of articles without any 항/호/목
+NO_CLAUSES = ClauseOffsets([], [], [])
+
+
+def normalize_article_number(article_number: str) -> str:
+    """Normalize article number to match between different formats.
+    
+    Handles conversions like:
+    - '1' -> '1'
+    - '1_2' -> '1_2' 
+    - '0001' -> '1'
+    - '0001_2' -> '1_2'
+    """
+    # Remove leading zeros
+    parts = article_number.split('_')
+    normalized_parts = []
+    for part in parts:
+        try:
+            # Convert to int to remove leading zeros, then back to string
+            normalized_parts.append(str(int(part)))
+        except ValueError:
+            # Keep as is if not a number
+            normalized_parts.append(part)
+    
+    return '_'.join(normalized_parts)
+
+
+@dataclass(slots=True)
 class Article:
-    """Domain entity representing a law article."""
+    """Domain entity representing a law article.
+    
+    Slotted to keep large laws compact. Derived values (article numbers,
+    delegation flags) are computed on first access and memoized, so treat
+    the fields as read-only once the article is built.
+    """
     
     article_number: str  # 조문번호
     article_title: Optional[str]  # 조문제목
     article_content: str  # 조문내용
     enforcement_date: Optional[str]  # 조문시행일자
     
-    # Common patterns for delegated law references
-    DELEGATION_PATTERNS = [
-        r'대통령령으로\s+정하[는다]',
-        r'대통령령으로\s+정한다',
-        r'기획재정부령으로\s+정하[는다]',
-        r'기획재정부령으로\s+정한다',
-        r'시행령으로\s+정하[는다]',
-        r'시행령으로\s+정한다',
-        r'시행규칙으로\s+정하[는다]',
-        r'시행규칙으로\s+정한다',
-    ]
+    # Memoized derived values, also restored from snapshots (None = not computed yet)
+    _formatted_number: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _normalized_number: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _has_delegation: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    _delegation_types: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+    # Built on first clause lookup, not restored from snapshots (empty = no clauses)
+    _clause_offsets: Optional[ClauseOffsets] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Shared delegation reference scanner (see configure_delegation_authorities)
+    DELEGATION_SCANNER = DelegationScanner()
+    
+    @classmethod
+    def configure_delegation_authorities(cls, extra: Dict[str, str]) -> DelegationScanner:
+        """Recognize extra authorities (e.g. {'총리령': '시행규칙'}) besides the defaults.
+        
+        Returns:
+            The scanner in use before, to hand back to restore_delegation_scanner
+        """
+        previous = cls.DELEGATION_SCANNER
+        cls.DELEGATION_SCANNER = DelegationScanner.with_extra_authorities(extra)
+        return previous
+    
+    @classmethod
+    def restore_delegation_scanner(cls, scanner: DelegationScanner) -> None:
+        """Put back a scanner returned by configure_delegation_authorities."""
+        cls.DELEGATION_SCANNER = scanner
     
     @property
     def formatted_number(self) -> str:
         """Get formatted article number from content or article_number."""
+        if self._formatted_number is None:
+            self._formatted_number = self._compute_formatted_number()
+        return self._formatted_number
+    
+    def _compute_formatted_number(self) -> str:
         # First try to extract from content (more accurate)
         if self.article_content:
-            import re
             # Match patterns like 제1조, 제1조의2, etc.
-            match = re.match(r'^(제\d+조(?:의\d+)?)', self.article_content.strip())
+            match = ARTICLE_NUMBER_PATTERN.match(self.article_content.strip())
             if match:
                 return match.group(1)
         
@@ -52,11 +109,16 @@ class Article:
         - 제1조의2 -> 1_2
         - article_number=1 with content 제1조의2 -> 1_2
         """
+        if self._normalized_number is None:
+            self._normalized_number = self._compute_normalized_number()
+        return self._normalized_number
+    
+    def _compute_normalized_number(self) -> str:
         # Try to extract from formatted number first
         formatted = self.formatted_number
         
         # Parse the formatted number
-        match = re.match(r'^제(\d+)조(?:의(\d+))?', formatted)
+        match = FORMATTED_NUMBER_PATTERN.match(formatted)
         if match:
             main_num = match.group(1)
             sub_num = match.group(2)
@@ -70,50 +132,72 @@ class Article:
     
     def has_delegated_law_references(self) -> bool:
         """Check if article contains references to delegated laws."""
-        for pattern in self.DELEGATION_PATTERNS:
-            if re.search(pattern, self.article_content):
-                return True
-        return False
+        if self._has_delegation is None:
+            self._scan_delegation_references()
+        return self._has_delegation
     
     def get_delegated_law_types(self) -> List[str]:
         """Extract types of delegated laws referenced in the article."""
-        types = []
-        if re.search(r'대통령령으로\s+정하', self.article_content):
-            types.append('시행령')
-        if re.search(r'기획재정부령으로\s+정하', self.article_content):
-            types.append('시행규칙')
-        if re.search(r'시행령으로\s+정하', self.article_content):
-            types.append('시행령')
-        if re.search(r'시행규칙으로\s+정하', self.article_content):
-            types.append('시행규칙')
-        return list(set(types))  # Remove duplicates
+        if self._delegation_types is None:
+            self._scan_delegation_references()
+        return list(self._delegation_types)
     
     def get_delegated_law_references(self) -> List[dict]:
-        """Extract detailed references to delegated laws."""
-        references = []
+        """Extract detailed references to delegated laws in text order.
         
-        # Extract specific pattern matches with context
-        for pattern in self.DELEGATION_PATTERNS:
-            matches = re.finditer(pattern, self.article_content)
-            for match in matches:
-                context_start = max(0, match.start() - 20)
-                context_end = min(len(self.article_content), match.end() + 20)
-                context = self.article_content[context_start:context_end]
-                
-                law_type = '시행령'  # Default
-                if '기획재정부령' in match.group():
-                    law_type = '시행규칙'
-                elif '시행규칙' in match.group():
-                    law_type = '시행규칙'
-                
-                references.append({
-                    'type': law_type,
-                    'text': match.group(),
-                    'context': context.strip()
-                })
+        Only the flag and types are memoized; the references themselves are
+        scanned again on every call, while the clause offsets are kept.
         
+        Returns:
+            List of {'type', 'text', 'context', 'start', 'clause'} dicts, where
+            clause is the 조항호목 label of the 항/호/목 holding the reference
+            ('' when it is outside any clause)
+        """
+        references = self._scan_delegation_references()
+        clauses = self.get_clause_offsets() if references else None
+        for ref in references:
+            position = clauses.locate(ref['start']) if clauses else None
+            ref['clause'] = clauses.label(position) if position is not None else ''
+        return references
+    
+    def _scan_delegation_references(self) -> List[dict]:
+        """Scan the content, memoizing the delegation flag and types (unique, in order)."""
+        references = self.DELEGATION_SCANNER.scan(self.article_content)
+        self._has_delegation = bool(references)
+        self._delegation_types = list(dict.fromkeys(ref['type'] for ref in references))
         return references
     
+    def get_clause_text(self, clause: str) -> Optional[str]:
+        """Slice one 항/호/목 (with everything below it) out of the content.
+        
+        Args:
+            clause: 조항호목 text such as '제3항제2호' or '제5조제1항가목'
+                (e.g. DelegatedLawItem.clause_text)
+        
+        Returns:
+            The clause text, or None if the article has no such clause
+        """
+        paragraph, item, sub_item = parse_clause_reference(clause)
+        if not (paragraph or item):
+            return None
+        clauses = self.get_clause_offsets()
+        span = clauses.span(paragraph, item, sub_item) if clauses else None
+        if span is None:
+            return None
+        return self.article_content[span[0]:span[1]]
+    
+    def clause_at(self, offset: int) -> Optional[str]:
+        """조항호목 label (e.g. '제3항제2호') of the innermost clause at a content offset."""
+        clauses = self.get_clause_offsets()
+        position = clauses.locate(offset) if clauses else None
+        return clauses.label(position) if position is not None else None
+    
+    def get_clause_offsets(self) -> ClauseOffsets:
+        """Offsets of the 항/호/목 in the content, found on first use and kept."""
+        if self._clause_offsets is None:
+            self._clause_offsets = ClauseOffsets.from_text(self.article_content) or NO_CLAUSES
+        return self._clause_offsets
+    
     @classmethod
     def from_api_response(cls, data: dict) -> 'Article':
         """Create Article from API response."""
@@ -122,55 +206,9 @@ class Article:
         if not article_title and data.get('조문여부') == '전문':
             article_title = 'Chapter/Section Header'
         
-        # Handle content that might be a list
-        content = data.get('조문내용', '')
-        if isinstance(content, list):
-            # If content is a list, join all parts
-            if content and isinstance(content[0], list):
-                # Nested list - join all parts of the first item
-                content = '\n'.join(content[0])
-            else:
-                # Simple list - join all items
-                content = '\n'.join(content)
+        # 조문내용 followed by the 항/호/목 lines
+        content, _ = flatten_article_record(data, build_tree=False)
         
-        # Check if there are paragraph units (항) with actual content
-        if '항' in data and isinstance(data['항'], list):
-            paragraph_content = []
-            for para in data['항']:
-                if isinstance(para, dict):
-                    # Add paragraph number and content
-                    para_text = para.get('항내용', '')
-                    if para_text:
-                        paragraph_content.append(para_text)
-                    
-                    # Add any sub-items (호)
-                    if '호' in para and isinstance(para['호'], list):
-                        for item in para['호']:
-                            if isinstance(item, dict):
-                                item_text = item.get('호내용', '')
-                                # Handle ho content that might be a list
-                                if isinstance(item_text, list):
-                                    if item_text and isinstance(item_text[0], list):
-                                        # Nested list - flatten it
-                                        item_text = '\n'.join(str(i) for sublist in item_text for i in sublist if i)
-                                    else:
-                                        item_text = '\n'.join(str(i) for i in item_text if i)
-                                
-                                if item_text:
-                                    paragraph_content.append(f"  {item_text}")
-            
-            # If we have paragraph content, use it (possibly in addition to title from 조문내용)
-            if paragraph_content:
-                if content and content.startswith('제'):
-                    # Article number as title - add all paragraph content
-                    full_content = [content] + paragraph_content
-                else:
-                    # Use content as is, append paragraph content
-                    full_content = [content] if content else []
-                    full_content.extend(paragraph_content)
-                
-                content = '\n'.join(str(item) for item in full_content)
-            
         return cls(
             article_number=str(data.get('조문번호', '')),
             article_title=article_title,
@@ -191,12 +229,190 @@ class LawContent:
     department: str  # 소관부처
     articles: List[Article]  # 조문목록
     from_cache: bool = False  # Whether data came from cache
+    search_index: Optional[NgramIndex] = field(default=None, repr=False, compare=False)  # Index over articles
+    # Article positions by formatted, normalized and raw number (see _build_number_index)
+    _number_index: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._build_number_index()
+    
+    def _build_number_index(self) -> None:
+        """Index article positions by formatted, normalized and raw number.
+        
+        Positions rather than Article objects are stored so the index stays
+        valid when the article list is swapped for equivalent articles.
+        """
+        by_formatted, by_normalized, by_number = {}, {}, {}
+        for position, (formatted, normalized, number) in enumerate(self._article_number_keys()):
+            by_formatted.setdefault(formatted, []).append(position)
+            by_normalized.setdefault(normalized, []).append(position)
+            by_number.setdefault(number, []).append(position)
+        self._number_index = (len(self.articles), by_formatted, by_normalized, by_number)
+    
+    def _article_number_keys(self):
+        """Yield (formatted, normalized, raw) number of every article in order."""
+        for article in self.articles:
+            yield article.formatted_number, article.normalized_number, article.article_number
+    
+    def _lookup(self, table: int, key: str) -> List[Article]:
+        """Articles stored under a key of one of the number indexes."""
+        if self._number_index is None or self._number_index[0] != len(self.articles):
+            self._build_number_index()
+        return [self.articles[position] for position in self._number_index[table].get(key, ())]
+    
+    def get_article_by_formatted_number(self, formatted_number: str) -> Optional[Article]:
+        """Get the first article with a formatted number such as 제1조의2."""
+        articles = self._lookup(1, formatted_number)
+        return articles[0] if articles else None
+    
+    def get_article_by_normalized_number(self, normalized_number: str) -> Optional[Article]:
+        """Get the first article with a normalized number such as 1_2."""
+        articles = self._lookup(2, normalized_number)
+        return articles[0] if articles else None
+    
+    def find_articles_by_number(self, article_number: str) -> List[Article]:
+        """Get every article with the raw API article number (조문번호)."""
+        return self._lookup(3, article_number)
+    
+    def get_search_index(self) -> NgramIndex:
+        """The n-gram index over the articles, built in memory if none is attached."""
+        if self.search_index is None or self.search_index.size != len(self.articles):
+            self.search_index = NgramIndex.build(self.scan_articles())
+        return self.search_index
+    
+    def scan_articles(self) -> Iterator[Article]:
+        """Iterate the articles for a one-off pass over the whole law (snapshot, index).
+        
+        LazyLawContent builds the articles it has not built yet without
+        keeping them.
+        """
+        return iter(self.articles)
+    
+    # Bump when the snapshot layout or article parsing changes
+    SNAPSHOT_VERSION = 5
+    SNAPSHOT_COLUMNS = (
+        'article_number', 'article_title', 'article_content', 'enforcement_date',
+        'formatted_number', 'normalized_number', 'has_delegation', 'delegation_types'
+    )
+    
+    def to_snapshot(self) -> dict:
+        """Flatten the parsed articles into a columnar snapshot.
+        
+        The snapshot holds the derived article fields too, so restoring it
+        skips both the API tree walk and the per-article regexes.
+        """
+        columns = {name: [] for name in self.SNAPSHOT_COLUMNS}
+        appends = [columns[name].append for name in self.SNAPSHOT_COLUMNS]
+        for row in self.iter_snapshot_rows():
+            for append, value in zip(appends, row):
+                append(value)
+        
+        return {
+            'version': self.SNAPSHOT_VERSION,
+            'delegation_authorities': Article.DELEGATION_SCANNER.key,
+            'law_name': self.law_name,
+            'law_id': self.law_id,
+            'mst': self.mst,
+            'promulgation_date': self.promulgation_date,
+            'enforcement_date': self.enforcement_date,
+            'department': self.department,
+            'articles': columns
+        }
+    
+    def iter_snapshot_rows(self) -> Iterator[tuple]:
+        """One row per article in SNAPSHOT_COLUMNS order, derived fields included."""
+        return (self.snapshot_row(article) for article in self.scan_articles())
+    
+    @staticmethod
+    def snapshot_row(article: Article) -> tuple:
+        """Snapshot row of one article (see SNAPSHOT_COLUMNS)."""
+        return (
+            article.article_number, article.article_title, article.article_content, article.enforcement_date,
+            article.formatted_number, article.normalized_number,
+            article.has_delegated_law_references(), article.get_delegated_law_types()
+        )
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> Optional['LawContent']:
+        """Restore LawContent from ``to_snapshot`` output.
+        
+        Returns:
+            LawContent, or None if the snapshot has an older layout or was
+            scanned with other delegation authorities
+        """
+        rows = cls._snapshot_rows(snapshot)
+        if rows is None:
+            return None
+        return cls._from_snapshot_metadata(snapshot, [cls._article_from_snapshot_row(row) for row in rows])
+    
+    @classmethod
+    def _snapshot_rows(cls, snapshot: dict) -> Optional[List[tuple]]:
+        """Article rows (in SNAPSHOT_COLUMNS order), or None if the snapshot is not current."""
+        if snapshot.get('version') != cls.SNAPSHOT_VERSION:
+            return None
+        if snapshot.get('delegation_authorities') != Article.DELEGATION_SCANNER.key:
+            return None
+        
+        columns = snapshot['articles']
+        return list(zip(*(columns[name] for name in cls.SNAPSHOT_COLUMNS)))
+    
+    @staticmethod
+    def _article_from_snapshot_row(row: tuple) -> Article:
+        """Rebuild one article, derived fields included, from a snapshot row."""
+        number, title, content, enforcement_date, formatted, normalized, has_delegation, types = row
+        article = Article(
+            article_number=number,
+            article_title=title,
+            article_content=content,
+            enforcement_date=enforcement_date
+        )
+        article._formatted_number = formatted
+        article._normalized_number = normalized
+        article._has_delegation = has_delegation
+        article._delegation_types = types
+        return article
+    
+    @classmethod
+    def _from_snapshot_metadata(cls, snapshot: dict, articles) -> 'LawContent':
+        return cls(
+            law_name=snapshot['law_name'],
+            law_id=snapshot['law_id'],
+            mst=snapshot['mst'],
+            promulgation_date=snapshot['promulgation_date'],
+            enforcement_date=snapshot['enforcement_date'],
+            department=snapshot['department'],
+            articles=articles
+        )
     
     @classmethod
     def from_api_response(cls, data: dict) -> 'LawContent':
         """Create LawContent from API response."""
+        law_info, records, law_key = cls._split_api_response(data)
+        return cls.from_records(law_info, records, law_key)
+    
+    @classmethod
+    def from_records(cls, law_info: dict, records: Iterable[dict], law_key: str = '') -> 'LawContent':
+        """Create LawContent from 기본정보, raw article records (조문단위) and 법령키."""
+        return cls.from_parts(law_info, cls.articles_from_records(records), law_key)
+    
+    @classmethod
+    def articles_from_records(cls, records: Iterable[dict]) -> List[Article]:
+        """Build the articles of raw 조문단위 records, one record at a time.
+        
+        Records may come from a generator (the streaming parser); each is
+        dropped once its Article is built.
+        """
+        return [Article.from_api_response(record) for record in records]
+    
+    @staticmethod
+    def _split_api_response(data: dict) -> tuple:
+        """Locate the law info, raw article records (조문단위) and 법령키 in a response.
+        
+        Returns:
+            (law_info, records, law_key)
+        """
         law_info = {}
-        articles = []
+        records = []
         
         # Handle different API response structures
         if isinstance(data, dict):
@@ -217,9 +433,9 @@ class LawContent:
                             if '조문단위' in article_container:
                                 articles_data = article_container['조문단위']
                                 if isinstance(articles_data, list):
-                                    articles = [Article.from_api_response(a) for a in articles_data if a]
+                                    records = [a for a in articles_data if a]
                                 elif isinstance(articles_data, dict):
-                                    articles = [Article.from_api_response(articles_data)]
+                                    records = [articles_data]
             elif 'law' in data:
                 if isinstance(data['law'], list) and data['law']:
                     law_info = data['law'][0]
@@ -229,7 +445,7 @@ class LawContent:
                 law_info = data
             
             # Extract articles from various possible locations if not already found
-            if not articles:
+            if not records:
                 articles_data = None
                 if '조문' in law_info:
                     article_container = law_info['조문']
@@ -242,17 +458,27 @@ class LawContent:
                 
                 if articles_data:
                     if isinstance(articles_data, list):
-                        articles = [Article.from_api_response(a) for a in articles_data if a]
+                        records = [a for a in articles_data if a]
                     elif isinstance(articles_data, dict):
-                        articles = [Article.from_api_response(articles_data)]
+                        records = [articles_data]
         
-        # Extract MST from 법령키 if available
-        mst = ''
+        law_key = ''
         if isinstance(data, dict) and '법령' in data and '법령키' in data['법령']:
             law_key = data['법령']['법령키']
+        
+        return law_info, records, law_key
+    
+    @classmethod
+    def from_parts(cls, law_info: dict, articles: List[Article], law_key: str = '') -> 'LawContent':
+        """Create LawContent from 기본정보, parsed articles and 법령키.
+        
+        Used by the streaming parser, which never holds the whole response.
+        """
+        # Extract MST from 법령키 if available
+        mst = ''
+        if law_key and len(law_key) >= 6:
             # Extract first 6 digits from 법령키 as MST
-            if len(law_key) >= 6:
-                mst = law_key[:6]
+            mst = law_key[:6]
         
         # Extract department info
         department = ''
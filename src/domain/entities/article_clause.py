@@ -0,0 +1,300 @@
+"""Flattening of an article's 항/호/목 structure."""
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# 항번호 ①-⑳, ㉑-㉟ and ㊱-㊿
+CIRCLED_NUMBERS = {
+    **{chr(0x2460 + n): str(n + 1) for n in range(20)},
+    **{chr(0x3251 + n): str(n + 21) for n in range(15)},
+    **{chr(0x32B1 + n): str(n + 36) for n in range(15)},
+}
+
+# 목번호 가-하, then 거-허
+SUB_ITEM_LETTERS = '가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허'
+
+# 항호목 part of references such as '제3조제1항제2호가목', '제2항', '제4호의2'.
+# The lookahead makes a match start at a 항, 호 or 목, never at an empty string.
+CLAUSE_REFERENCE_PATTERN = re.compile(
+    rf'(?=제\d+[항호]|[{SUB_ITEM_LETTERS}]목)'
+    rf'(?:제(\d+)항)?\s*(?:제(\d+)호(?:의(\d+))?)?\s*(?:([{SUB_ITEM_LETTERS}])목)?'
+)
+
+# First line of a 항 (①), 호 ('1.', '1의2.') or 목 ('가.') in flattened text.
+# flatten_article_record indents 호 lines by two spaces and 목 lines by four,
+# so unindented continuation lines never open a 호 or 목.
+CLAUSE_LINE_PATTERN = re.compile(
+    rf'^(?:[ \t]*([{"".join(CIRCLED_NUMBERS)}])|[ \t]{{2,}}(\d+)(?:의(\d+))?\.|[ \t]{{4,}}([{SUB_ITEM_LETTERS}])\.)',
+    re.MULTILINE
+)
+
+
+@dataclass(slots=True)
+class ArticleClause:
+    """One 항, 호 or 목 of an article with the clauses below it."""
+    
+    level: str  # '항', '호' or '목'
+    number: str  # 항번호/호번호/목번호 as given by the API (e.g. '①', '1.', '가.')
+    text: str  # Own text, without the clauses below it
+    children: List['ArticleClause'] = field(default_factory=list)
+
+
+class ClauseOffsets:
+    """Where each 항, 호 and 목 sits in an article's flattened text.
+    
+    Read back from the text flatten_article_record produces: a line opening
+    with ①, an indented '1.' (or '1의2.') or a further indented '가.' starts
+    a 항, 호 or 목, and any other line continues the clause above it. A
+    number only opens a clause when it comes after the previous one at its
+    level (①, ② / 1., 2., 2의2. / 가., 나.), so text that merely quotes a
+    numbered list is not split. Keys are '3', '3/2' and '3/2/가' for 제3항,
+    제3항제2호 and 제3항제2호가목; a 호 before any numbered 항 has an
+    empty 항 part ('/2').
+    
+    Article builds them from article_content on first use and keeps them,
+    so articles whose clauses are never sliced pay nothing for them. A
+    clause span covers everything below it (``text[start:end]``). A clause
+    is sliced by key with one dict lookup, and the clause around a text
+    offset is found by bisecting the start offsets.
+    """
+    
+    __slots__ = ('keys', 'starts', 'ends', '_positions')
+    
+    def __init__(self, keys: List[str], starts: List[int], ends: List[int]):
+        self.keys = keys
+        self.starts = starts
+        self.ends = ends
+        self._positions: Optional[Dict[str, int]] = None
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    @classmethod
+    def from_text(cls, text: str) -> Optional['ClauseOffsets']:
+        """Find the clauses of a flattened article text (None if it has none)."""
+        keys, starts, depths = [], [], []
+        parents = ['', '']  # Current 항 and 호 keys
+        last = [0, (0, 0), -1]  # Last 항, 호 and 목 number under the current parents
+        for match in CLAUSE_LINE_PATTERN.finditer(text or ''):
+            paragraph, item, item_branch, sub_item = match.groups()
+            if paragraph:
+                number = int(CIRCLED_NUMBERS[paragraph])
+                if number <= last[0]:
+                    continue
+                depth, key = 0, CIRCLED_NUMBERS[paragraph]
+                parents[0] = key
+                last = [number, (0, 0), -1]
+            elif item:
+                number = (int(item), int(item_branch or 0))
+                if number <= last[1]:
+                    continue
+                depth = 1
+                key = f"{parents[0]}/{item}" + (f"의{item_branch}" if item_branch else '')
+                parents[1] = key
+                last[1:] = [number, -1]
+            else:
+                number = SUB_ITEM_LETTERS.index(sub_item)
+                if number <= last[2]:
+                    continue
+                depth, key = 2, f"{parents[1]}/{sub_item}"
+                last[2] = number
+            keys.append(key)
+            starts.append(match.start())
+            depths.append(depth)
+        if not keys:
+            return None
+        
+        # A clause ends before the next clause at its depth or above (or at the end of the text)
+        ends = list(starts)
+        boundaries = [len(text)] * 3
+        for index in range(len(keys) - 1, -1, -1):
+            depth, start = depths[index], starts[index]
+            ends[index] = max(start, boundaries[depth])
+            for level in range(depth, 3):
+                boundaries[level] = start - 1
+        return cls(keys, starts, ends)
+    
+    @staticmethod
+    def make_key(paragraph: str = '', item: str = '', sub_item: str = '') -> str:
+        """Key of a clause from its normalized 항, 호 and 목 numbers."""
+        if sub_item:
+            return f"{paragraph}/{item}/{sub_item}"
+        if item:
+            return f"{paragraph}/{item}"
+        return paragraph
+    
+    def index(self, paragraph: str = '', item: str = '', sub_item: str = '') -> Optional[int]:
+        """Position of a clause, e.g. index('3', '2') for 제3항제2호.
+        
+        A 호/목 given without its 항 is also looked up under the first 항,
+        since 조항호목 often leaves out 제1항.
+        """
+        if self._positions is None:
+            self._positions = {key: position for position, key in enumerate(self.keys)}
+        position = self._positions.get(self.make_key(paragraph, item, sub_item))
+        if position is None and not paragraph and item:
+            first = self.keys[0].split('/', 1)[0]
+            position = self._positions.get(self.make_key(first, item, sub_item))
+        return position
+    
+    def span(self, paragraph: str = '', item: str = '', sub_item: str = '') -> Optional[Tuple[int, int]]:
+        """(start, end) of a clause in the flattened text, or None if it does not exist."""
+        position = self.index(paragraph, item, sub_item)
+        if position is None:
+            return None
+        return self.starts[position], self.ends[position]
+    
+    def locate(self, offset: int) -> Optional[int]:
+        """Position of the innermost clause containing a text offset."""
+        position = bisect_right(self.starts, offset) - 1
+        if position < 0 or offset >= self.ends[position]:
+            return None
+        return position
+    
+    def label(self, position: int) -> str:
+        """조항호목 label of a clause, e.g. '제3항제2호가목'."""
+        return format_clause_label(*self.keys[position].split('/'))
+
+
+def format_clause_label(paragraph: str = '', item: str = '', sub_item: str = '') -> str:
+    """'3', '2의2', '가' -> '제3항제2호의2가목'."""
+    label = f"제{paragraph}항" if paragraph else ''
+    if item:
+        main, _, branch = item.partition('의')
+        label += f"제{main}호" + (f"의{branch}" if branch else '')
+    if sub_item:
+        label += f"{sub_item}목"
+    return label
+
+
+def parse_clause_reference(text: str) -> Tuple[str, str, str]:
+    """Split 조항호목 text into normalized (항, 호, 목) numbers.
+    
+    '제3조제1항제2호가목' -> ('1', '2', '가'); parts that are not given are ''.
+    """
+    match = CLAUSE_REFERENCE_PATTERN.search(text or '')
+    if not match:
+        return '', '', ''
+    paragraph, item, item_branch, sub_item = match.groups()
+    if item and item_branch:
+        item = f"{item}의{item_branch}"
+    return paragraph or '', item or '', sub_item or ''
+
+
+def flatten_article_record(record: dict, build_tree: bool = True) -> Tuple[str, List[ArticleClause]]:
+    """Flatten a raw 조문단위 record into the article text and its clause tree.
+    
+    The text starts with 조문내용 followed by one line per 항, 호 and 목 in
+    document order; 호 lines are indented by two spaces and 목 lines by
+    four. Records without any clause text keep 조문내용 as is.
+    
+    The three levels are walked with plain nested loops and every line is
+    appended to one list that is joined once at the end.
+    
+    Args:
+        record: Raw 조문단위 element of a lawService.do response
+        build_tree: Also build the ArticleClause tree. One object per
+            clause makes this about twice as slow as the text alone, so
+            pass False when only the text is needed
+    
+    Returns:
+        (text, top-level 항 clauses); the list is empty when build_tree is False
+    """
+    content = record.get('조문내용', '')
+    if content.__class__ is list:
+        if content and isinstance(content[0], list):
+            # Nested list - the first item holds the article text
+            content = '\n'.join(content[0])
+        else:
+            content = '\n'.join(content)
+    
+    tree = []
+    paragraphs = record.get('항')
+    if not paragraphs:
+        return content, tree
+    
+    lines = [content] if content else []
+    head = len(lines)
+    append = lines.append
+    for paragraph in _units(paragraphs):
+        if paragraph.__class__ is not dict:
+            continue
+        text = paragraph.get('항내용', '')
+        if text.__class__ is not str:
+            text = _join_text(text)
+        if text:
+            append(text)
+        if build_tree:
+            number = paragraph.get('항번호')
+            item_nodes = []
+            tree.append(ArticleClause('항', number.strip() if number.__class__ is str else _number(number),
+                                      text, item_nodes))
+        
+        items = paragraph.get('호')
+        if not items:
+            continue
+        for item in _units(items):
+            if item.__class__ is not dict:
+                continue
+            text = item.get('호내용', '')
+            if text.__class__ is not str:
+                text = _join_text(text)
+            if text:
+                append('  ' + text)
+            if build_tree:
+                number = item.get('호번호')
+                sub_item_nodes = []
+                item_nodes.append(ArticleClause('호', number.strip() if number.__class__ is str else _number(number),
+                                                text, sub_item_nodes))
+            
+            sub_items = item.get('목')
+            if not sub_items:
+                continue
+            for sub_item in _units(sub_items):
+                if sub_item.__class__ is not dict:
+                    continue
+                text = sub_item.get('목내용', '')
+                if text.__class__ is not str:
+                    text = _join_text(text)
+                if text:
+                    append('    ' + text)
+                if build_tree:
+                    number = sub_item.get('목번호')
+                    sub_item_nodes.append(ArticleClause('목', number.strip() if number.__class__ is str else _number(number),
+                                                        text, []))
+    
+    if len(lines) == head:
+        # No clause text at all
+        return content, tree
+    return '\n'.join(lines), tree
+
+
+def _units(value):
+    """Clause units as a sequence (the API sends a single unit as a bare dict)."""
+    if value.__class__ is list:
+        return value
+    if value.__class__ is dict:
+        return (value,)
+    return ()
+
+
+def _number(value) -> str:
+    return value.strip() if value.__class__ is str else ('' if value is None else str(value))
+
+
+def _join_text(value) -> str:
+    """Join clause text given as a (possibly nested) list of lines."""
+    if not value:
+        return ''
+    if value.__class__ is not list:
+        return str(value)
+    first = value[0]
+    if first.__class__ is list:
+        if len(value) == 1 and len(first) == 1 and first[0].__class__ is str:
+            # [[line]], the usual shape of 목내용
+            return first[0]
+        return '\n'.join(str(line) for lines in value for line in lines if line)
+    if len(value) == 1 and first.__class__ is str:
+        return first
+    return '\n'.join(str(line) for line in value if line)
\ No newline at end of file
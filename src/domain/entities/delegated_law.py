@@ -1,12 +1,17 @@
 """Delegated law entity."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
+from .article import normalize_article_number
+
 
 @dataclass
 class DelegatedLawItem:
     """Single delegated law reference item."""
     
+    # Delegated types whose 일련번호 is not a 법령 MST (lawService.do cannot load them)
+    NON_LAW_TYPES = ('행정규칙', '자치법규')
+    
     # Delegated law info
     delegated_type: str  # 위임구분 (시행령, 시행규칙, 행정규칙, 자치법규)
     delegated_mst: str  # 위임법령일련번호
@@ -24,6 +29,11 @@ class DelegatedLawItem:
     article_number: str  # 조문번호 (from main law)
     article_title: Optional[str]  # 조문제목 (from main law)
     
+    @property
+    def has_law_mst(self) -> bool:
+        """Whether delegated_mst is a 법령 MST that can be loaded directly."""
+        return bool(self.delegated_mst) and self.delegated_type not in self.NON_LAW_TYPES
+    
     @property
     def law_url(self) -> Optional[str]:
         """Generate URL for viewing this delegated law on law.go.kr."""
@@ -61,6 +71,30 @@ class DelegatedLawResponse:
     administrative_rules: List[DelegatedLawItem]  # 위임 행정규칙 목록
     local_regulations: List[DelegatedLawItem]  # 위임 자치법규 목록
     
+    # Normalized source article number -> positions in all_delegated_items.
+    # Built once per response (or restored from the cache).
+    article_index: Optional[Dict[str, List[int]]] = field(default=None, repr=False, compare=False)
+    _items_by_article: Dict[str, List[DelegatedLawItem]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        items = self.all_delegated_items
+        if self.article_index is None:
+            self.article_index = self.build_article_index(items)
+        self._items_by_article = {
+            article_number: [items[position] for position in positions]
+            for article_number, positions in self.article_index.items()
+        }
+    
+    @staticmethod
+    def build_article_index(items: List[DelegatedLawItem]) -> Dict[str, List[int]]:
+        """Group item positions by normalized source article number."""
+        index = {}
+        for position, item in enumerate(items):
+            index.setdefault(normalize_article_number(item.article_number), []).append(position)
+        return index
+    
     @property
     def all_delegated_items(self) -> List[DelegatedLawItem]:
         """Get all delegated items regardless of type."""
@@ -69,7 +103,15 @@ class DelegatedLawResponse:
     @property
     def has_delegated_laws(self) -> bool:
         """Check if there are any delegated laws."""
-        return bool(self.all_delegated_items)
+        return bool(self.delegated_laws or self.administrative_rules or self.local_regulations)
+    
+    def get_items_for_article(self, article_number: str) -> List[DelegatedLawItem]:
+        """Get the delegated items of one main-law article.
+        
+        Args:
+            article_number: Article number in any format ('1', '0001', '1_2')
+        """
+        return list(self._items_by_article.get(normalize_article_number(article_number), ()))
     
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> 'DelegatedLawResponse':
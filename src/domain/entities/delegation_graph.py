@@ -0,0 +1,184 @@
+"""Graph of delegation links (위임) between articles across laws."""
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .article import normalize_article_number
+from .delegated_law import DelegatedLawItem, DelegatedLawResponse
+
+
+class DelegationGraph:
+    """Article-level delegation links: 법률 → 시행령 → 시행규칙 → 행정규칙.
+    
+    Nodes are articles identified by node_id(); edges run from the
+    delegating article to the delegated one and are kept as adjacency
+    lists in both directions, so "what does this article delegate to"
+    and "which articles delegate to this one" are both a dict lookup.
+    
+    Edges are grouped by the law whose DelegatedLawResponse produced
+    them (always the law of the edge's start node), so one law can be
+    replaced without rebuilding the rest of the graph.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self):
+        self.forward: Dict[str, List[str]] = {}
+        self.reverse: Dict[str, List[str]] = {}
+        # node id -> {'mst', 'article', 'law_name', 'law_type', 'article_title'}
+        self.nodes: Dict[str, dict] = {}
+        # Source law MST -> version (cache timestamp) of the response its edges came from
+        self.versions: Dict[str, float] = {}
+    
+    @staticmethod
+    def node_id(mst: str, article_number: str = '', law_type: str = '') -> str:
+        """Identify an article (or a whole law when article_number is empty).
+        
+        Args:
+            mst: Law MST (or 행정규칙/자치법규 일련번호)
+            article_number: Article number in any format ('5', '0005', '제5조', '5_2')
+            law_type: Delegated type; 행정규칙/자치법규 ids get their own namespace
+        """
+        article = article_number.replace('제', '').replace('조의', '_').replace('조', '').strip()
+        article = normalize_article_number(article) if article else ''
+        prefix = f"{law_type}/" if law_type in DelegatedLawItem.NON_LAW_TYPES else ''
+        return f"{prefix}{mst}:{article}"
+    
+    @classmethod
+    def target_node_id(cls, item: DelegatedLawItem) -> str:
+        """Node of the article an item delegates to."""
+        article = item.delegated_article_number or ''
+        if article and item.delegated_article_sub_number:
+            article = f"{article}_{item.delegated_article_sub_number}"
+        return cls.node_id(item.delegated_mst, article, item.delegated_type)
+    
+    def add_response(self, response: DelegatedLawResponse, version: float = 0.0,
+                     mst: Optional[str] = None) -> None:
+        """Add (or replace) the edges of one law's delegated response.
+        
+        Args:
+            response: Delegated laws of the law
+            version: Cache timestamp of the response, used by the incremental build
+            mst: MST the response was requested for (defaults to response.law_mst)
+        """
+        source = mst or response.law_mst
+        if source in self.versions:
+            self.remove_source(source)
+        self._set_node(self.node_id(source), source, '', response.law_name)
+        
+        for item in response.all_delegated_items:
+            if not item.delegated_mst:
+                # Nothing to identify the target by
+                continue
+            start = self.node_id(source, item.article_number)
+            end = self.target_node_id(item)
+            self._set_node(start, source, start.split(':', 1)[1], response.law_name,
+                           article_title=item.article_title)
+            self._set_node(end, item.delegated_mst, end.split(':', 1)[1], item.delegated_title,
+                           law_type=item.delegated_type, article_title=item.delegated_article_title)
+            self._add_edge(start, end)
+        
+        self.versions[source] = version
+    
+    def remove_source(self, mst: str) -> None:
+        """Drop every edge contributed by one law's delegated response."""
+        prefix = self.node_id(mst)
+        for start in [node for node in self.forward if node.startswith(prefix)]:
+            for end in self.forward.pop(start):
+                parents = self.reverse.get(end)
+                if parents is not None:
+                    parents.remove(start)
+                    if not parents:
+                        del self.reverse[end]
+        self.versions.pop(mst, None)
+        
+        # Forget nodes that no longer take part in any edge
+        for node in [node for node, info in self.nodes.items()
+                     if node not in self.forward and node not in self.reverse
+                     and not (info['article'] == '' and info['mst'] in self.versions)]:
+            del self.nodes[node]
+    
+    def children(self, node: str, max_depth: int = 1) -> List[Tuple[str, int]]:
+        """Articles the node delegates to, directly or up to max_depth levels down.
+        
+        Returns:
+            (node id, depth) pairs in breadth-first order
+        """
+        return self._traverse(self.forward, node, max_depth)
+    
+    def parents(self, node: str, max_depth: int = 1) -> List[Tuple[str, int]]:
+        """Articles delegating to the node, directly or up to max_depth levels up.
+        
+        Returns:
+            (node id, depth) pairs in breadth-first order
+        """
+        return self._traverse(self.reverse, node, max_depth)
+    
+    def node_info(self, node: str) -> Optional[dict]:
+        """Stored law name, type and article title of a node."""
+        return self.nodes.get(node)
+    
+    @property
+    def edge_count(self) -> int:
+        return sum(len(ends) for ends in self.forward.values())
+    
+    def _traverse(self, adjacency: Dict[str, List[str]], start: str, max_depth: int) -> List[Tuple[str, int]]:
+        """Breadth-first walk that visits every node once (delegation may loop)."""
+        found = []
+        seen = {start}
+        queue = deque([(start, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            if depth >= max_depth:
+                continue
+            for neighbour in adjacency.get(node, ()):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    found.append((neighbour, depth + 1))
+                    queue.append((neighbour, depth + 1))
+        return found
+    
+    def _add_edge(self, start: str, end: str) -> None:
+        ends = self.forward.setdefault(start, [])
+        if end not in ends:
+            ends.append(end)
+            self.reverse.setdefault(end, []).append(start)
+    
+    def _set_node(self, node: str, mst: str, article: str, law_name: str,
+                  law_type: str = '', article_title: Optional[str] = None) -> None:
+        """Record node details, keeping what other responses already filled in."""
+        info = self.nodes.setdefault(node, {
+            'mst': mst, 'article': article, 'law_name': '', 'law_type': '', 'article_title': ''
+        })
+        for key, value in (('law_name', law_name), ('law_type', law_type), ('article_title', article_title)):
+            if value and not info[key]:
+                info[key] = value
+    
+    def to_dict(self) -> dict:
+        """Serialize for persistence."""
+        return {
+            'version': self.VERSION,
+            'forward': self.forward,
+            'reverse': self.reverse,
+            'nodes': self.nodes,
+            'versions': self.versions,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional['DelegationGraph']:
+        """Restore a serialized graph, or None if it was written by another version."""
+        if not isinstance(data, dict) or data.get('version') != cls.VERSION:
+            return None
+        graph = cls()
+        graph.forward = data['forward']
+        graph.reverse = data['reverse']
+        graph.nodes = data['nodes']
+        graph.versions = data['versions']
+        return graph
+    
+    @classmethod
+    def build(cls, responses: Iterable[Tuple[DelegatedLawResponse, float]]) -> 'DelegationGraph':
+        """Build a graph from (response, version) pairs."""
+        graph = cls()
+        for response, version in responses:
+            graph.add_response(response, version)
+        return graph
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""Scanner for delegation references (위임 문구) in article text."""
+import re
+from typing import Dict, List, Optional
+
+
+class DelegationScanner:
+    """Finds every "<authority>으로 정하는/정한다" phrase in one pass.
+    
+    A single precompiled regex finds the shared "으로 정하는/정한다" tail,
+    and the word in front of it is matched against the configured
+    authorities by suffix (longest first). Adding authorities such as
+    총리령 or a ministry's 부령 therefore only adds a dict entry, not
+    another pass over the text.
+    """
+    
+    # Authority -> type of delegated law it refers to
+    DEFAULT_AUTHORITIES = {
+        '대통령령': '시행령',
+        '시행령': '시행령',
+        '기획재정부령': '시행규칙',
+        '시행규칙': '시행규칙',
+    }
+    
+    TAIL_PATTERN = re.compile(r'으로\s+정(?:하[는다]|한다)')
+    CONTEXT_CHARS = 20
+    
+    def __init__(self, authorities: Optional[Dict[str, str]] = None):
+        """Initialize the scanner.
+        
+        Args:
+            authorities: Authority -> delegated law type mapping (defaults
+                to DEFAULT_AUTHORITIES)
+        """
+        self.authorities = dict(authorities if authorities is not None else self.DEFAULT_AUTHORITIES)
+        # Distinct authority lengths, longest first, for the suffix lookup
+        self._lengths = sorted({len(name) for name in self.authorities}, reverse=True)
+    
+    @classmethod
+    def with_extra_authorities(cls, extra: Dict[str, str]) -> 'DelegationScanner':
+        """Scanner for the default authorities plus ``extra``."""
+        return cls({**cls.DEFAULT_AUTHORITIES, **extra})
+    
+    @property
+    def key(self) -> str:
+        """Stable identifier of the authority set, for invalidating stored results."""
+        return ','.join(f"{name}={law_type}" for name, law_type in sorted(self.authorities.items()))
+    
+    def _authority_before(self, text: str, end: int) -> Optional[str]:
+        """The configured authority ending at ``end``, if any."""
+        for length in self._lengths:
+            start = end - length
+            if start >= 0 and text[start:end] in self.authorities:
+                return text[start:end]
+        return None
+    
+    def scan(self, text: str) -> List[dict]:
+        """Find every delegation reference in the text, in order.
+        
+        Returns:
+            List of {'type', 'text', 'context', 'start'} dicts (start is the
+            offset of the reference in the text)
+        """
+        references = []
+        if not text:
+            return references
+        
+        for match in self.TAIL_PATTERN.finditer(text):
+            authority = self._authority_before(text, match.start())
+            if authority is None:
+                continue
+            
+            start = match.start() - len(authority)
+            context_start = max(0, start - self.CONTEXT_CHARS)
+            context_end = min(len(text), match.end() + self.CONTEXT_CHARS)
+            references.append({
+                'type': self.authorities[authority],
+                'text': text[start:match.end()],
+                'context': text[context_start:context_end].strip(),
+                'start': start
+            })
+        return references
\ No newline at end of file
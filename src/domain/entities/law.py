@@ -56,4 +56,17 @@ class Law:
             promulgation_number=data.get('공포번호'),
             law_id=data.get('법령ID'),
             detail_link=data.get('법령상세링크')
+        )
+    
+    @classmethod
+    def from_law_content(cls, law_content, law_type: str = '') -> 'Law':
+        """Create Law instance from parsed LawContent (which has no 법령구분)."""
+        return cls(
+            mst=law_content.mst,
+            name=law_content.law_name,
+            law_type=law_type,
+            department=law_content.department,
+            enforcement_date=law_content.enforcement_date,
+            promulgation_date=law_content.promulgation_date,
+            law_id=law_content.law_id
         )
\ No newline at end of file
@@ -0,0 +1,201 @@
+"""LawContent variant that builds Article objects on demand."""
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .article import Article, LawContent
+
+
+class LazyArticleList(Sequence):
+    """Read-only article sequence that builds each Article on first access.
+    
+    Holds one source item per article (a raw 조문단위 record or a snapshot
+    row) and turns it into an Article when the position is read by index,
+    slice or iteration. Built articles are kept and their source dropped,
+    so a fully read list holds the same data as a plain list.
+    """
+    
+    def __init__(self, sources: List, build: Callable[[object], Article],
+                 number_keys: Optional[Callable[[object], Optional[Tuple[str, str, str]]]] = None):
+        """Initialize the list.
+        
+        Args:
+            sources: One source item per article
+            build: Turns a source item into an Article
+            number_keys: Cheap (formatted, normalized, raw) article number of a
+                source item, or None when the article has to be built for it
+        """
+        self._sources = list(sources)
+        self._articles: List[Optional[Article]] = [None] * len(self._sources)
+        self._build = build
+        self._number_keys = number_keys
+    
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> 'LazyArticleList':
+        """Lazy list over raw API 조문단위 records."""
+        return cls(records, Article.from_api_response, _record_number_keys)
+    
+    @classmethod
+    def from_snapshot_rows(cls, rows: List[tuple]) -> 'LazyArticleList':
+        """Lazy list over LawContent snapshot rows."""
+        return cls(rows, LawContent._article_from_snapshot_row, _snapshot_row_number_keys)
+    
+    def __len__(self) -> int:
+        return len(self._articles)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('article index out of range')
+        return self._get(index)
+    
+    def __iter__(self) -> Iterator[Article]:
+        for index in range(len(self)):
+            yield self._get(index)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyArticleList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"LazyArticleList({self.built_count}/{len(self)} built)"
+    
+    def _get(self, index: int) -> Article:
+        article = self._articles[index]
+        if article is None:
+            article = self._build(self._sources[index])
+            self._articles[index] = article
+            self._sources[index] = None
+        return article
+    
+    @property
+    def built_count(self) -> int:
+        """Number of articles built so far."""
+        return sum(1 for article in self._articles if article is not None)
+    
+    def peek(self, index: int) -> Optional[Article]:
+        """The article at index if it has been built, without building it."""
+        return self._articles[index]
+    
+    def iter_transient(self) -> Iterator[Article]:
+        """Yield every article, building the unbuilt ones without keeping them.
+        
+        For one-off passes over the whole law (snapshot, search index) that
+        should leave the list as unbuilt as they found it.
+        """
+        for index, article in enumerate(self._articles):
+            yield article if article is not None else self._build(self._sources[index])
+    
+    def iter_snapshot_rows(self) -> Iterator[tuple]:
+        """Snapshot rows of every article; unbuilt snapshot-row sources are passed on as they are."""
+        from_row = self._build is LawContent._article_from_snapshot_row
+        for index, article in enumerate(self._articles):
+            if article is not None:
+                yield LawContent.snapshot_row(article)
+            elif from_row:
+                yield self._sources[index]
+            else:
+                yield LawContent.snapshot_row(self._build(self._sources[index]))
+    
+    def adopt_snapshot_rows(self, rows: List[tuple]) -> None:
+        """Swap the sources of the unbuilt articles for snapshot rows of the same articles."""
+        if len(rows) != len(self._sources):
+            return
+        self._sources = [row if article is None else None for article, row in zip(self._articles, rows)]
+        self._build = LawContent._article_from_snapshot_row
+        self._number_keys = _snapshot_row_number_keys
+    
+    def pending_sources(self) -> Iterator[object]:
+        """Source items of the articles not built yet."""
+        return (source for source in self._sources if source is not None)
+    
+    def number_keys(self, index: int) -> Tuple[str, str, str]:
+        """(formatted, normalized, raw) number of an article, building it only if needed."""
+        article = self._articles[index]
+        if article is None and self._number_keys is not None:
+            keys = self._number_keys(self._sources[index])
+            if keys is not None:
+                return keys
+        if article is None:
+            article = self._get(index)
+        return article.formatted_number, article.normalized_number, article.article_number
+
+
+def _record_number_keys(record: dict) -> Optional[Tuple[str, str, str]]:
+    """Article numbers of a raw record from its 조문번호 and the head of 조문내용.
+    
+    Article.from_api_response keeps a non-empty string 조문내용 at the start
+    of the flattened content, so the numbers derived from it are the same.
+    """
+    head = record.get('조문내용')
+    if not isinstance(head, str) or not head.strip():
+        return None
+    probe = Article(str(record.get('조문번호', '')), None, head, None)
+    return probe.formatted_number, probe.normalized_number, probe.article_number
+
+
+def _snapshot_row_number_keys(row: tuple) -> Tuple[str, str, str]:
+    """Article numbers stored in a snapshot row (see LawContent.SNAPSHOT_COLUMNS)."""
+    return row[4], row[5], row[0]
+
+
+@dataclass
+class LazyLawContent(LawContent):
+    """LawContent whose ``articles`` is a LazyArticleList.
+    
+    Metadata is available right away and the number lookups work from the
+    sources, so showing the header or one article only builds what is
+    shown. Snapshots, search indexes and mapped articles are built from
+    transient articles or the snapshot rows themselves (scan_articles,
+    iter_snapshot_rows), so a cold load does not build the list either.
+    Everything else (len, indexing, slicing, iteration) behaves like the
+    plain list of LawContent.
+    """
+    
+    def _article_number_keys(self):
+        articles = self.articles
+        if not isinstance(articles, LazyArticleList):
+            # Replaced by a plain list (e.g. memory-mapped articles)
+            yield from super()._article_number_keys()
+            return
+        for index in range(len(articles)):
+            yield articles.number_keys(index)
+    
+    def scan_articles(self) -> Iterator[Article]:
+        articles = self.articles
+        if not isinstance(articles, LazyArticleList):
+            return super().scan_articles()
+        return articles.iter_transient()
+    
+    def iter_snapshot_rows(self) -> Iterator[tuple]:
+        articles = self.articles
+        if not isinstance(articles, LazyArticleList):
+            return super().iter_snapshot_rows()
+        return articles.iter_snapshot_rows()
+    
+    def adopt_snapshot(self, snapshot: dict) -> None:
+        """Keep the unbuilt articles as rows of this content's own snapshot.
+        
+        Snapshot rows take about a third of the memory of the raw 조문단위
+        records a cold load starts from.
+        """
+        rows = self._snapshot_rows(snapshot)
+        if rows is not None and isinstance(self.articles, LazyArticleList):
+            self.articles.adopt_snapshot_rows(rows)
+    
+    @classmethod
+    def articles_from_records(cls, records: Iterable[dict]) -> LazyArticleList:
+        """Keep the article records (조문단위) unbuilt in a LazyArticleList."""
+        return LazyArticleList.from_records(records)
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> Optional['LazyLawContent']:
+        """Restore LazyLawContent from a LawContent snapshot, keeping the rows."""
+        rows = cls._snapshot_rows(snapshot)
+        if rows is None:
+            return None
+        return cls._from_snapshot_metadata(snapshot, LazyArticleList.from_snapshot_rows(rows))
\ No newline at end of file
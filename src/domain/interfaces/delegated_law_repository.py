@@ -2,6 +2,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 from ..entities.delegated_law import DelegatedLawResponse
+from ..entities.delegation_graph import DelegationGraph
 
 
 class DelegatedLawRepository(ABC):
@@ -13,7 +14,7 @@ class DelegatedLawRepository(ABC):
         
         Args:
             mst: Law master number
-            
+        
         Returns:
             DelegatedLawResponse if found, None otherwise
         """
@@ -25,7 +26,7 @@ class DelegatedLawRepository(ABC):
         
         Args:
             mst: Law master number
-            
+        
         Returns:
             DelegatedLawResponse if cached, None otherwise
         """
@@ -47,8 +48,17 @@ class DelegatedLawRepository(ABC):
         
         Args:
             mst: Law master number
-            
+        
         Returns:
             True if cache is valid, False otherwise
         """
+        raise NotImplementedError
+    
+    @abstractmethod
+    def get_delegation_graph(self) -> DelegationGraph:
+        """Get the delegation graph built from every cached law.
+        
+        Returns:
+            DelegationGraph covering the delegated-law cache
+        """
         raise NotImplementedError
\ No newline at end of file
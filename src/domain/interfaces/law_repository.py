@@ -1,6 +1,6 @@
 """Repository interface for law data access."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ..entities.law import Law
 from ..entities.article import LawContent, Article
 
@@ -18,11 +18,41 @@ class LawRepositoryInterface(ABC):
         """Get full text of a law by MST."""
         pass
     
+    @abstractmethod
+    def is_law_cached(self, mst: str) -> bool:
+        """Check whether a law's content is cached (in memory or on disk), without loading it."""
+        pass
+    
+    @abstractmethod
+    def has_cached_law_text(self, mst: str) -> bool:
+        """Check whether the full text of a law is cached, without loading it."""
+        pass
+    
     @abstractmethod
     def get_law_content(self, mst: str) -> Optional[LawContent]:
         """Get law content with articles."""
         pass
     
+    @abstractmethod
+    def get_law_by_mst(self, mst: str) -> Optional[Law]:
+        """Get a law's basic info by MST without a title search."""
+        pass
+    
+    @abstractmethod
+    def get_cached_law_msts(self) -> List[str]:
+        """Get the MSTs of every law with parsed content in the cache."""
+        pass
+    
+    @abstractmethod
+    def find_article_candidates(self, term: str) -> Optional[Dict[str, List[int]]]:
+        """Find cached articles that may contain the term using the corpus index.
+        
+        Returns:
+            Article positions by MST (to be verified against the text), or
+            None if the term is too short for the index
+        """
+        pass
+    
     @abstractmethod
     def get_law_article(self, mst: str, article_number: str) -> Optional[Article]:
         """Get specific article of a law."""
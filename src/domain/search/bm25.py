@@ -0,0 +1,78 @@
+"""BM25 relevance ranking over n-gram tokens."""
+import heapq
+import math
+from typing import Iterable, List, Optional, Tuple
+
+from .ngram_index import NgramIndex
+
+
+class BM25Ranker:
+    """Okapi BM25 scoring of articles using the n-grams of an ``NgramIndex``.
+    
+    The query is tokenized into the same character n-grams as the index, so
+    document frequencies come straight from the posting lists. Occurrences
+    in the article title are weighted above occurrences in the body.
+    """
+    
+    # A match in the article title counts as much as this many in the body
+    TITLE_WEIGHT = 3.0
+    
+    def __init__(self, index: NgramIndex, k1: float = 1.2, b: float = 0.75, title_weight: float = TITLE_WEIGHT):
+        self.index = index
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.average_length = index.average_length or 1.0
+    
+    def idf(self, document_frequency: int) -> float:
+        """Inverse document frequency (never negative)."""
+        n = self.index.size
+        return math.log(1 + (n - document_frequency + 0.5) / (document_frequency + 0.5))
+    
+    def score(self, terms: List[Tuple[str, float]], doc_id: int, title: str, content: str) -> float:
+        """Score one document.
+        
+        Args:
+            terms: (token, idf) pairs of the query
+            doc_id: Document id in the index (for its length)
+            title: Lowercased article title
+            content: Lowercased article content
+        """
+        length = self.index.lengths[doc_id] if doc_id < len(self.index.lengths) else len(title) + len(content)
+        norm = self.k1 * (1 - self.b + self.b * length / self.average_length)
+        
+        score = 0.0
+        for token, idf in terms:
+            tf = self.title_weight * title.count(token) + content.count(token)
+            if tf:
+                score += idf * tf * (self.k1 + 1) / (tf + norm)
+        return score
+    
+    def top_k(self, term: str, documents: Iterable[Tuple[int, object]], k: int,
+              match_count: Optional[int] = None) -> List[Tuple[float, int]]:
+        """Rank documents for a query and keep the best k.
+        
+        Args:
+            term: Query text
+            documents: (doc_id, article) pairs to rank
+            k: Number of results to keep
+            match_count: Document frequency to use when the query is shorter
+                than one n-gram (defaults to every document matching)
+        
+        Returns:
+            (score, doc_id) pairs, best first
+        """
+        term = term.lower()
+        grams = self.index.grams(term)
+        if grams:
+            terms = [(gram, self.idf(self.index.document_frequency(gram))) for gram in grams]
+        else:
+            terms = [(term, self.idf(match_count if match_count is not None else self.index.size))]
+        
+        scored = (
+            (self.score(terms, doc_id, (article.article_title or '').lower(), (article.article_content or '').lower()),
+             -doc_id)
+            for doc_id, article in documents
+        )
+        # Ties keep article order (lower doc_id first)
+        return [(score, -neg_id) for score, neg_id in heapq.nlargest(k, scored)]
\ No newline at end of file
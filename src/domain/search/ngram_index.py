@@ -0,0 +1,113 @@
+"""Character n-gram inverted index over law articles."""
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class NgramIndex:
+    """Inverted index from character n-grams to article positions.
+    
+    Korean text has no reliable word boundaries, so the index is keyed by
+    overlapping character n-grams (bigrams by default): a partial term such
+    as 세율 or 복식 matches wherever its n-grams occur. Lookups intersect
+    the posting lists, which yields candidates only - callers verify the
+    actual substring match on the few articles left.
+    """
+    
+    # Bump when the index layout or tokenization changes
+    VERSION = 2
+    
+    def __init__(self, n: int = 2):
+        self.n = n
+        self.postings: Dict[str, List[int]] = {}  # n-gram -> sorted document ids
+        self.size = 0  # Number of documents added
+        self.lengths: List[int] = []  # Characters per document, for length normalization
+    
+    def grams(self, text: str) -> Set[str]:
+        """Distinct n-grams of the lowercased text."""
+        text = (text or '').lower()
+        n = self.n
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+    
+    def add(self, *texts: str) -> int:
+        """Index one document made of the given texts.
+        
+        Returns:
+            The document id (documents are numbered in the order added)
+        """
+        doc_id = self.size
+        grams = set()
+        for text in texts:
+            grams |= self.grams(text)
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(doc_id)
+        self.lengths.append(sum(len(text or '') for text in texts))
+        self.size += 1
+        return doc_id
+    
+    @property
+    def average_length(self) -> float:
+        """Average document length in characters."""
+        return sum(self.lengths) / self.size if self.size else 0.0
+    
+    def document_frequency(self, gram: str) -> int:
+        """Number of documents containing the n-gram."""
+        return len(self.postings.get(gram, ()))
+    
+    @classmethod
+    def build(cls, articles: Iterable, n: int = 2) -> 'NgramIndex':
+        """Index article titles and contents; document ids are list positions."""
+        index = cls(n)
+        for article in articles:
+            index.add(article.article_title or '', article.article_content or '')
+        return index
+    
+    def candidates(self, term: str) -> Optional[List[int]]:
+        """Documents that contain every n-gram of the term.
+        
+        Returns:
+            Sorted document ids, or None when the term is too short to use
+            the index (the caller has to scan every document)
+        """
+        grams = self.grams(term)
+        if not grams:
+            return None
+        
+        postings = []
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        
+        # Intersect starting from the rarest n-gram
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result.intersection_update(posting)
+            if not result:
+                break
+        return sorted(result)
+    
+    def to_dict(self) -> dict:
+        """Serialize the index for the cache."""
+        return {
+            'version': self.VERSION,
+            'n': self.n,
+            'size': self.size,
+            'lengths': self.lengths,
+            'postings': self.postings
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional['NgramIndex']:
+        """Restore an index from ``to_dict`` output.
+        
+        Returns:
+            NgramIndex, or None if it was written with an older layout
+        """
+        if data.get('version') != cls.VERSION:
+            return None
+        index = cls(data['n'])
+        index.size = data['size']
+        index.lengths = data['lengths']
+        index.postings = data['postings']
+        return index
\ No newline at end of file
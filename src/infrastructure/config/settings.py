@@ -1,6 +1,7 @@
 """Application settings."""
 import os
 from dataclasses import dataclass
+from typing import Dict
 
 
 @dataclass
@@ -14,10 +15,68 @@ class Settings:
     output_dir: str = os.getenv('LAW_OUTPUT_DIR', 'output')
     default_display_count: int = 20
     
+    # Cache storage: 'file' (one JSON file per key) or 'sqlite' (single database file)
+    cache_backend: str = os.getenv('LAW_CACHE_BACKEND', 'file')
+    # Empty means cache.sqlite3 in the law cache directory under output_dir
+    cache_db_path: str = os.getenv('LAW_CACHE_DB_PATH', '')
+    delegated_cache_dir: str = os.getenv('LAW_DELEGATED_CACHE_DIR', os.path.join('.cache', 'delegated_laws'))
+    cache_ttl_days: int = int(os.getenv('LAW_CACHE_TTL_DAYS', '7'))
+    # Encoding of new cache entries: json, json-pretty, gzip, zstd or msgpack
+    cache_format: str = os.getenv('LAW_CACHE_FORMAT', 'json')
+    
+    # In-memory cache of parsed laws
+    memory_cache_entries: int = int(os.getenv('LAW_MEMORY_CACHE_ENTRIES', '32'))
+    memory_cache_mb: int = int(os.getenv('LAW_MEMORY_CACHE_MB', '256'))
+    
+    # Article text storage: 'memory' (Python strings) or 'mmap' (shared memory-mapped files)
+    article_storage: str = os.getenv('LAW_ARTICLE_STORAGE', 'memory')
+    # Empty means articles/ in the law cache directory
+    article_store_dir: str = os.getenv('LAW_ARTICLE_STORE_DIR', '')
+    # Build Article objects when first read instead of when a law is loaded
+    lazy_articles: bool = os.getenv('LAW_LAZY_ARTICLES', 'false').lower() in ('1', 'true', 'yes')
+    
+    # HTTP connection pool
+    http_pool_connections: int = int(os.getenv('LAW_HTTP_POOL_CONNECTIONS', '4'))
+    http_pool_maxsize: int = int(os.getenv('LAW_HTTP_POOL_MAXSIZE', '10'))
+    http_keep_alive: bool = os.getenv('LAW_HTTP_KEEP_ALIVE', 'true').lower() in ('1', 'true', 'yes')
+    http_connect_timeout: float = float(os.getenv('LAW_HTTP_CONNECT_TIMEOUT', '5'))
+    http_read_timeout: float = float(os.getenv('LAW_HTTP_READ_TIMEOUT', '30'))
+    
+    # Async client concurrency limits
+    async_max_concurrency: int = int(os.getenv('LAW_ASYNC_MAX_CONCURRENCY', '20'))
+    async_per_host_limit: int = int(os.getenv('LAW_ASYNC_PER_HOST_LIMIT', '8'))
+    
+    # Delegated laws of one article resolved in parallel
+    delegated_fetch_workers: int = int(os.getenv('LAW_DELEGATED_FETCH_WORKERS', '4'))
+    
+    # Extra delegation authorities besides 대통령령/기획재정부령/시행령/시행규칙,
+    # as "authority:type" pairs, e.g. "총리령:시행규칙,해양수산부령:시행규칙"
+    delegation_authorities: str = os.getenv('LAW_DELEGATION_AUTHORITIES', '')
+    
     # API URLs
     search_api_url: str = "http://www.law.go.kr/DRF/lawSearch.do"
     service_api_url: str = "http://www.law.go.kr/DRF/lawService.do"
     
+    def get_delegation_authorities(self) -> Dict[str, str]:
+        """Parse delegation_authorities into an authority -> type mapping."""
+        authorities = {}
+        for pair in self.delegation_authorities.split(','):
+            name, _, law_type = pair.partition(':')
+            if name.strip():
+                authorities[name.strip()] = law_type.strip() or '시행규칙'
+        return authorities
+    
+    def __post_init__(self):
+        if not self.cache_db_path:
+            self.cache_db_path = os.path.join(self.cache_dir, 'cache.sqlite3')
+        if not self.article_store_dir:
+            self.article_store_dir = os.path.join(self.cache_dir, 'articles')
+    
+    @property
+    def cache_dir(self) -> str:
+        """Directory of the law cache (file-per-key entries, default SQLite database and article store)."""
+        return os.path.join(self.output_dir, '.cache')
+    
     @classmethod
     def from_env(cls) -> 'Settings':
         """Create settings from environment variables."""
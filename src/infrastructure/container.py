@@ -1,12 +1,23 @@
 """Dependency injection container."""
+from typing import Any, Dict, List, Optional
 from .config.settings import Settings
+from ..domain.entities.article import Article
 from ..data.api.law_api_client import LawAPIClient
-from ..data.repositories.law_repository import LawRepository
+from ..data.cache.cache_backend import CacheBackend
+from ..data.cache.file_cache_backend import FileCacheBackend
+from ..data.cache.sqlite_cache_backend import SQLiteCacheBackend
+from ..data.cache.memory_cache import LRUCache
+from ..data.cache.mmap_article_store import MmapArticleStore
+from ..data.cache.serializers import CacheSerializer
+from ..data.repositories.law_repository import LawRepository, estimate_law_content_size
 from ..data.repositories.delegated_law_repository import DelegatedLawRepositoryImpl
 from ..use_cases.search_law import SearchLawUseCase
 from ..use_cases.get_law_full_text import GetLawFullTextUseCase
 from ..use_cases.view_law_articles import ViewLawArticlesUseCase
 from ..use_cases.view_delegated_laws import ViewDelegatedLawsUseCase
+from ..use_cases.prefetch_corpus import PrefetchCorpusUseCase
+from ..use_cases.search_corpus import CorpusSearchUseCase
+from ..use_cases.export_delegation_tree import ExportDelegationTreeUseCase
 from ..presentation.cli.controller import CLIController
 
 
@@ -15,27 +26,167 @@ class Container:
     
     def __init__(self):
         self.settings = Settings.from_env()
+        # Article's scanner is shared by the whole process; close() puts the previous one back
+        self._previous_delegation_scanner = Article.configure_delegation_authorities(
+            self.settings.get_delegation_authorities()
+        )
         self._api_client = None
+        self._sqlite_cache_backend = None
+        self._article_store = None
+        self._cache_serializer = None
+        self._async_api_client = None
+        self._async_repository = None
+        self._async_delegated_law_repository = None
         self._repository = None
         self._delegated_law_repository = None
         self._search_use_case = None
         self._full_text_use_case = None
         self._view_articles_use_case = None
         self._view_delegated_laws_use_case = None
+        self._prefetch_use_case = None
+        self._corpus_search_use_case = None
+        self._export_delegation_tree_use_case = None
         self._cli_controller = None
     
+    def close(self) -> None:
+        """Release resources owned by the container (pooled HTTP connections, mapped files).
+        
+        Also restores the delegation scanner that was in use before the
+        container configured its authorities.
+        """
+        if self._api_client is not None:
+            self._api_client.close()
+        if self._sqlite_cache_backend is not None:
+            self._sqlite_cache_backend.close()
+        if self._article_store is not None:
+            self._article_store.close()
+        if self._previous_delegation_scanner is not None:
+            Article.restore_delegation_scanner(self._previous_delegation_scanner)
+            self._previous_delegation_scanner = None
+    
+    async def aclose(self) -> None:
+        """Release resources including the async client's connections."""
+        if self._async_api_client is not None:
+            await self._async_api_client.close()
+        self.close()
+    
+    def load_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Counters of the parsed-law memory cache and the request coalescing.
+        
+        Flights of repositories that were never created are left out.
+        """
+        stats = {}
+        if self._repository is not None:
+            stats['memory_cache'] = self._repository.memory_cache.stats()
+            stats['law_content'] = self._repository.law_content_flight.stats()
+        if self._delegated_law_repository is not None:
+            stats['delegated_laws'] = self._delegated_law_repository.delegated_flight.stats()
+        if self._async_repository is not None:
+            stats['async_law_content'] = self._async_repository.law_content_flight.stats()
+        if self._async_delegated_law_repository is not None:
+            stats['async_delegated_laws'] = self._async_delegated_law_repository.delegated_flight.stats()
+        return stats
+    
+    def __enter__(self) -> 'Container':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     @property
     def api_client(self) -> LawAPIClient:
         """Get API client instance."""
         if self._api_client is None:
-            self._api_client = LawAPIClient(self.settings.email_id)
+            self._api_client = LawAPIClient(
+                self.settings.email_id,
+                pool_connections=self.settings.http_pool_connections,
+                pool_maxsize=self.settings.http_pool_maxsize,
+                keep_alive=self.settings.http_keep_alive,
+                connect_timeout=self.settings.http_connect_timeout,
+                read_timeout=self.settings.http_read_timeout
+            )
         return self._api_client
     
+    @property
+    def async_api_client(self):
+        """Get asyncio API client instance (requires aiohttp)."""
+        if self._async_api_client is None:
+            from ..data.api.async_law_api_client import AsyncLawAPIClient
+            self._async_api_client = AsyncLawAPIClient(
+                self.settings.email_id,
+                max_concurrency=self.settings.async_max_concurrency,
+                per_host_limit=self.settings.async_per_host_limit,
+                connect_timeout=self.settings.http_connect_timeout,
+                read_timeout=self.settings.http_read_timeout
+            )
+        return self._async_api_client
+    
+    @property
+    def cache_serializer(self) -> CacheSerializer:
+        """Get the serializer for new cache entries."""
+        if self._cache_serializer is None:
+            self._cache_serializer = CacheSerializer(self.settings.cache_format)
+        return self._cache_serializer
+    
+    @property
+    def sqlite_cache_backend(self) -> SQLiteCacheBackend:
+        """Get the shared SQLite cache backend instance."""
+        if self._sqlite_cache_backend is None:
+            self._sqlite_cache_backend = SQLiteCacheBackend(
+                self.settings.cache_db_path,
+                serializer=self.cache_serializer
+            )
+        return self._sqlite_cache_backend
+    
+    @property
+    def law_cache_dir(self) -> str:
+        """Directory of the file-per-key law cache."""
+        return self.settings.cache_dir
+    
+    def file_cache_backends(self) -> List[FileCacheBackend]:
+        """File-per-key backends for the law and delegated-law caches."""
+        return [
+            FileCacheBackend(self.law_cache_dir, LawRepository.CACHE_FILENAMES, self.cache_serializer),
+            FileCacheBackend(
+                self.settings.delegated_cache_dir,
+                DelegatedLawRepositoryImpl.CACHE_FILENAMES,
+                self.cache_serializer
+            )
+        ]
+    
+    def _cache_backend(self, file_backend: FileCacheBackend) -> CacheBackend:
+        """Pick the configured cache backend."""
+        if self.settings.cache_backend == 'sqlite':
+            return self.sqlite_cache_backend
+        return file_backend
+    
+    @property
+    def article_store(self) -> Optional[MmapArticleStore]:
+        """Get the shared memory-mapped article store, if article_storage is 'mmap'."""
+        if self.settings.article_storage != 'mmap':
+            return None
+        if self._article_store is None:
+            self._article_store = MmapArticleStore(self.settings.article_store_dir)
+        return self._article_store
+    
     @property
     def repository(self) -> LawRepository:
         """Get repository instance."""
         if self._repository is None:
-            self._repository = LawRepository(self.api_client, self.settings.output_dir)
+            self._repository = LawRepository(
+                self.api_client,
+                self.settings.output_dir,
+                cache_hours=self.settings.cache_ttl_days * 24,
+                cache_backend=self._cache_backend(self.file_cache_backends()[0]),
+                memory_cache=LRUCache(
+                    max_entries=self.settings.memory_cache_entries,
+                    max_bytes=self.settings.memory_cache_mb * 1024 * 1024,
+                    ttl_seconds=self.settings.cache_ttl_days * 24 * 3600,
+                    sizeof=estimate_law_content_size
+                ),
+                article_store=self.article_store,
+                lazy_articles=self.settings.lazy_articles
+            )
         return self._repository
     
     @property
@@ -44,11 +195,31 @@ class Container:
         if self._delegated_law_repository is None:
             self._delegated_law_repository = DelegatedLawRepositoryImpl(
                 self.api_client, 
-                cache_dir='.cache/delegated_laws',
-                cache_ttl_days=7
+                cache_dir=self.settings.delegated_cache_dir,
+                cache_ttl_days=self.settings.cache_ttl_days,
+                cache_backend=self._cache_backend(self.file_cache_backends()[1])
             )
         return self._delegated_law_repository
     
+    @property
+    def async_repository(self):
+        """Get async law repository facade."""
+        if self._async_repository is None:
+            from ..data.repositories.async_law_repository import AsyncLawRepository
+            self._async_repository = AsyncLawRepository(self.repository, self.async_api_client)
+        return self._async_repository
+    
+    @property
+    def async_delegated_law_repository(self):
+        """Get async delegated law repository facade."""
+        if self._async_delegated_law_repository is None:
+            from ..data.repositories.async_law_repository import AsyncDelegatedLawRepository
+            self._async_delegated_law_repository = AsyncDelegatedLawRepository(
+                self.delegated_law_repository,
+                self.async_api_client
+            )
+        return self._async_delegated_law_repository
+    
     @property
     def search_use_case(self) -> SearchLawUseCase:
         """Get search use case instance."""
@@ -76,10 +247,40 @@ class Container:
         if self._view_delegated_laws_use_case is None:
             self._view_delegated_laws_use_case = ViewDelegatedLawsUseCase(
                 self.delegated_law_repository,
-                self.repository
+                self.repository,
+                max_workers=self.settings.delegated_fetch_workers
             )
         return self._view_delegated_laws_use_case
     
+    @property
+    def prefetch_use_case(self) -> PrefetchCorpusUseCase:
+        """Get prefetch corpus use case instance."""
+        if self._prefetch_use_case is None:
+            self._prefetch_use_case = PrefetchCorpusUseCase(
+                self.repository,
+                self.delegated_law_repository
+            )
+        return self._prefetch_use_case
+    
+    @property
+    def corpus_search_use_case(self) -> CorpusSearchUseCase:
+        """Get corpus search use case instance."""
+        if self._corpus_search_use_case is None:
+            self._corpus_search_use_case = CorpusSearchUseCase(self.repository)
+        return self._corpus_search_use_case
+    
+    @property
+    def export_delegation_tree_use_case(self) -> ExportDelegationTreeUseCase:
+        """Get delegation tree export use case instance."""
+        if self._export_delegation_tree_use_case is None:
+            self._export_delegation_tree_use_case = ExportDelegationTreeUseCase(
+                self.repository,
+                self.delegated_law_repository,
+                self.view_delegated_laws_use_case,
+                output_dir=self.settings.output_dir
+            )
+        return self._export_delegation_tree_use_case
+    
     @property
     def cli_controller(self) -> CLIController:
         """Get CLI controller instance."""
@@ -88,6 +289,9 @@ class Container:
                 self.search_use_case,
                 self.full_text_use_case,
                 self.view_articles_use_case,
-                self.view_delegated_laws_use_case
+                self.view_delegated_laws_use_case,
+                self.prefetch_use_case,
+                self.corpus_search_use_case,
+                self.export_delegation_tree_use_case
             )
         return self._cli_controller
\ No newline at end of file
@@ -6,24 +6,24 @@ from .infrastructure.container import Container
 
 def main():
     """Main application entry point."""
-    container = Container()
-    controller = container.cli_controller
-    
-    # Parse command line arguments
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
+    with Container() as container:
+        controller = container.cli_controller
         
-        if command == 'full-text' and len(sys.argv) > 2:
-            # Get full text mode
-            mst = sys.argv[2]
-            controller.get_full_text(mst)
+        # Parse command line arguments
+        if len(sys.argv) > 1:
+            command = sys.argv[1]
+            
+            if command == 'full-text' and len(sys.argv) > 2:
+                # Get full text mode
+                mst = sys.argv[2]
+                controller.get_full_text(mst)
+            else:
+                # Direct search mode
+                query = ' '.join(sys.argv[1:])
+                controller.run_direct_search(query)
         else:
-            # Direct search mode
-            query = ' '.join(sys.argv[1:])
-            controller.run_direct_search(query)
-    else:
-        # Interactive mode
-        controller.run_interactive_search()
+            # Interactive mode
+            controller.run_interactive_search()
 
 
 if __name__ == "__main__":
@@ -1,34 +1,16 @@
 """Cache information display utility."""
-import os
 from datetime import datetime
 
 
-def get_cache_info(cache_dir: str) -> dict:
-    """Get information about the cache directory."""
-    if not os.path.exists(cache_dir):
-        return {
-            'exists': False,
-            'files': 0,
-            'size': 0,
-            'oldest': None,
-            'newest': None
-        }
+def get_cache_info(cache_backend) -> dict:
+    """Get information about a cache backend.
     
-    files = []
-    total_size = 0
+    Args:
+        cache_backend: Any CacheBackend (file-per-key or SQLite)
+    """
+    stats = cache_backend.stats()
     
-    for filename in os.listdir(cache_dir):
-        filepath = os.path.join(cache_dir, filename)
-        if os.path.isfile(filepath):
-            stat = os.stat(filepath)
-            files.append({
-                'name': filename,
-                'size': stat.st_size,
-                'mtime': stat.st_mtime
-            })
-            total_size += stat.st_size
-    
-    if not files:
+    if not stats['entries']:
         return {
             'exists': True,
             'files': 0,
@@ -37,14 +19,22 @@ def get_cache_info(cache_dir: str) -> dict:
             'newest': None
         }
     
+    files = [
+        {
+            'name': f"{entry.cache_type}:{entry.key}",
+            'size': entry.size,
+            'mtime': entry.created_at
+        }
+        for entry in cache_backend.entries()
+    ]
     files.sort(key=lambda x: x['mtime'])
     
     return {
         'exists': True,
-        'files': len(files),
-        'size': total_size,
-        'oldest': datetime.fromtimestamp(files[0]['mtime']),
-        'newest': datetime.fromtimestamp(files[-1]['mtime']),
+        'files': stats['entries'],
+        'size': stats['size'],
+        'oldest': datetime.fromtimestamp(stats['oldest']),
+        'newest': datetime.fromtimestamp(stats['newest']),
         'file_list': files
     }
 
@@ -58,9 +48,9 @@ def format_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} TB"
 
 
-def display_cache_info(cache_dir: str) -> None:
+def display_cache_info(cache_backend) -> None:
     """Display cache information."""
-    info = get_cache_info(cache_dir)
+    info = get_cache_info(cache_backend)
     
     if not info['exists']:
         print("캐시 디렉토리가 존재하지 않습니다.")
@@ -1,10 +1,15 @@
 """Controller for CLI application."""
+import json
 import os
+from typing import Optional
 from .menu_presenter import MenuPresenter
 from ...use_cases.search_law import SearchLawUseCase
 from ...use_cases.get_law_full_text import GetLawFullTextUseCase
 from ...use_cases.view_law_articles import ViewLawArticlesUseCase
 from ...use_cases.view_delegated_laws import ViewDelegatedLawsUseCase
+from ...use_cases.prefetch_corpus import PrefetchCorpusUseCase
+from ...use_cases.search_corpus import CorpusSearchUseCase
+from ...use_cases.export_delegation_tree import ExportDelegationTreeUseCase
 from ...domain.entities.article import Article, LawContent
 
 
@@ -14,11 +19,17 @@ class CLIController:
     def __init__(self, search_use_case: SearchLawUseCase, 
                  full_text_use_case: GetLawFullTextUseCase,
                  view_articles_use_case: ViewLawArticlesUseCase,
-                 view_delegated_laws_use_case: ViewDelegatedLawsUseCase):
+                 view_delegated_laws_use_case: ViewDelegatedLawsUseCase,
+                 prefetch_use_case: Optional[PrefetchCorpusUseCase] = None,
+                 corpus_search_use_case: Optional[CorpusSearchUseCase] = None,
+                 export_delegation_tree_use_case: Optional[ExportDelegationTreeUseCase] = None):
         self.search_use_case = search_use_case
         self.full_text_use_case = full_text_use_case
         self.view_articles_use_case = view_articles_use_case
         self.view_delegated_laws_use_case = view_delegated_laws_use_case
+        self.prefetch_use_case = prefetch_use_case
+        self.corpus_search_use_case = corpus_search_use_case
+        self.export_delegation_tree_use_case = export_delegation_tree_use_case
         self.presenter = MenuPresenter()
     
     def run_interactive_search(self):
@@ -109,21 +120,92 @@ class CLIController:
         else:
             self.presenter.display_error("법령 전문을 가져올 수 없습니다.")
     
+    def run_prefetch(self, entries_file: str, abbreviations_file: Optional[str] = None,
+                     workers: int = 4, include_delegated: bool = True, restart: bool = False):
+        """Warm the caches for every law listed in a file.
+        
+        The file holds one MST or law name per line ('#' starts a comment).
+        Finished entries are recorded in a checkpoint file next to it so an
+        interrupted run resumes where it stopped.
+        """
+        try:
+            with open(entries_file, 'r', encoding='utf-8') as f:
+                entries = [line.split('#', 1)[0].strip() for line in f]
+            entries = [entry for entry in entries if entry]
+        except OSError as e:
+            self.presenter.display_error(f"목록 파일을 읽을 수 없습니다: {e}")
+            return
+        
+        abbreviations = None
+        if abbreviations_file:
+            try:
+                with open(abbreviations_file, 'r', encoding='utf-8') as f:
+                    abbreviations = json.load(f)
+            except (OSError, ValueError) as e:
+                self.presenter.display_error(f"약칭 파일을 읽을 수 없습니다: {e}")
+                return
+        
+        checkpoint_file = f"{entries_file}.checkpoint.json"
+        completed = {}
+        if not restart and os.path.exists(checkpoint_file):
+            try:
+                with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                    completed = json.load(f).get('completed', {})
+            except (OSError, ValueError):
+                completed = {}
+        
+        pending = [entry for entry in entries if entry not in completed]
+        if completed:
+            self.presenter.display_success(f"체크포인트에서 재개: {len(completed)}개 완료, {len(pending)}개 남음")
+        if not pending:
+            self.presenter.display_success("모든 항목이 이미 캐시되었습니다.")
+            return
+        
+        def on_progress(result, done, total):
+            self.presenter.display_prefetch_progress(result, done, total)
+            if result.success:
+                completed[result.entry] = result.mst
+                with open(checkpoint_file, 'w', encoding='utf-8') as f:
+                    json.dump({'completed': completed}, f, ensure_ascii=False)
+        
+        results = self.prefetch_use_case.execute(
+            pending,
+            abbreviations=abbreviations,
+            workers=workers,
+            include_delegated=include_delegated,
+            on_progress=on_progress
+        )
+        self.presenter.display_prefetch_summary(results)
+        
+        # A fully successful run does not need to be resumed
+        if all(result.success for result in results) and os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
+    
+    def run_corpus_search(self, term: str, max_hits_per_law: int = 5):
+        """Search every cached law for articles containing a term."""
+        results = self.corpus_search_use_case.execute(term)
+        if not results:
+            self.presenter.display_error(f"캐시된 법령에서 '{term}'을(를) 찾을 수 없습니다.")
+            return
+        self.presenter.display_corpus_search_results(results, term, max_hits_per_law)
+    
+    def run_delegation_tree_export(self, mst: str, output_path: Optional[str] = None):
+        """Export the resolved delegations of every article of a law as JSONL."""
+        self.presenter.display_success(f"MST {mst}의 위임법령 트리를 내보내는 중...")
+        resolution_before = self.view_delegated_laws_use_case.get_resolution_stats()
+        export = self.export_delegation_tree_use_case.execute(mst, output_path)
+        if export is None:
+            self.presenter.display_error(f"MST {mst}의 조문을 가져올 수 없습니다.")
+            return
+        self.presenter.display_delegation_tree_export(export)
+        self.presenter.display_resolution_stats(self._resolution_stats_since(resolution_before))
+    
     def view_law_articles(self, mst: str, law_name: str):
         """View law articles interactively."""
-        # Check if cached data exists (using new filename format)
-        cache_file = os.path.join('output', '.cache', f'article-list_{mst}.json')
-        # Also check old filename format for backward compatibility
-        old_cache_file = os.path.join('output', '.cache', f'law_content_{mst}.json')
-        
         print("\n" + "="*50)  # Add separator
-        used_cache_file = None
-        if os.path.exists(cache_file):
-            self.presenter.display_success(f"'{law_name}' 조문 정보 가져오는 중... (캐시: article-list_{mst}.json)")
-            used_cache_file = cache_file
-        elif os.path.exists(old_cache_file):
-            self.presenter.display_success(f"'{law_name}' 조문 정보 가져오는 중... (캐시: law_content_{mst}.json)")
-            used_cache_file = old_cache_file
+        # Whichever cache backend and format is configured
+        if self.view_articles_use_case.is_law_cached(mst):
+            self.presenter.display_success(f"'{law_name}' 조문 정보 가져오는 중... (캐시)")
         else:
             self.presenter.display_success(f"'{law_name}' 조문 정보 가져오는 중...")
         
@@ -148,14 +230,13 @@ class CLIController:
                 article_num = self.presenter.get_article_number()
                 # Search in the already loaded articles, excluding chapter headers
                 matching_articles = [
-                    a for a in law_content.articles 
-                    if a.article_number == article_num 
-                    and a.article_title != "Chapter/Section Header"
+                    a for a in law_content.find_articles_by_number(article_num)
+                    if a.article_title != "Chapter/Section Header"
                 ]
                 
                 if len(matching_articles) == 1:
                     # Single match, show it directly
-                    self.presenter.display_article_content(matching_articles[0], law_content.from_cache, used_cache_file)
+                    self.presenter.display_article_content(matching_articles[0], law_content.from_cache)
                     # Ask if user wants to see delegated laws
                     self._prompt_for_delegated_laws(matching_articles[0], mst, law_content)
                 elif len(matching_articles) > 1:
@@ -168,7 +249,7 @@ class CLIController:
                     try:
                         index = int(selection) - 1
                         if 0 <= index < len(matching_articles):
-                            self.presenter.display_article_content(matching_articles[index], law_content.from_cache, used_cache_file)
+                            self.presenter.display_article_content(matching_articles[index], law_content.from_cache)
                             # Ask if user wants to see delegated laws
                             self._prompt_for_delegated_laws(matching_articles[index], mst, law_content)
                         else:
@@ -180,9 +261,12 @@ class CLIController:
             elif choice == '3':
                 # Search by keyword
                 keyword = self.presenter.get_search_keyword()
-                results = self.view_articles_use_case.search_articles(law_content, keyword)
+                # Most relevant first, so common terms do not push them past the list limit
+                results, ranked = self.view_articles_use_case.search_and_rank_articles(law_content, keyword)
                 if results:
-                    self.presenter.display_article_list(results)
+                    self.presenter.display_article_list(ranked)
+                    if len(results) > len(ranked):
+                        self.presenter.display_success(f"관련도 상위 {len(ranked)}개 표시 (총 {len(results)}개 조문)")
                     # Save search results
                     success = self.view_articles_use_case.save_article_search_results(
                         results, law_content.law_name, keyword
@@ -221,34 +305,39 @@ class CLIController:
                 article_num = self.presenter.get_article_number()
                 
                 # Get article with delegated content
+                resolution_before = self.view_delegated_laws_use_case.get_resolution_stats()
                 result = self.view_delegated_laws_use_case.get_delegated_laws_for_article(
                     mst, article_num, law_content
                 )
                 
                 if result and result.get('primary_article'):
                     self.presenter.display_article_with_delegated_content(result)
+                    self.presenter.display_resolution_stats(self._resolution_stats_since(resolution_before))
                 else:
                     self.presenter.display_error(f"조문 {article_num}을(를) 찾을 수 없습니다.")
             elif choice == '2':
                 # List all articles with delegated law references
-                articles_with_delegated = [
-                    article for article in law_content.articles 
-                    if article.has_delegated_law_references()
-                ]
+                articles_with_delegated = self.view_delegated_laws_use_case.get_articles_with_delegated_references(
+                    law_content
+                )
                 
                 if articles_with_delegated:
-                    self.presenter.display_articles_with_delegated_references(law_content.articles)
+                    self.presenter.display_articles_with_delegated_references(articles_with_delegated)
                     
                     # Let user select an article to view
                     try:
                         selection = input("\n조문 번호를 선택하세요 (0: 뒤로가기): ").strip()
                         if selection != '0':
                             article_num = selection
+                            resolution_before = self.view_delegated_laws_use_case.get_resolution_stats()
                             result = self.view_delegated_laws_use_case.get_delegated_laws_for_article(
                                 mst, article_num, law_content
                             )
                             if result and result.get('primary_article'):
                                 self.presenter.display_article_with_delegated_content(result)
+                                self.presenter.display_resolution_stats(
+                                    self._resolution_stats_since(resolution_before)
+                                )
                             else:
                                 self.presenter.display_error(f"조문을 찾을 수 없습니다.")
                     except Exception:
@@ -258,6 +347,11 @@ class CLIController:
             else:
                 self.presenter.display_error("잘못된 선택입니다.")
     
+    def _resolution_stats_since(self, before: dict) -> dict:
+        """MST / title search / unresolved counts added since ``before``."""
+        after = self.view_delegated_laws_use_case.get_resolution_stats()
+        return {outcome: after[outcome] - before.get(outcome, 0) for outcome in after}
+    
     def _prompt_for_delegated_laws(self, article, mst: str, law_content):
         """Prompt user to view delegated laws for the article."""
         if article.has_delegated_law_references():
@@ -265,12 +359,14 @@ class CLIController:
             choice = input("위임 법령 내용을 보시겠습니까? (y/N): ").strip().lower()
             
             if choice == 'y':
+                resolution_before = self.view_delegated_laws_use_case.get_resolution_stats()
                 result = self.view_delegated_laws_use_case.get_delegated_laws_for_article(
                     mst, article.article_number, law_content
                 )
                 
                 if result and result.get('delegated_content'):
                     self.presenter.display_article_with_delegated_content(result)
+                    self.presenter.display_resolution_stats(self._resolution_stats_since(resolution_before))
                 else:
                     self.presenter.display_error("위임 법령 내용을 찾을 수 없습니다.")
     
@@ -111,6 +111,60 @@ class MenuPresenter:
                 return law_name
         return None
     
+    @staticmethod
+    def display_prefetch_progress(result, done: int, total: int):
+        """Display progress of a prefetch run."""
+        name = result.law_name or result.entry
+        if result.skipped:
+            status = "중복(건너뜀)"
+        elif result.success:
+            status = "완료"
+        else:
+            status = f"실패: {result.error}"
+        mst = f" (MST {result.mst})" if result.mst else ""
+        print(f"[{done}/{total}] {name}{mst} - {status}")
+    
+    @staticmethod
+    def display_prefetch_summary(results: list):
+        """Display summary of a prefetch run."""
+        succeeded = sum(1 for r in results if r.success)
+        failed = [r for r in results if not r.success]
+        print(f"\n=== 캐시 미리 가져오기 완료 ===")
+        print(f"성공: {succeeded}개, 실패: {len(failed)}개")
+        for result in failed:
+            print(f"  - {result.entry}: {result.error}")
+    
+    @staticmethod
+    def display_delegation_tree_export(export):
+        """Display summary of a delegation tree export."""
+        print(f"\n=== {export.law_name} 위임법령 트리 ===")
+        print(f"조문: {export.articles}개, 위임 항목: {export.delegations}개 (미확인 {export.unresolved}개)")
+        print(f"저장 위치: {export.path}")
+    
+    @staticmethod
+    def display_resolution_stats(stats: dict):
+        """Display how the delegated laws of the last view or export were found."""
+        if not any(stats.values()):
+            return
+        print(f"위임법령 확인: MST {stats['mst']}건, 제목 검색 {stats['search']}건, 실패 {stats['unresolved']}건")
+    
+    @staticmethod
+    def display_corpus_search_results(results: list, term: str, max_hits_per_law: int = 5):
+        """Display corpus search hits grouped by law."""
+        total = sum(len(result.hits) for result in results)
+        print(f"\n=== '{term}' 검색 결과: {len(results)}개 법령, {total}개 조문 ===")
+        for result in results:
+            print(f"\n[{result.law_name}] (MST {result.mst}) - {len(result.hits)}개 조문")
+            for hit in result.hits[:max_hits_per_law]:
+                article = hit.article
+                content = ' '.join(article.article_content.split())
+                start = max(0, content.lower().find(term.lower()) - 20)
+                snippet = content[start:start + 60]
+                title = f" {article.article_title}" if article.article_title else ""
+                print(f"  {article.formatted_number}{title}: ...{snippet}...")
+            if len(result.hits) > max_hits_per_law:
+                print(f"  ... 외 {len(result.hits) - max_hits_per_law}개 조문")
+    
     @staticmethod
     def display_law_content_menu(law_content: LawContent):
         """Display law content with options."""
@@ -230,7 +284,8 @@ class MenuPresenter:
         if result['has_delegated_references']:
             print("\n위임 법령 참조:")
             for ref in result['delegated_references']:
-                print(f"  - {ref['type']}: \"{ref['context']}\"")
+                clause = f" ({ref['clause']})" if ref.get('clause') else ''
+                print(f"  - {ref['type']}{clause}: \"{ref['context']}\"")
         
         # Display delegated content
         if result['delegated_content']:
@@ -241,6 +296,12 @@ class MenuPresenter:
                 print(f"\n\n=== {law.name} 관련 조문 ===")
                 print(f"법령구분: {law.law_type}")
                 print(f"시행일: {law.enforcement_date}")
+                if delegated_item.get('resolved_by') == 'search':
+                    print("(일련번호가 없어 법령명 검색으로 찾은 결과입니다)")
+                source_clause = delegated_item.get('source_clause')
+                if source_clause:
+                    print(f"\n위임 조항: {primary_article.formatted_number}{source_clause['label']}")
+                    print(source_clause['text'])
                 
                 for article in articles:
                     print(f"\n{article.formatted_number}")
@@ -0,0 +1,148 @@
+"""Use case for exporting the delegation tree of every article of a law."""
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+from ..domain.interfaces.delegated_law_repository import DelegatedLawRepository
+from ..domain.interfaces.law_repository import LawRepositoryInterface
+from ..domain.entities.article import Article, LawContent
+from ..domain.entities.delegated_law import DelegatedLawItem, DelegatedLawResponse
+from .view_delegated_laws import ViewDelegatedLawsUseCase
+
+
+@dataclass
+class DelegationTreeExport:
+    """Summary of a finished export."""
+    
+    law_name: str
+    path: str
+    articles: int  # Records written (one per article, chapter headers excluded)
+    delegations: int  # Delegated items across all articles
+    unresolved: int  # Delegated items whose law could not be loaded
+
+
+class ExportDelegationTreeUseCase:
+    """Use case for resolving the delegations of a whole law in one batch.
+    
+    lsDelegated is fetched once, every distinct 시행령/시행규칙/행정규칙 is
+    loaded once (concurrently, through ViewDelegatedLawsUseCase), and the
+    articles are joined in memory. Records are written one JSON line per
+    article as they are built, so the output never sits in memory as a
+    whole. Chapter/section headers are left out: their 조문번호 repeats the
+    number of the article that follows, so they would pick up its
+    delegations a second time.
+    """
+    
+    def __init__(self, law_repository: LawRepositoryInterface,
+                 delegated_law_repository: DelegatedLawRepository,
+                 view_delegated_laws_use_case: ViewDelegatedLawsUseCase,
+                 output_dir: str = 'output'):
+        self.law_repository = law_repository
+        self.delegated_law_repository = delegated_law_repository
+        self.view_delegated_laws_use_case = view_delegated_laws_use_case
+        self.output_dir = output_dir
+    
+    def execute(self, mst: str, output_path: Optional[str] = None) -> Optional[DelegationTreeExport]:
+        """Export the delegation tree of a law as JSONL.
+        
+        Args:
+            mst: Law master number
+            output_path: Target file (defaults to {output_dir}/{law name}_위임법령.jsonl)
+        
+        Returns:
+            Export summary, or None if the law could not be loaded
+        """
+        law_content = self.law_repository.get_law_content(mst)
+        if law_content is None:
+            return None
+        
+        if output_path is None:
+            output_path = os.path.join(self.output_dir, f"{law_content.law_name.replace(' ', '_')}_위임법령.jsonl")
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        summary = DelegationTreeExport(law_name=law_content.law_name, path=output_path,
+                                       articles=0, delegations=0, unresolved=0)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for record in self.iter_records(mst, law_content):
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write('\n')
+                summary.articles += 1
+                summary.delegations += len(record['delegations'])
+                summary.unresolved += sum(1 for d in record['delegations'] if d['resolved_by'] is None)
+        return summary
+    
+    def iter_records(self, mst: str, law_content: Optional[LawContent] = None) -> Iterator[Dict]:
+        """Yield one record per article with its resolved delegations.
+        
+        Args:
+            mst: Law master number
+            law_content: Already loaded content of the law
+        
+        Yields:
+            Dicts with the article's number, title and 'delegations', each
+            delegation holding the target law and its matching articles
+            (chapter headers are skipped)
+        """
+        if law_content is None:
+            law_content = self.law_repository.get_law_content(mst)
+            if law_content is None:
+                return
+        
+        delegated_response = self.delegated_law_repository.get_delegated_laws(mst)
+        if delegated_response is not None and delegated_response.has_delegated_laws:
+            resolved = self.view_delegated_laws_use_case.resolve_delegated_laws(
+                delegated_response.all_delegated_items
+            )
+        else:
+            resolved = {}
+        
+        for article in law_content.articles:
+            if article.article_title == "Chapter/Section Header":
+                continue
+            yield self._build_record(mst, law_content, article, delegated_response, resolved)
+    
+    def _build_record(self, mst: str, law_content: LawContent, article: Article,
+                      delegated_response: Optional[DelegatedLawResponse], resolved: Dict) -> Dict:
+        """Join one article with its delegated items and their target articles."""
+        items = delegated_response.get_items_for_article(article.normalized_number) if delegated_response else []
+        return {
+            'law_mst': mst,
+            'law_name': law_content.law_name,
+            'article_number': article.article_number,
+            'formatted_number': article.formatted_number,
+            'article_title': article.article_title,
+            'delegation_types': article.get_delegated_law_types(),
+            'delegations': [self._build_delegation(article, item, resolved) for item in items]
+        }
+    
+    def _build_delegation(self, article: Article, item: DelegatedLawItem, resolved: Dict) -> Dict:
+        """Describe one delegated item, its source clause and the articles it resolved to."""
+        content = self.view_delegated_laws_use_case.get_delegated_content(item, resolved)
+        source_clause = self.view_delegated_laws_use_case.get_source_clause(article, item)
+        delegation = {
+            'type': item.delegated_type,
+            'mst': item.delegated_mst,
+            'title': item.delegated_title,
+            'article_number': item.delegated_article_number,
+            'clause': item.clause_text,
+            'clause_content': source_clause['text'] if source_clause else None,
+            'resolved_by': None,
+            'law_name': None,
+            'articles': []
+        }
+        if content:
+            delegation['resolved_by'] = content['resolved_by']
+            delegation['law_name'] = content['law'].name
+            delegation['articles'] = [self._serialize_article(a) for a in content['articles']]
+        return delegation
+    
+    @staticmethod
+    def _serialize_article(article: Article) -> Dict:
+        return {
+            'article_number': article.article_number,
+            'formatted_number': article.formatted_number,
+            'article_title': article.article_title,
+            'article_content': article.article_content
+        }
\ No newline at end of file
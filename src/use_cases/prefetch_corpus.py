@@ -0,0 +1,119 @@
+"""Use case for warming the caches for a whole corpus of laws."""
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+from ..domain.interfaces.law_repository import LawRepositoryInterface
+from ..domain.interfaces.delegated_law_repository import DelegatedLawRepository
+from .search_law import SearchLawUseCase
+
+
+@dataclass
+class PrefetchResult:
+    """Outcome of prefetching a single entry."""
+    
+    entry: str  # MST or law name as given
+    mst: Optional[str] = None
+    law_name: Optional[str] = None
+    success: bool = False
+    skipped: bool = False  # Another entry already resolved to the same MST
+    error: Optional[str] = None
+
+
+class PrefetchCorpusUseCase:
+    """Use case for filling the search, full-text and delegated-law caches."""
+    
+    def __init__(self, law_repository: LawRepositoryInterface,
+                 delegated_law_repository: DelegatedLawRepository):
+        self.law_repository = law_repository
+        self.delegated_law_repository = delegated_law_repository
+    
+    def execute(self, entries: Iterable[str], abbreviations: Optional[Dict[str, str]] = None,
+                workers: int = 4, include_delegated: bool = True,
+                on_progress: Optional[Callable[[PrefetchResult, int, int], None]] = None) -> List[PrefetchResult]:
+        """Prefetch every entry with a pool of worker threads.
+        
+        Args:
+            entries: MSTs or law names (abbreviations allowed)
+            abbreviations: Extra abbreviation mapping on top of SearchLawUseCase.ABBREVIATIONS
+            workers: Number of worker threads
+            include_delegated: Also fetch delegated law (위임법령) data
+            on_progress: Called with (result, completed count, total) as each entry finishes
+        
+        Returns:
+            List of PrefetchResult in completion order
+        """
+        entries = list(dict.fromkeys(e.strip() for e in entries if e and e.strip()))
+        mapping = dict(SearchLawUseCase.ABBREVIATIONS)
+        if abbreviations:
+            mapping.update(abbreviations)
+        
+        seen_msts = set()
+        seen_lock = threading.Lock()
+        
+        def claim(mst: str) -> bool:
+            with seen_lock:
+                if mst in seen_msts:
+                    return False
+                seen_msts.add(mst)
+                return True
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = [
+                executor.submit(self._prefetch_entry, entry, mapping, include_delegated, claim)
+                for entry in entries
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if on_progress:
+                    on_progress(result, len(results), len(entries))
+        
+        return results
+    
+    def _prefetch_entry(self, entry: str, mapping: Dict[str, str], include_delegated: bool,
+                        claim: Callable[[str], bool]) -> PrefetchResult:
+        """Resolve one entry to an MST and fetch everything for it."""
+        result = PrefetchResult(entry=entry)
+        try:
+            if entry.isdigit():
+                result.mst = entry
+            else:
+                query = mapping.get(entry, entry)
+                laws = self.law_repository.search_laws(query)
+                if not laws:
+                    result.error = f"No search results for {query}"
+                    return result
+                # Prefer the exact name match over the first search hit
+                law = next((l for l in laws if l.name == query), laws[0])
+                result.mst = law.mst
+                result.law_name = law.name
+            
+            if not claim(result.mst):
+                result.skipped = True
+                result.success = True
+                return result
+            
+            law_content = self.law_repository.get_law_content(result.mst)
+            if not law_content:
+                result.error = f"Failed to fetch law content for MST {result.mst}"
+                return result
+            result.law_name = result.law_name or law_content.law_name
+            
+            # Loading the content normally caches the full text too; only
+            # fetch it when that entry is missing (e.g. content from memory)
+            if not self.law_repository.has_cached_law_text(result.mst) \
+                    and self.law_repository.get_law_full_text(result.mst) is None:
+                result.error = f"Failed to fetch full text for MST {result.mst}"
+                return result
+            
+            if include_delegated and self.delegated_law_repository.get_delegated_laws(result.mst) is None:
+                result.error = f"Failed to fetch delegated laws for MST {result.mst}"
+                return result
+            
+            result.success = True
+        except Exception as e:
+            result.error = str(e)
+        
+        return result
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""Use case for keyword search across every cached law."""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from ..domain.interfaces.law_repository import LawRepositoryInterface
+from ..domain.entities.article import Article
+from ..domain.search.bm25 import BM25Ranker
+
+
+@dataclass
+class CorpusSearchHit:
+    """Article matching a corpus search."""
+    
+    article: Article
+    position: int  # Index in LawContent.articles
+    score: float
+
+
+@dataclass
+class CorpusSearchResult:
+    """Matching articles of one law, best first."""
+    
+    mst: str
+    law_name: str
+    hits: List[CorpusSearchHit] = field(default_factory=list)
+    
+    @property
+    def score(self) -> float:
+        """Total score of the law's hits."""
+        return sum(hit.score for hit in self.hits)
+
+
+class CorpusSearchUseCase:
+    """Use case for searching article text across all cached laws.
+    
+    The repository's corpus index narrows the search down to candidate
+    articles, so only laws with candidates are loaded; their text is then
+    checked for the actual substring. Matches are scored with BM25 against
+    each law's own n-gram index, the same ranking as the article menu, so
+    document frequencies and lengths are those of the law.
+    """
+    
+    def __init__(self, repository: LawRepositoryInterface):
+        self.repository = repository
+    
+    def execute(self, term: str, max_laws: Optional[int] = None) -> List[CorpusSearchResult]:
+        """Search every cached law for articles containing the term.
+        
+        Args:
+            term: Keyword (partial words allowed)
+            max_laws: Only return this many laws
+        
+        Returns:
+            Laws with matching articles, ranked by the total BM25 score
+            of their hits
+        """
+        term = term.strip()
+        if not term:
+            return []
+        
+        candidates: Optional[Dict[str, Optional[List[int]]]] = self.repository.find_article_candidates(term)
+        if candidates is None:
+            # Too short for the index, scan every cached law
+            candidates = {mst: None for mst in self.repository.get_cached_law_msts()}
+        
+        term_lower = term.lower()
+        results = []
+        for mst, positions in candidates.items():
+            law_content = self.repository.get_law_content(mst)
+            if law_content is None:
+                continue
+            
+            if positions is None:
+                positions = range(len(law_content.articles))
+            
+            articles = law_content.articles
+            matches = [
+                position for position in positions
+                if position < len(articles) and self._matches(articles[position], term_lower)
+            ]
+            if not matches:
+                continue
+            
+            ranker = BM25Ranker(law_content.get_search_index())
+            ranked = ranker.top_k(term, ((position, articles[position]) for position in matches),
+                                  len(matches), match_count=len(matches))
+            result = CorpusSearchResult(mst=mst, law_name=law_content.law_name)
+            result.hits = [
+                CorpusSearchHit(article=articles[position], position=position, score=score)
+                for score, position in ranked
+            ]
+            results.append(result)
+        
+        results.sort(key=lambda result: (-result.score, result.law_name))
+        return results[:max_laws] if max_laws else results
+    
+    @staticmethod
+    def _matches(article: Article, term_lower: str) -> bool:
+        """Whether the article's title or content contains the term."""
+        return (term_lower in (article.article_content or '').lower()
+                or term_lower in (article.article_title or '').lower())
\ No newline at end of file
@@ -7,6 +7,19 @@ from ..domain.interfaces.law_repository import LawRepositoryInterface
 class SearchLawUseCase:
     """Use case for searching laws."""
     
+    # Common abbreviation mappings
+    ABBREVIATIONS = {
+        '소득세': '소득세법',
+        '법인세': '법인세법',
+        '부가세': '부가가치세법',
+        '상증세': '상속세 및 증여세법',
+        '종부세': '종합부동산세법',
+        '상법': '상법',
+        '민법': '민법',
+        '노동법': '근로기준법',
+        '근로법': '근로기준법'
+    }
+    
     def __init__(self, repository: LawRepositoryInterface):
         self.repository = repository
     
@@ -24,18 +37,5 @@ class SearchLawUseCase:
     
     def search_with_abbreviation(self, query: str, display: int = 20) -> List[Law]:
         """Search with common abbreviation mapping."""
-        # Common abbreviation mappings
-        abbreviations = {
-            '소득세': '소득세법',
-            '법인세': '법인세법',
-            '부가세': '부가가치세법',
-            '상증세': '상속세 및 증여세법',
-            '종부세': '종합부동산세법',
-            '상법': '상법',
-            '민법': '민법',
-            '노동법': '근로기준법',
-            '근로법': '근로기준법'
-        }
-        
-        mapped_query = abbreviations.get(query, query)
+        mapped_query = self.ABBREVIATIONS.get(query, query)
         return self.execute(mapped_query, display)
\ No newline at end of file
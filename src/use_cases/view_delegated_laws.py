@@ -1,40 +1,29 @@
 """Use case for viewing delegated laws."""
-from typing import Dict, List, Optional
+import dataclasses
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from ..domain.interfaces.delegated_law_repository import DelegatedLawRepository
 from ..domain.interfaces.law_repository import LawRepositoryInterface
-from ..domain.entities.article import Article, LawContent
+from ..domain.entities.article import Article, LawContent, normalize_article_number
+from ..domain.entities.article_clause import format_clause_label, parse_clause_reference
 from ..domain.entities.delegated_law import DelegatedLawResponse, DelegatedLawItem
+from ..domain.entities.delegation_graph import DelegationGraph
+from ..domain.entities.law import Law
 
 
 class ViewDelegatedLawsUseCase:
     """Use case for viewing delegated laws."""
     
     def __init__(self, delegated_law_repository: DelegatedLawRepository, 
-                 law_repository: LawRepositoryInterface):
+                 law_repository: LawRepositoryInterface, max_workers: int = 4):
         self.delegated_law_repository = delegated_law_repository
         self.law_repository = law_repository
-    
-    def _normalize_article_number(self, article_number: str) -> str:
-        """Normalize article number to match between different formats.
-        
-        Handles conversions like:
-        - '1' -> '1'
-        - '1_2' -> '1_2' 
-        - '0001' -> '1'
-        - '0001_2' -> '1_2'
-        """
-        # Remove leading zeros
-        parts = article_number.split('_')
-        normalized_parts = []
-        for part in parts:
-            try:
-                # Convert to int to remove leading zeros, then back to string
-                normalized_parts.append(str(int(part)))
-            except ValueError:
-                # Keep as is if not a number
-                normalized_parts.append(part)
-        
-        return '_'.join(normalized_parts)
+        # Upper bound on delegated laws resolved at the same time
+        self.max_workers = max(1, max_workers)
+        # How delegated laws were resolved: by MST, by title search, or not at all
+        self.resolution_counts = {'mst': 0, 'search': 0, 'unresolved': 0}
+        self._counts_lock = threading.Lock()
     
     def get_delegated_laws_for_article(self, mst: str, article_number: str, law_content: LawContent) -> Dict:
         """Get delegated laws for a specific article.
@@ -43,13 +32,14 @@ class ViewDelegatedLawsUseCase:
             mst: Law master number
             article_number: Article number to check
             law_content: Full law content with articles
-            
+        
         Returns:
             Dictionary containing:
             - primary_article: The main article
             - has_delegated_references: Boolean indicating if article has delegated law references
             - delegated_references: List of references in the article
-            - delegated_content: List of delegated law content if found
+            - delegated_content: List of delegated law content if found, each
+              with the 'source_clause' of the article it was delegated from
         """
         # Find the article in law_content
         primary_article = None
@@ -57,28 +47,18 @@ class ViewDelegatedLawsUseCase:
         # First, try to find by formatted number if the article_number looks like one
         if article_number.startswith('제') and '조' in article_number:
             # This is a formatted number like "제1조의2"
-            for article in law_content.articles:
-                if article.formatted_number == article_number:
-                    primary_article = article
-                    break
+            primary_article = law_content.get_article_by_formatted_number(article_number)
         
-        # If not found, normalize the requested number
+        # If not found, try to find by the normalized number
         if not primary_article:
-            normalized_requested = self._normalize_article_number(article_number)
-            
-            # Try to find by normalized number
-            for article in law_content.articles:
-                article_normalized = article.normalized_number
-                if article_normalized == normalized_requested:
-                    primary_article = article
-                    break
+            primary_article = law_content.get_article_by_normalized_number(
+                normalize_article_number(article_number)
+            )
         
         # Last resort: raw article_number match
         if not primary_article:
-            for article in law_content.articles:
-                if article.article_number == article_number:
-                    primary_article = article
-                    break
+            matches = law_content.find_articles_by_number(article_number)
+            primary_article = matches[0] if matches else None
         
         if not primary_article:
             return {
@@ -109,21 +89,10 @@ class ViewDelegatedLawsUseCase:
             return result
         
         # Find relevant delegated laws for this article
-        # Use the article's normalized number for comparison
-        normalized_article_num = primary_article.normalized_number
-        
-        relevant_items = []
-        for item in delegated_response.all_delegated_items:
-            # Normalize the item's article number for comparison
-            item_normalized = self._normalize_article_number(item.article_number)
-            if item_normalized == normalized_article_num:
-                relevant_items.append(item)
+        relevant_items = delegated_response.get_items_for_article(primary_article.normalized_number)
         
         # Fetch content for each delegated law
-        for item in relevant_items:
-            delegated_content = self._fetch_delegated_law_content(item)
-            if delegated_content:
-                result['delegated_content'].append(delegated_content)
+        result['delegated_content'] = self._fetch_delegated_contents(relevant_items, primary_article)
         
         return result
     
@@ -132,7 +101,7 @@ class ViewDelegatedLawsUseCase:
         
         Args:
             law_content: Full law content
-            
+        
         Returns:
             List of articles that reference delegated laws
         """
@@ -144,20 +113,175 @@ class ViewDelegatedLawsUseCase:
         
         return articles_with_refs
     
+    def find_delegating_articles(self, mst: str, article_number: str, max_depth: int = 1) -> List[Dict]:
+        """Find the articles that delegate to an article, across all cached laws.
+        
+        E.g. the 소득세법 articles delegating to 소득세법 시행령 제X조. Uses the
+        delegation graph, so nothing is fetched or rescanned.
+        
+        Args:
+            mst: MST of the delegated law (시행령, 시행규칙, ...)
+            article_number: Article number in any format ('5', '0005', '제5조')
+            max_depth: 1 for direct delegators, more to walk further up the chain
+        
+        Returns:
+            Node info dicts (mst, article, law_name, law_type, article_title)
+            with their 'depth', nearest first
+        """
+        graph = self.delegated_law_repository.get_delegation_graph()
+        return self._describe_nodes(graph, graph.parents(DelegationGraph.node_id(mst, article_number), max_depth))
+    
+    def find_delegated_articles(self, mst: str, article_number: str, max_depth: int = 1) -> List[Dict]:
+        """Find the articles an article delegates to, across all cached laws.
+        
+        Args:
+            mst: MST of the delegating law
+            article_number: Article number in any format ('5', '0005', '제5조')
+            max_depth: 1 for direct delegations, more to follow 시행령 → 시행규칙 → 행정규칙
+        
+        Returns:
+            Node info dicts with their 'depth', nearest first
+        """
+        graph = self.delegated_law_repository.get_delegation_graph()
+        return self._describe_nodes(graph, graph.children(DelegationGraph.node_id(mst, article_number), max_depth))
+    
+    @staticmethod
+    def _describe_nodes(graph: DelegationGraph, nodes) -> List[Dict]:
+        """Attach the stored node info to (node id, depth) pairs."""
+        return [dict(graph.node_info(node) or {}, node=node, depth=depth) for node, depth in nodes]
+    
+    def resolve_delegated_laws(self, items: List[DelegatedLawItem]
+                               ) -> Dict[Tuple[str, ...], Tuple[Optional[Law], Optional[LawContent]]]:
+        """Resolve the delegated laws of several items concurrently.
+        
+        Items pointing at the same delegated law (e.g. several clauses
+        delegating to one 시행령) share a single search and law fetch.
+        
+        Args:
+            items: Delegated law items
+        
+        Returns:
+            (matching law, law content) by delegated law key; pass the result
+            to get_delegated_content to pick each item's articles
+        """
+        # One resolution per distinct delegated law, keyed like the lookup itself
+        first_items = {}
+        for item in items:
+            first_items.setdefault(self._delegated_law_key(item), item)
+        
+        if len(first_items) <= 1:
+            return {key: self._resolve_delegated_law(item) for key, item in first_items.items()}
+        
+        workers = min(self.max_workers, len(first_items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                key: executor.submit(self._resolve_delegated_law, item)
+                for key, item in first_items.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+    
+    def get_delegated_content(self, item: DelegatedLawItem, resolved: Dict) -> Optional[Dict]:
+        """Build an item's delegated content from resolve_delegated_laws() output.
+        
+        Returns:
+            Dictionary with law info and relevant articles, or None if the
+            delegated law could not be loaded
+        """
+        matching_law, law_content = resolved.get(self._delegated_law_key(item), (None, None))
+        if not law_content:
+            return None
+        return self._build_delegated_content(item, matching_law, law_content)
+    
+    def get_source_clause(self, article: Article, item: DelegatedLawItem) -> Optional[Dict]:
+        """The clause of the delegating article an item was made for.
+        
+        Args:
+            article: Article of the main law the item belongs to
+            item: Delegated law item; its clause_text (조항호목) names the clause
+        
+        Returns:
+            {'label', 'text'} with the normalized 조항호목 label and the sliced
+            clause text, or None if the item names no clause the article has
+        """
+        text = article.get_clause_text(item.clause_text)
+        if text is None:
+            return None
+        return {'label': format_clause_label(*parse_clause_reference(item.clause_text)), 'text': text}
+    
+    def _fetch_delegated_contents(self, items: List[DelegatedLawItem],
+                                  source_article: Optional[Article] = None) -> List[Dict]:
+        """Fetch the content of several delegated laws concurrently.
+        
+        Args:
+            items: Delegated law items
+            source_article: Delegating article, to attach each item's source clause
+        
+        Returns:
+            Delegated content dicts (see _fetch_delegated_law_content) in item order
+        """
+        resolved = self.resolve_delegated_laws(items)
+        contents = []
+        for item in items:
+            content = self.get_delegated_content(item, resolved)
+            if content:
+                if source_article is not None:
+                    content['source_clause'] = self.get_source_clause(source_article, item)
+                contents.append(content)
+        return contents
+    
+    def _delegated_law_key(self, item: DelegatedLawItem) -> Tuple[str, ...]:
+        """Items with the same key resolve to the same delegated law."""
+        if item.has_law_mst:
+            return 'mst', item.delegated_mst
+        return 'search', item.delegated_title, item.delegated_mst
+    
     def _fetch_delegated_law_content(self, item: DelegatedLawItem) -> Optional[Dict]:
         """Fetch the actual content of a delegated law.
         
         Args:
             item: Delegated law item
-            
+        
         Returns:
             Dictionary with law info and relevant articles
         """
+        matching_law, law_content = self._resolve_delegated_law(item)
+        if not law_content:
+            return None
+        return self._build_delegated_content(item, matching_law, law_content)
+    
+    def _resolve_delegated_law(self, item: DelegatedLawItem) -> Tuple[Optional[Law], Optional[LawContent]]:
+        """Find the delegated law and load its content.
+        
+        Laws are loaded by their MST; only items without a loadable MST
+        (행정규칙, 자치법규, or a missing 일련번호) fall back to a title search.
+        
+        Args:
+            item: Delegated law item
+        
+        Returns:
+            (matching law, law content), either of which may be None
+        """
+        if item.has_law_mst:
+            matching_law = self.law_repository.get_law_by_mst(item.delegated_mst)
+            if not matching_law:
+                self._count_resolution('unresolved')
+                return None, None
+            if not matching_law.law_type:
+                matching_law = dataclasses.replace(matching_law, law_type=item.delegated_type)
+            self._count_resolution('mst')
+            return matching_law, self.law_repository.get_law_content(item.delegated_mst)
+        
+        matching_law, law_content = self._search_delegated_law(item)
+        self._count_resolution('search' if law_content else 'unresolved')
+        return matching_law, law_content
+    
+    def _search_delegated_law(self, item: DelegatedLawItem) -> Tuple[Optional[Law], Optional[LawContent]]:
+        """Find the delegated law by title search (fallback for items without an MST)."""
         # Search for the delegated law
         search_results = self.law_repository.search_laws(item.delegated_title)
         
         if not search_results:
-            return None
+            return None, None
         
         # Find the exact match by MST if available
         matching_law = None
@@ -171,14 +295,23 @@ class ViewDelegatedLawsUseCase:
             matching_law = search_results[0]
         
         if not matching_law:
-            return None
+            return None, None
         
         # Get full content of the delegated law
-        law_content = self.law_repository.get_law_content(matching_law.mst)
-        
-        if not law_content:
-            return None
-        
+        return matching_law, self.law_repository.get_law_content(matching_law.mst)
+    
+    def _count_resolution(self, outcome: str) -> None:
+        with self._counts_lock:
+            self.resolution_counts[outcome] += 1
+    
+    def get_resolution_stats(self) -> Dict[str, int]:
+        """Get how often delegated laws were resolved by MST, by title search or not at all."""
+        with self._counts_lock:
+            return dict(self.resolution_counts)
+    
+    def _build_delegated_content(self, item: DelegatedLawItem, matching_law: Law,
+                                 law_content: LawContent) -> Dict:
+        """Pick the articles of the delegated law the item refers to."""
         # Find relevant articles based on the reference
         relevant_articles = []
         
@@ -194,5 +327,6 @@ class ViewDelegatedLawsUseCase:
         
         return {
             'law': matching_law,
-            'articles': relevant_articles
+            'articles': relevant_articles,
+            'resolved_by': 'mst' if item.has_law_mst else 'search'
         }
\ No newline at end of file
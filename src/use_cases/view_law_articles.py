@@ -2,6 +2,7 @@
 from typing import Optional
 from ..domain.interfaces.law_repository import LawRepositoryInterface
 from ..domain.entities.article import LawContent, Article
+from ..domain.search.bm25 import BM25Ranker
 
 
 class ViewLawArticlesUseCase:
@@ -14,19 +15,69 @@ class ViewLawArticlesUseCase:
         """Get complete law content with all articles."""
         return self.repository.get_law_content(mst)
     
+    def is_law_cached(self, mst: str) -> bool:
+        """Check whether get_law_content will be served from the cache."""
+        return self.repository.is_law_cached(mst)
+    
     def get_specific_article(self, mst: str, article_number: str) -> Optional[Article]:
         """Get a specific article by number."""
         return self.repository.get_law_article(mst, article_number)
     
     def search_articles(self, law_content: LawContent, search_term: str) -> list[Article]:
-        """Search articles by keyword."""
-        results = []
+        """Search articles by keyword.
+        
+        Uses the law's n-gram index to narrow the articles down to
+        candidates when available, then verifies the substring match.
+        """
+        return [law_content.articles[i] for i in self._find_matches(law_content, search_term)]
+    
+    def rank_articles(self, law_content: LawContent, search_term: str, limit: int = 20) -> list[Article]:
+        """Search articles by keyword, most relevant first.
+        
+        Matches are scored with BM25 over character n-grams, weighting
+        title matches above body matches, and only the best ``limit`` are
+        kept (with a heap, not a full sort).
+        """
+        return self.search_and_rank_articles(law_content, search_term, limit)[1]
+    
+    def search_and_rank_articles(self, law_content: LawContent, search_term: str,
+                                 limit: int = 20) -> tuple[list[Article], list[Article]]:
+        """Match the keyword once and return every match along with the ranked best ``limit``.
+        
+        Returns:
+            (matches in article order, as search_articles; top matches, as rank_articles)
+        """
+        matches = self._find_matches(law_content, search_term)
+        if not matches:
+            return [], []
+        
+        ranker = BM25Ranker(law_content.get_search_index())
+        ranked = ranker.top_k(
+            search_term,
+            ((i, law_content.articles[i]) for i in matches),
+            limit,
+            match_count=len(matches)
+        )
+        return [law_content.articles[i] for i in matches], [law_content.articles[i] for _, i in ranked]
+    
+    def _find_matches(self, law_content: LawContent, search_term: str) -> list[int]:
+        """Positions of the articles whose title or content contains the term."""
         search_term_lower = search_term.lower()
+        articles = law_content.articles
         
-        for article in law_content.articles:
+        positions = range(len(articles))
+        index = law_content.search_index
+        if index is not None and index.size == len(articles):
+            candidates = index.candidates(search_term)
+            if candidates is not None:
+                positions = candidates
+        
+        results = []
+        for i in positions:
+            article = articles[i]
             if (search_term_lower in article.article_content.lower() or 
                 (article.article_title and search_term_lower in article.article_title.lower())):
-                results.append(article)
+                results.append(i)
         
         return results
     
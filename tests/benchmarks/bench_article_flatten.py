@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark flattening of 조문단위 records (조문내용 + 항/호/목) into article text.
+
+Usage:
+    python tests/benchmarks/bench_article_flatten.py [recorded_response.json]
+
+Without an argument a synthetic 600-article 법령 response is used
+(sample_data.build_sample_law_response); pass a recorded response (e.g.
+output/.cache/law-text_{MST}.json in json format) for realistic numbers.
+
+Compares the previous flattener of Article.from_api_response (kept below
+for reference; it skipped 목) with flatten_article_record, text only and
+with the clause tree. The records are also timed with 목 removed, where
+both produce the same text. Last, ClauseOffsets are read back from every
+article's text, which Article does once, on the first clause lookup.
+"""
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.domain.entities.article import LawContent
+from src.domain.entities.article_clause import ClauseOffsets, flatten_article_record
+from sample_data import load_law_response
+
+
+def previous_flatten(data: dict) -> str:
+    """Article text as built by Article.from_api_response before flatten_article_record."""
+    content = data.get('조문내용', '')
+    if isinstance(content, list):
+        if content and isinstance(content[0], list):
+            content = '\n'.join(content[0])
+        else:
+            content = '\n'.join(content)
+    
+    if '항' in data and isinstance(data['항'], list):
+        paragraph_content = []
+        for para in data['항']:
+            if isinstance(para, dict):
+                para_text = para.get('항내용', '')
+                if para_text:
+                    paragraph_content.append(para_text)
+                
+                if '호' in para and isinstance(para['호'], list):
+                    for item in para['호']:
+                        if isinstance(item, dict):
+                            item_text = item.get('호내용', '')
+                            if isinstance(item_text, list):
+                                if item_text and isinstance(item_text[0], list):
+                                    item_text = '\n'.join(str(i) for sublist in item_text for i in sublist if i)
+                                else:
+                                    item_text = '\n'.join(str(i) for i in item_text if i)
+                            
+                            if item_text:
+                                paragraph_content.append(f"  {item_text}")
+        
+        if paragraph_content:
+            full_content = [content] if content else []
+            full_content.extend(paragraph_content)
+            content = '\n'.join(str(item) for item in full_content)
+    return content
+
+
+def without_subitems(records: list) -> list:
+    """Copy of the records with every 목 removed."""
+    records = copy.deepcopy(records)
+    for record in records:
+        paragraphs = record.get('항')
+        for paragraph in paragraphs if isinstance(paragraphs, list) else ():
+            items = paragraph.get('호') if isinstance(paragraph, dict) else None
+            for item in items if isinstance(items, list) else ():
+                if isinstance(item, dict):
+                    item.pop('목', None)
+    return records
+
+
+def best_of(func, records: list, repeat: int = 50) -> float:
+    """Return the fastest pass over all records in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for record in records:
+            func(record)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def count_clauses(records: list) -> dict:
+    counts = {'항': 0, '호': 0, '목': 0}
+    
+    def walk(clauses):
+        for clause in clauses:
+            counts[clause.level] += 1
+            walk(clause.children)
+    
+    for record in records:
+        walk(flatten_article_record(record)[1])
+    return counts
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    data = load_law_response(path)
+    law_info, records, _ = LawContent._split_api_response(data)
+    counts = count_clauses(records)
+    print(f"{law_info.get('법령명_한글', '')} ({'recorded' if path else 'synthetic'}): {len(records)} articles, "
+          f"{counts['항']} 항, {counts['호']} 호, {counts['목']} 목\n")
+    
+    plain = without_subitems(records)
+    same = all(previous_flatten(r) == flatten_article_record(r, build_tree=False)[0] for r in plain)
+    print(f"same text as the previous flattener without 목: {same}\n")
+    
+    print(f"{'flattener':<28} {'all (ms)':>10} {'no 목 (ms)':>12}")
+    for name, func in (
+        ('previous (skips 목)', previous_flatten),
+        ('single pass, text', lambda r: flatten_article_record(r, build_tree=False)),
+        ('single pass, text + tree', flatten_article_record),
+    ):
+        print(f"{name:<28} {best_of(func, records):>10.2f} {best_of(func, plain):>12.2f}")
+    
+    texts = [flatten_article_record(r, build_tree=False)[0] for r in records]
+    offsets_ms = best_of(ClauseOffsets.from_text, texts)
+    print(f"\nclause offsets of every article, from its text: {offsets_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark memory and access cost of the Article entity on a full law load.
+
+Usage:
+    python tests/benchmarks/bench_article_model.py [recorded_response.json]
+
+Without an argument a synthetic 600-article 법령 response is used; pass a
+recorded 소득세법 response (e.g. output/.cache/law-text_{MST}.json in json
+format) for realistic numbers.
+
+Memory compares the slotted Article with the same entity backed by an
+instance __dict__. Access time compares reading the derived fields
+(formatted/normalized number, delegation flags and types) through the
+memoized properties with recomputing them on every pass.
+"""
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.domain.entities.article import Article, LawContent
+from sample_data import load_law_response
+
+
+# Same fields as Article but stored in an instance __dict__ (the layout before slots)
+DictArticle = make_dataclass('DictArticle', [
+    (f.name, f.type, field(default=f.default, init=f.init)) if not f.init else (f.name, f.type)
+    for f in fields(Article)
+])
+
+
+def best_of(func, repeat: int = 5) -> float:
+    """Return the fastest of several runs in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def allocated_kb(build) -> float:
+    """Memory held by the objects returned from build() in KB."""
+    tracemalloc.start()
+    objects = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / 1024
+
+
+def read_derived(articles) -> None:
+    for article in articles:
+        article.formatted_number
+        article.normalized_number
+        article.has_delegated_law_references()
+        article.get_delegated_law_types()
+
+
+def recompute_derived(articles) -> None:
+    for article in articles:
+        article._formatted_number = article._normalized_number = None
+        article._has_delegation = article._delegation_types = None
+    read_derived(articles)
+
+
+def main():
+    data = load_law_response(sys.argv[1] if len(sys.argv) > 1 else None)
+    law_content = LawContent.from_api_response(data)
+    rows = [
+        (a.article_number, a.article_title, a.article_content, a.enforcement_date)
+        for a in law_content.articles
+    ]
+    print(f"{law_content.law_name}: {len(rows)} articles\n")
+    
+    # Article text is shared by both layouts, so only the entity overhead differs
+    slotted_kb = allocated_kb(lambda: [Article(*row) for row in rows])
+    dict_kb = allocated_kb(lambda: [DictArticle(*row) for row in rows])
+    print(f"{'layout':<10} {'memory (KB)':>12}")
+    print(f"{'__dict__':<10} {dict_kb:>12.1f}")
+    print(f"{'slots':<10} {slotted_kb:>12.1f}  ({slotted_kb / dict_kb:.0%})\n")
+    
+    parse_ms = best_of(lambda: LawContent.from_api_response(data))
+    articles = [Article(*row) for row in rows]
+    first_ms = best_of(lambda: read_derived([Article(*row) for row in rows]), repeat=3)
+    read_derived(articles)
+    memo_ms = best_of(lambda: read_derived(articles))
+    recompute_ms = best_of(lambda: recompute_derived(articles))
+    print(f"{'operation':<36} {'time (ms)':>10}")
+    print(f"{'parse response (incl. number index)':<36} {parse_ms:>10.1f}")
+    print(f"{'derived fields, first access':<36} {first_ms:>10.1f}")
+    print(f"{'derived fields, memoized':<36} {memo_ms:>10.1f}")
+    print(f"{'derived fields, recomputed':<36} {recompute_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Benchmark load time and disk footprint of each cache format.
+
+Usage:
+    python tests/benchmarks/bench_cache_formats.py [recorded_response.json]
+
+Without an argument a synthetic 600-article 법령 response is used. Its
+text is built from a small phrase list, so compression ratios on it are
+optimistic; pass a recorded response for realistic numbers. Sizes are
+relative to json-pretty, the original cache layout.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.data.cache.serializers import CacheSerializer
+from sample_data import load_law_response
+
+
+def best_of(func, repeat: int = 5) -> float:
+    """Return the fastest of several runs in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    data = load_law_response(sys.argv[1] if len(sys.argv) > 1 else None)
+    
+    print(f"{'format':<12} {'size (KB)':>10} {'ratio':>7} {'dump (ms)':>10} {'load (ms)':>10}")
+    baseline = len(CacheSerializer('json-pretty').dumps(data))
+    for fmt in CacheSerializer.FORMATS:
+        try:
+            serializer = CacheSerializer(fmt)
+        except ValueError as e:
+            print(f"{fmt:<12} skipped: {e}")
+            continue
+        
+        payload = serializer.dumps(data)
+        dump_ms = best_of(lambda: serializer.dumps(data))
+        load_ms = best_of(lambda: CacheSerializer.loads(payload))
+        assert CacheSerializer.loads(payload) == data
+        print(f"{fmt:<12} {len(payload) / 1024:>10.1f} {len(payload) / baseline:>7.2f} "
+              f"{dump_ms:>10.1f} {load_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""Realistic lawService.do responses for benchmarks."""
+import json
+import random
+from typing import Optional
+
+PHRASES = [
+    '거주자의 종합소득에 대한 소득세는', '해당 과세기간의 종합소득과세표준에', '다음 각 호의 세율을 적용하여',
+    '대통령령으로 정하는 바에 따라', '기획재정부령으로 정하는 서류를', '납세지 관할 세무서장에게 신고하여야 한다',
+    '사업자가 복식부기에 따라 장부를 기록ㆍ관리하는 경우에는', '감가상각비를 필요경비에 산입할 수 있다',
+    '제1항에도 불구하고', '다만, 다음 각 목의 어느 하나에 해당하는 경우에는 그러하지 아니하다',
+    '이 경우 세율은', '100분의 6으로 한다', '과세표준과 세액을 결정 또는 경정한다',
+]
+PARAGRAPH_NUMBERS = '①②③④⑤⑥⑦⑧⑨⑩'
+SUBITEM_NUMBERS = '가나다라마바사'
+
+
+def _sentence(rng: random.Random, words: int = 3) -> str:
+    return ' '.join(rng.choice(PHRASES) for _ in range(words)) + '.'
+
+
+def build_sample_law_response(num_articles: int = 600, seed: int = 42) -> dict:
+    """Build a synthetic response shaped like a large 법률 (e.g. 법인세법)."""
+    rng = random.Random(seed)
+    articles = []
+    for n in range(1, num_articles + 1):
+        if n % 40 == 1:
+            articles.append({
+                '조문번호': str(n),
+                '조문여부': '전문',
+                '조문내용': f'제{n // 40 + 1}장 총칙',
+                '조문시행일자': '20250101'
+            })
+        title = rng.choice(['정의', '세율', '과세표준', '납세지', '신고', '감가상각', '장부의 비치'])
+        paragraphs = []
+        for p in range(rng.randint(1, 5)):
+            paragraph = {
+                '항번호': PARAGRAPH_NUMBERS[p],
+                '항내용': f'{PARAGRAPH_NUMBERS[p]} {_sentence(rng)}'
+            }
+            if rng.random() < 0.5:
+                items = []
+                for i in range(1, rng.randint(2, 8)):
+                    item = {'호번호': f'{i}.', '호내용': f'{i}. {_sentence(rng, 2)}'}
+                    if rng.random() < 0.3:
+                        item['목'] = [
+                            {'목번호': f'{SUBITEM_NUMBERS[m]}.',
+                             '목내용': [[f'{SUBITEM_NUMBERS[m]}. {_sentence(rng, 1)}']]}
+                            for m in range(rng.randint(1, 4))
+                        ]
+                    items.append(item)
+                paragraph['호'] = items
+            paragraphs.append(paragraph)
+        articles.append({
+            '조문번호': str(n),
+            '조문여부': '조문',
+            '조문제목': title,
+            '조문내용': f'제{n}조({title})',
+            '조문시행일자': '20250101',
+            '항': paragraphs
+        })
+    
+    return {
+        '법령': {
+            '법령키': '2675812025010120000',
+            '기본정보': {
+                '법령명_한글': '소득세법',
+                '법령ID': '001565',
+                '공포일자': '20241231',
+                '시행일자': '20250101',
+                '소관부처': {'content': '기획재정부', '소관부처코드': '1051000'},
+                '법종구분': {'content': '법률'}
+            },
+            '조문': {'조문단위': articles}
+        }
+    }
+
+
+def load_law_response(path: Optional[str] = None) -> dict:
+    """Load a recorded response from a JSON file, or build a synthetic one."""
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return build_sample_law_response()
\ No newline at end of file